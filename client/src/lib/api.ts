@@ -11,3 +11,33 @@ export const api = axios.create({
 	// CRITICAL: Tells Axios to automatically include backend authorization cookies mapping to "set_cookie"
 	withCredentials: true,
 });
+
+export interface Job<T = any> {
+	id: string;
+	kind: string;
+	status: "queued" | "running" | "completed" | "failed";
+	progress: number;
+	message: string | null;
+	result: T | null;
+	error: string | null;
+}
+
+/**
+ * Poll a background job until it finishes. Resolves with the job result,
+ * rejects (axios-style, so callers can read `error.response.data.detail`) on failure.
+ */
+export async function waitForJob<T = any>(
+	jobId: string,
+	onProgress?: (job: Job<T>) => void,
+	intervalMs = 1000,
+): Promise<T> {
+	for (;;) {
+		const { data: job } = await api.get<Job<T>>(`/ml_model/jobs/${jobId}`);
+		onProgress?.(job);
+		if (job.status === "completed") return job.result as T;
+		if (job.status === "failed") {
+			throw { response: { data: { detail: job.error || "Job failed" } } };
+		}
+		await new Promise((resolve) => setTimeout(resolve, intervalMs));
+	}
+}
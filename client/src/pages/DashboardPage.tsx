@@ -60,8 +60,8 @@ interface Stats {
 	recent_datasets: {
 		id: string;
 		name: string;
-		rows: number;
-		columns: number;
+		rows: number | null;
+		columns: number | null;
 		version: string;
 		created_at: string;
 	}[];
@@ -581,7 +581,7 @@ export function DashboardPage() {
 									<div className="min-w-0">
 										<p className="text-sm font-medium truncate">{d.name}</p>
 										<p className="text-xs text-muted-foreground">
-											{d.rows.toLocaleString()} rows · {d.columns} cols
+											{d.rows?.toLocaleString() ?? "—"} rows · {d.columns ?? "—"} cols
 										</p>
 									</div>
 									<Badge
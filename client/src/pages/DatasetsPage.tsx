@@ -87,6 +87,7 @@ interface DatasetMeta {
 	missing_percentage?: Record<string, number>;
 	statistics?: Record<string, Record<string, number>>;
 	preview?: Record<string, unknown>[];
+	materialized?: boolean; // false until a lazy recipe version is first opened
 }
 
 interface Dataset {
@@ -94,8 +95,8 @@ interface Dataset {
 	name: string;
 	version: string;
 	description: string;
-	rows: number;
-	columns: number;
+	rows: number | null; // null until a lazy recipe version is materialized
+	columns: number | null;
 	created_at: string;
 	parent_id: string | null;
 	dataset_metadata: DatasetMeta;
@@ -648,12 +649,12 @@ export function DatasetsPage() {
 									<div className="rounded-lg bg-muted/50 p-2 text-center">
 										<p className="text-xs text-muted-foreground">Rows</p>
 										<p className="text-lg font-bold">
-											{ds.rows.toLocaleString()}
+											{ds.rows?.toLocaleString() ?? "—"}
 										</p>
 									</div>
 									<div className="rounded-lg bg-muted/50 p-2 text-center">
 										<p className="text-xs text-muted-foreground">Columns</p>
-										<p className="text-lg font-bold">{ds.columns}</p>
+										<p className="text-lg font-bold">{ds.columns ?? "—"}</p>
 									</div>
 								</div>
 								{/* Data quality indicator */}
@@ -872,7 +873,7 @@ export function DatasetsPage() {
 												</div>
 												<p className="text-sm font-medium">{v.name}</p>
 												<p className="text-xs text-muted-foreground">
-													{v.rows.toLocaleString()} rows · {v.columns} cols ·{" "}
+													{v.rows?.toLocaleString() ?? "—"} rows · {v.columns ?? "—"} cols ·{" "}
 													{v.file?.file_type?.toUpperCase() ?? "—"}
 												</p>
 											</div>
@@ -909,9 +910,9 @@ export function DatasetsPage() {
 									{
 										icon: BarChart3,
 										label: "Rows",
-										value: explorerDs.rows.toLocaleString(),
+										value: explorerDs.rows?.toLocaleString() ?? "—",
 									},
-									{ icon: Filter, label: "Columns", value: explorerDs.columns },
+									{ icon: Filter, label: "Columns", value: explorerDs.columns ?? "—" },
 									{
 										icon: Sigma,
 										label: "File type",
@@ -1074,9 +1075,9 @@ export function DatasetsPage() {
 														},
 														{
 															label: "Total rows",
-															value: explorerDs.rows.toLocaleString(),
+															value: explorerDs.rows?.toLocaleString() ?? "—",
 														},
-														{ label: "Total cols", value: explorerDs.columns },
+														{ label: "Total cols", value: explorerDs.columns ?? "—" },
 													].map(({ label, value }) => (
 														<div
 															key={label}
@@ -70,7 +70,7 @@ import {
 	CheckCircle2,
 	Pencil,
 } from "lucide-react";
-import { api } from "@/lib/api";
+import { api, waitForJob } from "@/lib/api";
 import { toast } from "sonner";
 
 // ── Types ──────────────────────────────────────────────────────────────────
@@ -79,6 +79,12 @@ interface Dataset {
 	name: string;
 }
 
+interface InputColumn {
+	name: string;
+	dtype: string | null; // integer | float | boolean | category | string
+	categories: (string | number)[] | null;
+}
+
 interface MLModel {
 	id: string;
 	name: string;
@@ -87,7 +93,7 @@ interface MLModel {
 	accuracy: number;
 	error: number;
 	description: string;
-	inputs: string; // stored as Python list repr e.g. "['col1','col2']"
+	inputs: InputColumn[] | string; // input schema; older servers sent a list repr string
 	outputs: string; // target column name
 	parent_id: string | null;
 	created_at?: string;
@@ -113,6 +119,15 @@ const CLASSIFIER_ALGOS = [
 	{ value: "gradient_boosting", label: "Gradient Boosting Classifier" },
 	{ value: "knn", label: "K-Nearest Neighbors" },
 	{ value: "naive_bayes", label: "Naive Bayes (Gaussian)" },
+	{ value: "multinomial_nb", label: "Naive Bayes (Multinomial)" },
+	{ value: "sgd_classifier", label: "SGD Classifier" },
+	{ value: "passive_aggressive", label: "Passive Aggressive Classifier" },
+	{
+		value: "hist_gradient_boosting",
+		label: "Histogram Gradient Boosting Classifier",
+	},
+	{ value: "extra_trees", label: "Extra Trees Classifier" },
+	{ value: "linear_svc", label: "Linear SVC" },
 ];
 
 const REGRESSOR_ALGOS = [
@@ -126,6 +141,17 @@ const REGRESSOR_ALGOS = [
 		value: "gradient_boosting_regressor",
 		label: "Gradient Boosting Regressor",
 	},
+	{ value: "sgd_regressor", label: "SGD Regressor" },
+	{
+		value: "passive_aggressive_regressor",
+		label: "Passive Aggressive Regressor",
+	},
+	{
+		value: "hist_gradient_boosting_regressor",
+		label: "Histogram Gradient Boosting Regressor",
+	},
+	{ value: "extra_trees_regressor", label: "Extra Trees Regressor" },
+	{ value: "linear_svr", label: "Linear SVR" },
 ];
 
 const EMPTY_FORM = {
@@ -336,9 +362,10 @@ function PredictInputs({
 	);
 }
 
-/** Parse the server's stored inputs string (Python list repr or JSON) into a string array. */
-function parseInputCols(inputs: string | undefined | null): string[] {
+/** Feature names from the server's input schema (or an older list repr / JSON string). */
+function parseInputCols(inputs: InputColumn[] | string | undefined | null): string[] {
 	if (!inputs) return [];
+	if (Array.isArray(inputs)) return inputs.map((col) => col.name);
 	try {
 		const parsed = JSON.parse(inputs);
 		if (Array.isArray(parsed)) return parsed.map(String);
@@ -721,10 +748,11 @@ export function ModelsPage() {
 		}
 		try {
 			setIsTraining(true);
-			await api.post(
+			const { data: job } = await api.post(
 				"/ml_model/train",
 				buildPayload(trainForm, trainHyperparams, trainSchemas),
 			);
+			await waitForJob(job.id);
 			toast.success("Model trained successfully!");
 			setIsTrainOpen(false);
 			setTrainForm(EMPTY_FORM);
@@ -749,10 +777,11 @@ export function ModelsPage() {
 		}
 		try {
 			setIsRetraining(true);
-			await api.post(
+			const { data: job } = await api.post(
 				`/ml_model/${retrainModel.id}/retrain`,
 				buildPayload(retrainForm, retrainHyperparams, retrainSchemas),
 			);
+			await waitForJob(job.id);
 			toast.success("Model retrained — new version created!");
 			setRetrainModel(null);
 			setRetrainForm(EMPTY_FORM);
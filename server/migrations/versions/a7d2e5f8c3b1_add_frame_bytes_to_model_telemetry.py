@@ -0,0 +1,33 @@
+"""add frame bytes to model telemetry
+
+Revision ID: a7d2e5f8c3b1
+Revises: f4c1a8e7b2d5
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d2e5f8c3b1"
+down_revision: Union[str, Sequence[str], None] = "f4c1a8e7b2d5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Record the training frame's memory before and after preparation."""
+    op.add_column(
+        "model_telemetry", sa.Column("frame_bytes_before", sa.BigInteger(), nullable=True)
+    )
+    op.add_column("model_telemetry", sa.Column("frame_bytes_after", sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove the frame memory columns."""
+    op.drop_column("model_telemetry", "frame_bytes_after")
+    op.drop_column("model_telemetry", "frame_bytes_before")
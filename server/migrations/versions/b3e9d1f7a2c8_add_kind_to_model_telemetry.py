@@ -0,0 +1,32 @@
+"""record the kind of training run in model telemetry
+
+Revision ID: b3e9d1f7a2c8
+Revises: f1a7c3e9d5b2
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e9d1f7a2c8"
+down_revision: Union[str, Sequence[str], None] = "f1a7c3e9d5b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the run kind; existing rows are single training runs."""
+    op.add_column(
+        "model_telemetry",
+        sa.Column("kind", sa.String(), nullable=False, server_default="train"),
+    )
+
+
+def downgrade() -> None:
+    """Remove the run kind."""
+    op.drop_column("model_telemetry", "kind")
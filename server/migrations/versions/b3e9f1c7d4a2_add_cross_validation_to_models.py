@@ -0,0 +1,31 @@
+"""add cross-validation results to models
+
+Revision ID: b3e9f1c7d4a2
+Revises: a7d2e5f8c3b1
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e9f1c7d4a2"
+down_revision: Union[str, Sequence[str], None] = "a7d2e5f8c3b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Record the fold count and score spread of cross-validated models."""
+    op.add_column("models", sa.Column("cv_folds", sa.Integer(), nullable=True))
+    op.add_column("models", sa.Column("accuracy_std", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove the cross-validation columns."""
+    op.drop_column("models", "accuracy_std")
+    op.drop_column("models", "cv_folds")
@@ -0,0 +1,40 @@
+"""add recipe to datasets
+
+Revision ID: c5d2e8f1a9b3
+Revises: b7e4c91d2a3f
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d2e8f1a9b3"
+down_revision: Union[str, Sequence[str], None] = "b7e4c91d2a3f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add the recipe column for lazily materialized dataset versions, whose rows and
+    columns stay null until they are first opened.
+    """
+    op.add_column("datasets", sa.Column("recipe", sa.JSON(), nullable=True))
+    with op.batch_alter_table("datasets") as batch_op:
+        batch_op.alter_column("rows", existing_type=sa.Integer(), nullable=True)
+        batch_op.alter_column("columns", existing_type=sa.Integer(), nullable=True)
+
+
+def downgrade() -> None:
+    """Remove the recipe column and restore NOT NULL rows / columns (unknown ones get 0)."""
+    op.execute("UPDATE datasets SET rows = 0 WHERE rows IS NULL")
+    op.execute("UPDATE datasets SET columns = 0 WHERE columns IS NULL")
+    with op.batch_alter_table("datasets") as batch_op:
+        batch_op.alter_column("rows", existing_type=sa.Integer(), nullable=False)
+        batch_op.alter_column("columns", existing_type=sa.Integer(), nullable=False)
+    op.drop_column("datasets", "recipe")
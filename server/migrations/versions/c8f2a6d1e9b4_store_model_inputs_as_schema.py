@@ -0,0 +1,52 @@
+"""store model inputs as a JSON schema
+
+Revision ID: c8f2a6d1e9b4
+Revises: b3e9f1c7d4a2
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+
+import ast
+import json
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c8f2a6d1e9b4"
+down_revision: Union[str, Sequence[str], None] = "b3e9f1c7d4a2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+models = sa.table("models", sa.column("id", sa.Uuid()), sa.column("inputs", sa.JSON()))
+
+
+def _names(inputs) -> list[str]:
+    if isinstance(inputs, str):
+        try:
+            inputs = json.loads(inputs)
+        except json.JSONDecodeError:
+            inputs = ast.literal_eval(inputs)
+    return [c["name"] if isinstance(c, dict) else str(c) for c in inputs]
+
+
+def _rewrite(convert) -> None:
+    conn = op.get_bind()
+    for model_id, inputs in conn.execute(sa.select(models.c.id, models.c.inputs)).all():
+        try:
+            names = _names(inputs)
+        except (ValueError, SyntaxError, TypeError, KeyError):
+            continue  # left as is; reported when the model is used
+        conn.execute(models.update().where(models.c.id == model_id).values(inputs=convert(names)))
+
+
+def upgrade() -> None:
+    """Turn the stored feature-list strings into input schemas (dtypes unknown)."""
+    _rewrite(lambda names: [{"name": n, "dtype": None, "categories": None} for n in names])
+
+
+def downgrade() -> None:
+    """Store the feature names as a Python list repr again."""
+    _rewrite(lambda names: str(names))
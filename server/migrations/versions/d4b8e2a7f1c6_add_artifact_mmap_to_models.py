@@ -0,0 +1,32 @@
+"""add artifact_mmap to models
+
+Revision ID: d4b8e2a7f1c6
+Revises: c8f2a6d1e9b4
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4b8e2a7f1c6"
+down_revision: Union[str, Sequence[str], None] = "c8f2a6d1e9b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Record which model artifacts predict may memory-map; existing ones load as before."""
+    op.add_column(
+        "models",
+        sa.Column("artifact_mmap", sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+
+
+def downgrade() -> None:
+    """Remove the artifact_mmap column."""
+    op.drop_column("models", "artifact_mmap")
@@ -0,0 +1,29 @@
+"""add cpu_cores to models
+
+Revision ID: d8a3f6b2c1e4
+Revises: c5d2e8f1a9b3
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d8a3f6b2c1e4"
+down_revision: Union[str, Sequence[str], None] = "c5d2e8f1a9b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Record the CPU cores each model was trained with."""
+    op.add_column("models", sa.Column("cpu_cores", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove the cpu_cores column."""
+    op.drop_column("models", "cpu_cores")
@@ -0,0 +1,52 @@
+"""add model telemetry table
+
+Revision ID: e2b7c4d9f0a6
+Revises: d8a3f6b2c1e4
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b7c4d9f0a6"
+down_revision: Union[str, Sequence[str], None] = "d8a3f6b2c1e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the table of per-model training telemetry."""
+    op.create_table(
+        "model_telemetry",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("model_id", sa.Uuid(), nullable=False),
+        sa.Column("load_seconds", sa.Float(), nullable=False),
+        sa.Column("split_seconds", sa.Float(), nullable=False),
+        sa.Column("fit_seconds", sa.Float(), nullable=False),
+        sa.Column("score_seconds", sa.Float(), nullable=False),
+        sa.Column("save_seconds", sa.Float(), nullable=False),
+        sa.Column("total_seconds", sa.Float(), nullable=False),
+        sa.Column("cpu_seconds", sa.Float(), nullable=False),
+        sa.Column("peak_rss_bytes", sa.BigInteger(), nullable=True),
+        sa.Column("rows", sa.Integer(), nullable=True),
+        sa.Column("columns", sa.Integer(), nullable=True),
+        sa.Column("artifact_bytes", sa.BigInteger(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["model_id"],
+            ["models.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_model_telemetry_model_id", "model_telemetry", ["model_id"], unique=True)
+
+
+def downgrade() -> None:
+    """Drop the model telemetry table."""
+    op.drop_index("ix_model_telemetry_model_id", table_name="model_telemetry")
+    op.drop_table("model_telemetry")
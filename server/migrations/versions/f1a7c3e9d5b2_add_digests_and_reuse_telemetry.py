@@ -0,0 +1,38 @@
+"""store file digests and record model reuse in telemetry
+
+Revision ID: f1a7c3e9d5b2
+Revises: d4b8e2a7f1c6
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f1a7c3e9d5b2"
+down_revision: Union[str, Sequence[str], None] = "d4b8e2a7f1c6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the stored content digest of files and the reuse columns of model telemetry."""
+    op.add_column("files", sa.Column("digest", sa.String(), nullable=True))
+    op.add_column("files", sa.Column("digest_signature", sa.String(), nullable=True))
+    op.add_column(
+        "model_telemetry",
+        sa.Column("reuse_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("model_telemetry", sa.Column("reused_from_id", sa.Uuid(), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove the digest and reuse columns."""
+    op.drop_column("model_telemetry", "reused_from_id")
+    op.drop_column("model_telemetry", "reuse_count")
+    op.drop_column("files", "digest_signature")
+    op.drop_column("files", "digest")
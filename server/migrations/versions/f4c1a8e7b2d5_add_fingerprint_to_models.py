@@ -0,0 +1,31 @@
+"""add fingerprint to models
+
+Revision ID: f4c1a8e7b2d5
+Revises: e2b7c4d9f0a6
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f4c1a8e7b2d5"
+down_revision: Union[str, Sequence[str], None] = "e2b7c4d9f0a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the training fingerprint used to reuse identical models."""
+    op.add_column("models", sa.Column("fingerprint", sa.String(), nullable=True))
+    op.create_index("ix_models_fingerprint", "models", ["fingerprint"])
+
+
+def downgrade() -> None:
+    """Remove the training fingerprint."""
+    op.drop_index("ix_models_fingerprint", table_name="models")
+    op.drop_column("models", "fingerprint")
@@ -0,0 +1,128 @@
+"""
+Memory held by N worker processes serving the same model, loaded privately vs mapped.
+
+Trains a few model types on synthetic data, saves each with ``save_artifact`` (the
+``mapped`` column is its verdict, stored as ``MLModel.artifact_mmap``) and starts
+``--workers`` processes that load it (``load_artifact``) and predict once — as uvicorn
+workers do on their first request. While all of them are alive each reports how much
+its memory grew, read from ``/proc/self/smaps_rollup`` (Linux only):
+
+- RSS: resident pages, shared or not. Mapped artifact pages count in full in every
+  worker, so RSS alone barely moves;
+- PSS: resident pages with shared ones divided among the processes sharing them — the
+  sum over workers is what the workers really cost;
+- USS: pages private to the worker, freed when it exits.
+
+Run from the server directory::
+
+    python -m scripts.benchmarks.model_memory --workers 4 --rows 200000
+"""
+
+import argparse
+import multiprocessing as mp
+import os
+import tempfile
+
+import numpy as np
+
+from src.modules.ml_model.utils.artifacts import load_artifact, save_artifact
+
+
+def _memory() -> dict[str, int]:
+    fields = {"Rss": "rss", "Pss": "pss", "Private_Clean": "uss", "Private_Dirty": "uss"}
+    usage = {"rss": 0, "pss": 0, "uss": 0}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in fields:
+                usage[fields[key]] += int(rest.split()[0]) * 1024
+    return usage
+
+
+def _worker(path: str, mmap: bool, X: np.ndarray, loaded, measured, results) -> None:
+    # Count the model, not the first import of scikit-learn
+    import sklearn.ensemble  # noqa: F401
+    import sklearn.neighbors  # noqa: F401
+    import sklearn.svm  # noqa: F401
+
+    before = _memory()
+    model = load_artifact(path, mmap=mmap)
+    model.predict(X)
+    loaded.wait()  # everyone maps the file before anyone measures
+    after = _memory()
+    results.put({k: after[k] - before[k] for k in after})
+    measured.wait()
+
+
+def _run(path: str, mmap: bool, X: np.ndarray, workers: int) -> dict[str, int]:
+    ctx = mp.get_context("spawn")
+    loaded, measured = ctx.Barrier(workers), ctx.Barrier(workers)
+    results = ctx.Queue()
+    procs = [
+        ctx.Process(target=_worker, args=(path, mmap, X, loaded, measured, results))
+        for _ in range(workers)
+    ]
+    for p in procs:
+        p.start()
+    deltas = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+    return {k: sum(d[k] for d in deltas) for k in deltas[0]}
+
+
+def _models(rows: int, seed: int):
+    from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+    from sklearn.neighbors import KNeighborsClassifier
+    from sklearn.svm import SVC
+
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(rows, 20))
+    y = (X[:, :3].sum(axis=1) + rng.normal(scale=2.0, size=rows) > 0).astype(int)
+    small = min(rows, 20_000)  # SVC fits in O(n²)
+    yield "k_nearest_neighbors", KNeighborsClassifier().fit(X, y), X[:200]
+    yield "svc", SVC().fit(X[:small], y[:small]), X[:200]
+    yield (
+        "hist_gradient_boosting",
+        HistGradientBoostingClassifier(
+            max_iter=500, max_leaf_nodes=127, early_stopping=False, random_state=seed
+        ).fit(X, y),
+        X[:200],
+    )
+    yield (
+        "random_forest",
+        RandomForestClassifier(n_estimators=50, random_state=seed, n_jobs=-1).fit(X, y),
+        X[:200],
+    )
+
+
+def _mb(n: int) -> str:
+    return f"{n / 2**20:9.1f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{args.workers} workers; memory added by loading the model, summed over workers (MB)")
+    print(f"{'model':<24}{'artifact':>9}{'mapped':>7} {'mode':<8}{'RSS':>9}{'PSS':>9}{'USS':>9}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, model, X in _models(args.rows, args.seed):
+            path = os.path.join(workdir, f"{name}.joblib")
+            verdict = f"{'yes' if save_artifact(model, path) else 'no':>7}"
+            del model
+            size = _mb(os.path.getsize(path))
+            for mmap in (False, True):
+                total = _run(path, mmap, X, args.workers)
+                mode = "mmap" if mmap else "private"
+                print(
+                    f"{name:<24}{size}{verdict} {mode:<8}"
+                    f"{_mb(total['rss'])}{_mb(total['pss'])}{_mb(total['uss'])}"
+                )
+                size, verdict = " " * 9, " " * 7
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Memory allocated by ``prepare_training_frame`` and ``split_frame`` on a synthetic dataset.
+
+Builds a frame of ``--rows`` rows — ten float64 features, a small-range integer feature
+and a binary label — and, with and without ``float32`` and with and without NaNs to
+drop, reports for each step (read with ``tracemalloc``, which NumPy reports to):
+
+- held: memory the step allocated that is still alive when it returns — what the
+  training job keeps on top of the raw dataset;
+- peak: the most it allocated at once while running.
+
+Run from the server directory::
+
+    python -m scripts.benchmarks.training_frame --rows 1000000
+"""
+
+import argparse
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.modules.ml_model.utils.frames import memory_bytes, prepare_training_frame, split_frame
+
+
+def _dataset(rows: int, seed: int, missing: bool) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    columns = {f"f{i}": rng.normal(size=rows) for i in range(10)}
+    columns["small_int"] = rng.integers(0, 100, rows)
+    columns["label"] = rng.integers(0, 2, rows)
+    if missing:
+        columns["f0"][rng.random(rows) < 0.01] = np.nan
+    return pd.DataFrame(columns).copy()  # one block, as read_csv gives
+
+
+def _measure(step: Callable[[], Any]) -> tuple[Any, int, int]:
+    tracemalloc.start()
+    try:
+        result = step()
+        held, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, held, peak
+
+
+def _mb(n: int) -> str:
+    return f"{n / 2**20:9.1f}"
+
+
+def _case(df: pd.DataFrame, float32: bool) -> list[int]:
+    features = [c for c in df.columns if c != "label"]
+    (X, y, _), held, peak = _measure(
+        lambda: prepare_training_frame(df, features, "label", float32=float32)
+    )
+    _, split_held, split_peak = _measure(lambda: split_frame(X, y))
+    return [memory_bytes(df), memory_bytes(X, y), held, peak, split_held, split_peak]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    import sklearn.model_selection  # noqa: F401 — count the split, not its first import
+
+    print("memory allocated per step (MB)")
+    print(f"{'case':<20}{'raw':>9}{'X + y':>9}{'held':>9}{'peak':>9}{'split':>9}{'peak':>9}")
+    for missing in (False, True):
+        df = _dataset(args.rows, args.seed, missing)
+        for float32 in (False, True):
+            case = f"{'nan' if missing else 'complete'}, {'f32' if float32 else 'f64'}"
+            print(f"{case:<20}" + "".join(_mb(n) for n in _case(df, float32)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Thread-safe LRU cache bounded by entry count and by bytes, for values loaded from files.
+
+Each entry remembers the signature of its source (the file's mtime and size), and a
+lookup with a different signature misses, so a file that changes on disk is reloaded
+even if nobody invalidated it. Concurrent misses for one key wait for a single loader;
+the lock they share exists only while some thread is loading or waiting on that key.
+
+Subclasses choose the key and signature, and may override ``_find`` to answer a key
+from other entries (the DataFrame cache cuts column projections from whole frames).
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+Signature = tuple[int, int]
+
+
+class _Entry:
+    __slots__ = ("value", "signature", "nbytes")
+
+    def __init__(self, value: Any, signature: Signature, nbytes: int):
+        self.value = value
+        self.signature = signature
+        self.nbytes = nbytes
+
+
+class _Loading:
+    __slots__ = ("lock", "users")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.users = 0
+
+
+class BoundedLRUCache:
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._loading: dict[Hashable, _Loading] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def load(
+        self,
+        key: Hashable,
+        signature: Signature,
+        loader: Callable[[], Any],
+        sizeof: Callable[[Any], int],
+    ) -> Any:
+        """The value cached under ``key`` for ``signature``, calling ``loader()`` on a miss."""
+        value = self._lookup(key, signature, count=True)
+        if value is not None:
+            return value
+
+        with self._lock:
+            loading = self._loading.get(key)
+            if loading is None:
+                loading = self._loading[key] = _Loading()
+            loading.users += 1
+        try:
+            with loading.lock:
+                value = self._lookup(key, signature, count=False)
+                if value is None:
+                    value = loader()
+                    self._store(key, _Entry(value, signature, sizeof(value)))
+        finally:
+            with self._lock:
+                loading.users -= 1
+                if not loading.users:
+                    del self._loading[key]
+        return value
+
+    def discard(self, match: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key satisfies ``match``."""
+        with self._lock:
+            for key in [k for k in self._entries if match(k)]:
+                self._bytes -= self._entries.pop(key).nbytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def _find(self, key: Hashable, signature: Signature) -> Any:
+        """The fresh value for ``key``, or None. Called with the cache lock held."""
+        entry = self._entries.get(key)
+        if entry is None or entry.signature != signature:
+            return None
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def _lookup(self, key: Hashable, signature: Signature, count: bool) -> Any:
+        with self._lock:
+            value = self._find(key, signature)
+            if count:
+                if value is not None:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+            return value
+
+    def _store(self, key: Hashable, entry: _Entry) -> None:
+        if self.max_entries <= 0 or entry.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            stale = self._entries.pop(key, None)
+            if stale is not None:
+                self._bytes -= stale.nbytes
+            self._entries[key] = entry
+            self._bytes += entry.nbytes
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self.evictions += 1
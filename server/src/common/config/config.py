@@ -19,6 +19,35 @@ class Settings(BaseSettings):
     # Password Hashing Settings
     BCRYPT_ROUNDS: int = 12  # Default: 12 (good balance of security/speed)
 
+    # Loaded dataset frames kept in memory across dataset/training operations (per process)
+    DATAFRAME_CACHE_MAX_ENTRIES: int = 16
+    DATAFRAME_CACHE_MAX_MB: int = 1024
+
+    # Memory ceiling for one chunk while profiling a dataset
+    PROFILER_MAX_MEMORY_MB: int = 256
+
+    # Background jobs (training etc.) run in this many worker processes
+    JOB_WORKERS: int = 2
+    # Cores shared out between running jobs (0 = all cores available to the process)
+    JOB_CPU_CORES: int = 0
+
+    # Memory ceiling for one chunk in streaming (partial_fit) training
+    STREAM_CHUNK_MB: int = 128
+
+    # Parallel trials per hyperparameter search (-1 = all cores)
+    SEARCH_N_JOBS: int = -1
+
+    # Loaded models kept in memory for predict (per process)
+    MODEL_CACHE_MAX_ENTRIES: int = 8
+    MODEL_CACHE_MAX_MB: int = 1024
+
+    # Upper bound on rows accepted by one batch predict call
+    PREDICT_BATCH_MAX_ROWS: int = 100_000
+
+    # Micro-batching of concurrent single-row predicts per model (0 ms = off)
+    PREDICT_COALESCE_MS: float = 0.0
+    PREDICT_COALESCE_MAX_ROWS: int = 64
+
     class Config:
         env_file = ".env"
 
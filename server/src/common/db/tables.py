@@ -3,3 +3,5 @@ class Tables:
     MODELS = "models"
     FILES = "files"
     DATASETS = "datasets"
+    JOBS = "jobs"
+    MODEL_TELEMETRY = "model_telemetry"
@@ -12,10 +12,13 @@ from loguru import logger
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
+from src.common.db.session import SessionLocal
 from src.common.logging.logger import log_execution, setup_logging
 from src.modules.auth.router import router as auth_router
 from src.modules.dataset.router import router as dataset_router
 from src.modules.file.router import router as file_router
+from src.modules.job import JobService
+from src.modules.job.executor import shutdown_executor
 from src.modules.ml_model.router import router as ml_model_router
 from src.modules.stats.router import router as stats_router
 from src.modules.user.router import router as user_router
@@ -30,7 +33,16 @@ STATIC_DIR = Path(__file__).parent.parent / "static"
 async def lifespan(app: FastAPI):
     alembic_cfg = Config("alembic.ini")
     command.upgrade(alembic_cfg, "head")
+
+    # Jobs left queued/running by a previous server process can never finish
+    db = SessionLocal()
+    try:
+        JobService().fail_orphaned_jobs(db=db)
+    finally:
+        db.close()
+
     yield
+    shutdown_executor()
 
 
 app = FastAPI(redirect_slashes=True, lifespan=lifespan)
@@ -41,6 +41,17 @@ def create_dataset(
     return dataset_service.create_dataset(db=db, data=data, user_id=token_payload.id)
 
 
+@router.get("/dataset/cache/stats")
+def get_dataset_cache_stats(
+    request: Request,
+    token_payload: AuthToken = Depends(
+        dataset_service.auth_service.security_service.verify_auth_token
+    ),
+):
+    """Hit/miss counters of the in-memory DataFrame cache."""
+    return dataset_service.get_cache_stats()
+
+
 @router.get("/dataset/{dataset_id}")
 def get_dataset(
     request: Request,
@@ -50,7 +61,7 @@ def get_dataset(
         dataset_service.auth_service.security_service.verify_auth_token
     ),
 ):
-    return dataset_service.get_dataset(db=db, dataset_id=dataset_id)
+    return dataset_service.get_dataset(db=db, dataset_id=dataset_id, materialize=True)
 
 
 @router.get("/datasets")
@@ -149,3 +160,33 @@ def get_dataset_versions(
     return dataset_service.get_dataset_versions(
         db=db, dataset_id=dataset_id, user_id=token_payload.id
     )
+
+
+@router.get("/dataset/{dataset_id}/columns")
+def get_dataset_columns(
+    request: Request,
+    dataset_id: UUID,
+    db: Session = Depends(get_db),
+    token_payload: AuthToken = Depends(
+        dataset_service.auth_service.security_service.verify_auth_token
+    ),
+):
+    """Column names, without parsing the dataset file."""
+    return dataset_service.get_dataset_columns(
+        db=db, dataset_id=dataset_id, user_id=token_payload.id
+    )
+
+
+@router.get("/dataset/{dataset_id}/columns/details")
+def get_dataset_columns_details(
+    request: Request,
+    dataset_id: UUID,
+    db: Session = Depends(get_db),
+    token_payload: AuthToken = Depends(
+        dataset_service.auth_service.security_service.verify_auth_token
+    ),
+):
+    """Column name -> dtype, without parsing the dataset file."""
+    return dataset_service.get_dataset_columns_details(
+        db=db, dataset_id=dataset_id, user_id=token_payload.id
+    )
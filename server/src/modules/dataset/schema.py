@@ -12,13 +12,14 @@ class DatasetBase(BaseModel):
     description: str
     file_id: UUID
     created_at: datetime
-    rows: int
-    columns: int
+    rows: int | None = None  # null until a lazy recipe version is materialized
+    columns: int | None = None
     dataset_metadata: dict
     updated_at: datetime
     user_id: UUID
     parent_id: UUID | None = None
     version: str = "1.0"
+    recipe: list[dict] | None = None
     file: FileBase
 
 
@@ -28,13 +29,14 @@ class DatasetResponse(BaseModel):
     description: str
     file_id: UUID
     created_at: datetime
-    rows: int
-    columns: int
+    rows: int | None = None
+    columns: int | None = None
     dataset_metadata: dict
     updated_at: datetime
     user_id: UUID
     parent_id: UUID | None = None
     version: str = "1.0"
+    recipe: list[dict] | None = None
     file: FileBase
 
 
@@ -42,16 +44,18 @@ class DatasetRequest(BaseModel):
     name: str
     description: str
     file_id: UUID
-    rows: int
-    columns: int
+    rows: int | None = None
+    columns: int | None = None
     dataset_metadata: dict
 
 
 class DatasetCleanRequest(BaseModel):
     strategy: str  # 'drop_nulls', 'fill_mean', 'fill_median'
     columns: list[str] | None = None
+    lazy: bool = False  # store as a recipe over the parent instead of writing a new file
 
 
 class DatasetTransformRequest(BaseModel):
     strategy: str  # 'standard_scaler', 'min_max_scaler', 'label_encoder'
     columns: list[str]
+    lazy: bool = False
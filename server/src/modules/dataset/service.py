@@ -4,6 +4,7 @@ import pandas as pd
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
+from src.common.config import settings
 from src.common.logging.logger import log_execution
 from src.modules.auth.service import AuthService
 from src.modules.dataset.schema import (
@@ -14,6 +15,16 @@ from src.modules.dataset.schema import (
     DatasetTransformRequest,
 )
 from src.modules.dataset.store.repository import DatasetRepository
+from src.modules.dataset.utils.columnar import (
+    read_columns,
+    read_dataset,
+    read_dtypes,
+    remove_sidecar,
+    write_sidecar,
+)
+from src.modules.dataset.utils.frame_cache import frame_cache
+from src.modules.dataset.utils.profiler import profile_dataset, profile_frames
+from src.modules.dataset.utils.recipe import apply_recipe, make_step
 from src.modules.file.schema import FileBase as FileBaseSchema
 from src.modules.file.schema import FileDelete
 from src.modules.file.service import FileService
@@ -67,8 +78,15 @@ class DatasetService:
         return dataset
 
     @log_execution
-    def get_dataset(self, db: Session, dataset_id: UUID):
+    def get_dataset(self, db: Session, dataset_id: UUID, materialize: bool = False):
+        """``materialize`` fills in the metadata of a recipe version that was never read."""
         dataset = self.repo.get_by_id(db=db, id=dataset_id)
+        if dataset is None:
+            return None
+        if materialize and dataset.recipe and "shape" not in (dataset.dataset_metadata or {}):
+            self._store_metadata(
+                db, dataset, profile_frames([self._load_dataset_frame(db, dataset)])
+            )
         return dataset
 
     @log_execution
@@ -77,7 +95,13 @@ class DatasetService:
         dataset = self.repo.get_by_id(db=db, id=dataset_id)
         if dataset.user_id != user_id:
             raise HTTPException(status_code=403, detail="Not authorized")
-        metadata = self.get_dataset_params_details(db=db, file_id=dataset.file_id)
+        if dataset.recipe:
+            metadata = profile_frames([self._load_dataset_frame(db, dataset)])
+        else:
+            metadata = self.get_dataset_params_details(db=db, file_id=dataset.file_id)
+        return self._store_metadata(db, dataset, metadata)
+
+    def _store_metadata(self, db: Session, dataset, metadata: dict):
         dataset.rows = metadata["shape"]["rows"]
         dataset.columns = metadata["shape"]["columns"]
         dataset.dataset_metadata = metadata
@@ -108,8 +132,20 @@ class DatasetService:
             raise HTTPException(
                 status_code=403, detail="You are not authorized to delete this dataset"
             )
+        frame_cache.invalidate(dataset.id)
+        # Recipe versions share their base file — it goes with the last dataset using it
+        shared = (
+            db.query(self.repo.model)
+            .filter(self.repo.model.file_id == dataset.file_id, self.repo.model.id != dataset.id)
+            .count()
+        )
+        if shared:
+            return self.repo.delete(db=db, id=dataset_id)
+
         file = self.file_service.get_file_by_id(db=db, id=dataset.file_id)
-        # Delete physical file and its DB record
+        # Delete the columnar cache, then the physical file and its DB record
+        remove_sidecar(self._resolve_location(file))
+        frame_cache.invalidate(file.id)
         self.file_service.delete_file(db=db, data=FileDelete(id=file.id))
         return self.repo.delete(db=db, id=dataset_id)
 
@@ -135,21 +171,76 @@ class DatasetService:
         return datasets
 
     @log_execution
-    def _load_dataframe(self, db: Session, file_id: UUID):
-        file = self.file_service.get_file_by_id(db=db, id=file_id)
+    def get_cache_stats(self) -> dict:
+        return frame_cache.stats()
+
+    def _resolve_location(self, file) -> str:
+        """Resolve a stored location (leading slash, possibly Windows) to a path on disk."""
         import os
 
         loc = file.location
         if not os.path.exists(loc):
-            loc = os.path.join(os.getcwd(), loc.lstrip("/"))
+            loc = os.path.join(os.getcwd(), loc.lstrip("/").lstrip("\\"))
+        return loc
+
+    def _get_dataset_file(self, db: Session, file_id: UUID):
+        """The file record of a dataset and its path on disk, checked to be readable."""
+        import os
+
+        file = self.file_service.get_file_by_id(db=db, id=file_id)
+        loc = self._resolve_location(file)
         if not os.path.exists(loc):
-            raise HTTPException(status_code=404, detail="Physical file not found")
+            raise HTTPException(status_code=404, detail=f"Physical file not found: {file.location}")
+
+        if file.file_type not in ["csv", "xls", "xlsx"]:
+            raise HTTPException(
+                status_code=400, detail=f"Unsupported file format: {file.file_type}"
+            )
+        return file, loc
+
+    @log_execution
+    def _load_dataframe(self, db: Session, file_id: UUID, columns: list[str] | None = None):
+        file, loc = self._get_dataset_file(db, file_id)
+        df = frame_cache.get(
+            file.id,
+            loc,
+            lambda cols: read_dataset(loc, file.file_type, columns=cols),
+            columns=columns,
+        )
+        return df, file, loc
+
+    @log_execution
+    def _load_dataset_frame(self, db: Session, dataset, columns: list[str] | None = None):
+        """
+        The contents of a dataset version. A recipe version is materialized from its base
+        file on first use and kept in the frame cache under the dataset's own id.
+        """
+        if not dataset.recipe:
+            df, _, _ = self._load_dataframe(db=db, file_id=dataset.file_id, columns=columns)
+            return df
+
+        file, loc = self._get_dataset_file(db, dataset.file_id)
+        recipe = list(dataset.recipe)
+        df = frame_cache.get(
+            dataset.id,
+            loc,
+            lambda _: apply_recipe(self._load_dataframe(db=db, file_id=file.id)[0], recipe),
+        )
+        return df[columns] if columns is not None else df
+
+    @log_execution
+    def _get_columns(self, db: Session, file_id: UUID) -> list[str]:
+        """Column names of a dataset file, read from its header / columnar schema only."""
+        import os
 
-        if file.file_type == "csv":
-            return pd.read_csv(loc), file, loc
-        elif file.file_type in ["xls", "xlsx"]:
-            return pd.read_excel(loc), file, loc
-        raise HTTPException(status_code=400, detail="Unsupported file format")
+        file = self.file_service.get_file_by_id(db=db, id=file_id)
+        loc = self._resolve_location(file)
+        if not os.path.exists(loc):
+            raise HTTPException(status_code=404, detail=f"Physical file not found: {file.location}")
+        try:
+            return read_columns(loc, file.file_type)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
 
     @log_execution
     def _save_new_dataset_version(
@@ -163,12 +254,7 @@ class DatasetService:
         import os
         from uuid import uuid4
 
-        # Calculate new semantic version based on parent
-        try:
-            old_major, old_minor = map(int, str(parent_dataset.version).split("."))
-            new_version = f"{old_major}.{old_minor + 1}"
-        except Exception:
-            new_version = "1.1"  # Fallback if parsing fails
+        new_version = self._next_version(parent_dataset)
 
         # Save to disk
         new_filename = f"{parent_dataset.name}_v{new_version}_{operation}_{uuid4().hex[:8]}.csv"
@@ -177,6 +263,8 @@ class DatasetService:
         new_loc = os.path.join(upload_dir, new_filename)
 
         df.to_csv(new_loc, index=False)
+        # The frame is already typed in memory — store its columnar cache right away
+        write_sidecar(new_loc, df)
 
         # Create file record
         file_obj = self.file_service.repo.create(
@@ -202,7 +290,8 @@ class DatasetService:
                 file_id=file_obj.id,
                 rows=df.shape[0],
                 columns=df.shape[1],
-                dataset_metadata=self.get_dataset_params_details(db=db, file_id=file_obj.id),
+                # Profiled from the frame in hand rather than by re-reading the file
+                dataset_metadata=profile_frames([df]),
                 user_id=user_id,
                 parent_id=parent_dataset.id,
                 version=new_version,
@@ -214,131 +303,131 @@ class DatasetService:
         return new_dataset
 
     @log_execution
-    def clean_dataset(
-        self, db: Session, dataset_id: UUID, data: DatasetCleanRequest, user_id: UUID
-    ):
+    def _save_recipe_version(
+        self,
+        db: Session,
+        parent_dataset,
+        user_id: UUID,
+        operation: str,
+        step: dict,
+    ) -> DatasetResponse:
+        """
+        Record a new version as the parent's base file plus one more step. Nothing is read
+        or written here: rows and columns stay null and the metadata only says
+        ``materialized: false`` until the version is first opened.
+        """
+        from uuid import uuid4
 
+        file = self.file_service.get_file_by_id(db=db, id=parent_dataset.file_id)
+        return self.repo.create(
+            db=db,
+            obj_in=DatasetBase(
+                id=uuid4(),
+                name=f"{parent_dataset.name} ({operation})",
+                description=parent_dataset.description,
+                file_id=parent_dataset.file_id,
+                rows=None,
+                columns=None,
+                dataset_metadata={"materialized": False},
+                recipe=[*(parent_dataset.recipe or []), step],
+                user_id=user_id,
+                parent_id=parent_dataset.id,
+                version=self._next_version(parent_dataset),
+                created_at=pd.Timestamp.utcnow(),
+                updated_at=pd.Timestamp.utcnow(),
+                file=FileBaseSchema.model_validate(file, from_attributes=True),
+            ).model_dump(exclude={"file", "created_at", "updated_at"}),
+        )
+
+    def _next_version(self, parent_dataset) -> str:
+        """Calculate new semantic version based on parent"""
+        try:
+            old_major, old_minor = map(int, str(parent_dataset.version).split("."))
+            return f"{old_major}.{old_minor + 1}"
+        except Exception:
+            return "1.1"  # Fallback if parsing fails
+
+    def _derive_version(
+        self, db: Session, dataset_id: UUID, user_id: UUID, step: dict, operation: str, lazy: bool
+    ) -> DatasetResponse:
         dataset = self.get_dataset(db=db, dataset_id=dataset_id)
+        if dataset is None:
+            raise HTTPException(status_code=404, detail="Dataset not found")
         if dataset.user_id != user_id:
             raise HTTPException(status_code=403, detail="Unauthorized")
 
-        df, file_obj, loc = self._load_dataframe(db=db, file_id=dataset.file_id)
-
-        cols = data.columns if data.columns else df.columns
-        for c in cols:
-            if c not in df.columns:
-                continue
+        if lazy:
+            return self._save_recipe_version(db, dataset, user_id, operation, step)
 
-            if data.strategy == "drop_nulls":
-                df = df.dropna(subset=[c])
-            elif data.strategy == "fill_mean":
-                if pd.api.types.is_numeric_dtype(df[c]):
-                    df[c] = df[c].fillna(df[c].mean())
-            elif data.strategy == "fill_median":
-                if pd.api.types.is_numeric_dtype(df[c]):
-                    df[c] = df[c].fillna(df[c].median())
+        df = apply_recipe(self._load_dataset_frame(db, dataset), [step])
+        return self._save_new_dataset_version(db, df, dataset, user_id, operation)
 
-        return self._save_new_dataset_version(db, df, dataset, user_id, "cleaned")
+    @log_execution
+    def clean_dataset(
+        self, db: Session, dataset_id: UUID, data: DatasetCleanRequest, user_id: UUID
+    ):
+        step = make_step("clean", data.strategy, data.columns)
+        return self._derive_version(db, dataset_id, user_id, step, "cleaned", data.lazy)
 
     @log_execution
     def transform_dataset(
         self, db: Session, dataset_id: UUID, data: DatasetTransformRequest, user_id: UUID
     ):
-        from sklearn.preprocessing import LabelEncoder, MinMaxScaler, StandardScaler
-
-        dataset = self.get_dataset(db=db, dataset_id=dataset_id)
-        if dataset.user_id != user_id:
-            raise HTTPException(status_code=403, detail="Unauthorized")
-
-        df, file_obj, loc = self._load_dataframe(db=db, file_id=dataset.file_id)
-
-        cols = data.columns if data.columns else df.columns
-        for c in cols:
-            if c not in df.columns:
-                continue
-
-            if data.strategy == "standard_scaler":
-                if pd.api.types.is_numeric_dtype(df[c]):
-                    df[c] = StandardScaler().fit_transform(df[[c]])
-            elif data.strategy == "min_max_scaler":
-                if pd.api.types.is_numeric_dtype(df[c]):
-                    df[c] = MinMaxScaler().fit_transform(df[[c]])
-            elif data.strategy == "label_encoder":
-                df[c] = LabelEncoder().fit_transform(df[c].astype(str))
-
-        return self._save_new_dataset_version(db, df, dataset, user_id, "transformed")
+        step = make_step("transform", data.strategy, data.columns)
+        return self._derive_version(db, dataset_id, user_id, step, "transformed", data.lazy)
 
     @log_execution
     def get_dataset_params_details(self, db: Session, file_id: UUID):
+        """Profile a dataset file in bounded-memory chunks (see utils.profiler)."""
+        file, loc = self._get_dataset_file(db, file_id)
+        return profile_dataset(
+            loc, file.file_type, max_memory_bytes=settings.PROFILER_MAX_MEMORY_MB * 1024 * 1024
+        )
+
+    def _get_dtypes(self, db: Session, dataset) -> dict[str, str]:
+        """
+        Column -> dtype of a dataset. Served from the profile stored with the dataset;
+        datasets without one fall back to the sidecar schema or a header sample.
+        """
         import os
 
-        file = self.file_service.get_file_by_id(db=db, id=file_id)
+        dtypes = (dataset.dataset_metadata or {}).get("dtypes")
+        if isinstance(dtypes, dict) and dtypes:
+            return dtypes
+        if dataset.recipe:
+            # Steps can change dtypes (label_encoder), so a header read would be wrong
+            dataset = self.get_dataset(db=db, dataset_id=dataset.id, materialize=True)
+            return dataset.dataset_metadata["dtypes"]
 
-        # Resolve the path the same way as _load_dataframe — handle leading slash on Windows
-        loc = file.location
-        if not os.path.exists(loc):
-            loc = os.path.join(os.getcwd(), loc.lstrip("/").lstrip("\\"))
+        file = self.file_service.get_file_by_id(db=db, id=dataset.file_id)
+        loc = self._resolve_location(file)
         if not os.path.exists(loc):
             raise HTTPException(status_code=404, detail=f"Physical file not found: {file.location}")
-
-        if file.file_type == "csv":
-            dataset = pd.read_csv(loc)
-        elif file.file_type in ["xls", "xlsx"]:
-            dataset = pd.read_excel(loc)
-        else:
-            raise HTTPException(
-                status_code=400, detail=f"Unsupported file format: {file.file_type}"
-            )
-
-        return {
-            "shape": {
-                "rows": dataset.shape[0],
-                "columns": dataset.shape[1],
-            },
-            "dtypes": dataset.dtypes.astype(str).to_dict(),
-            "missing_values": dataset.isnull().sum().to_dict(),
-            "missing_percentage": (dataset.isnull().mean() * 100).round(2).to_dict(),
-            "statistics": dataset.describe().to_dict(),
-            "unique_values": dataset.nunique().to_dict(),
-            "preview": dataset.head(5).to_dict(orient="records"),
-        }
+        try:
+            return read_dtypes(loc, file.file_type)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
 
     @log_execution
-    def get_dataset_columns(self, db: Session, dataset_id: UUID):
+    def get_dataset_columns(self, db: Session, dataset_id: UUID, user_id: UUID):
         dataset = self.repo.get_by_id(db=db, id=dataset_id)
-        file = self.file_service.get_file(db=db, file_id=dataset.file_id)
-        if file.file_type == "csv":
-            dataset = pd.read_csv(file.location)
-        elif file.file_type == "xlsx":
-            dataset = pd.read_excel(file.location)
-        return dataset.columns.tolist()
+        if dataset.user_id != user_id:
+            raise HTTPException(status_code=403, detail="Unauthorized")
+        return list(self._get_dtypes(db=db, dataset=dataset))
 
     @log_execution
-    def get_dataset_columns_details(self, db: Session, dataset_id: UUID):
+    def get_dataset_columns_details(self, db: Session, dataset_id: UUID, user_id: UUID):
         dataset = self.repo.get_by_id(db=db, id=dataset_id)
-        file = self.file_service.get_file(db=db, file_id=dataset.file_id)
-        if file.file_type == "csv":
-            dataset = pd.read_csv(file.location)
-        elif file.file_type == "xlsx":
-            dataset = pd.read_excel(file.location)
-        return dataset.dtypes.astype(str).to_dict()
+        if dataset.user_id != user_id:
+            raise HTTPException(status_code=403, detail="Unauthorized")
+        return self._get_dtypes(db=db, dataset=dataset)
 
     @log_execution
     def visualization_dataset(self, db: Session, dataset_id: UUID):
-        dataset = self.repo.get_by_id(db=db, id=dataset_id)
-        file = self.file_service.get_file(db=db, file_id=dataset.file_id)
-        if file.file_type == "csv":
-            dataset = pd.read_csv(file.location)
-        elif file.file_type == "xlsx":
-            dataset = pd.read_excel(file.location)
+        dataset = self._load_dataset_frame(db, self.repo.get_by_id(db=db, id=dataset_id))
         return dataset.hist().to_dict()
 
     @log_execution
     def correlation_matrix(self, db: Session, dataset_id: UUID):
-        dataset = self.repo.get_by_id(db=db, id=dataset_id)
-        file = self.file_service.get_file(db=db, file_id=dataset.file_id)
-        if file.file_type == "csv":
-            dataset = pd.read_csv(file.location)
-        elif file.file_type == "xlsx":
-            dataset = pd.read_excel(file.location)
+        dataset = self._load_dataset_frame(db, self.repo.get_by_id(db=db, id=dataset_id))
         return dataset.corr().to_dict()
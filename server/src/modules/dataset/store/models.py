@@ -30,9 +30,12 @@ class Dataset(Base):
     user_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey(f"{Tables.USERS}.id"), nullable=False
     )
-    rows: Mapped[int] = mapped_column(Integer, nullable=False)
-    columns: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Null for a recipe version that has not been materialized yet
+    rows: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    columns: Mapped[int | None] = mapped_column(Integer, nullable=True)
     dataset_metadata: Mapped[dict] = mapped_column("metadata", JSON, nullable=False)
+    # Ordered clean/transform steps applied to file_id; null for materialized versions
+    recipe: Mapped[list | None] = mapped_column(JSON, nullable=True)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
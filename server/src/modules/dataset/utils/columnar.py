@@ -0,0 +1,202 @@
+"""
+Columnar (Parquet) sidecar files for uploaded datasets.
+
+The first time a CSV/Excel dataset is read it is parsed once with pandas and written
+next to the original as ``<file>.parquet``. Later reads go to the sidecar instead,
+which keeps pandas' inferred dtypes and only decodes the requested columns. A sidecar
+older than its source is ignored, and any failure to write or read one falls back to
+parsing the original file.
+"""
+
+import os
+from collections.abc import Iterator
+
+import pandas as pd
+from loguru import logger
+
+SIDECAR_SUFFIX = ".parquet"
+SCHEMA_SAMPLE_ROWS = 1_000  # rows parsed to infer dtypes when there is no sidecar
+
+
+def sidecar_path(location: str) -> str:
+    return f"{location}{SIDECAR_SUFFIX}"
+
+
+def has_fresh_sidecar(location: str) -> bool:
+    sidecar = sidecar_path(location)
+    try:
+        return os.path.getmtime(sidecar) >= os.path.getmtime(location)
+    except OSError:
+        return False
+
+
+def read_source(
+    location: str, file_type: str, columns: list[str] | None = None, nrows: int | None = None
+) -> pd.DataFrame:
+    """Parse the original CSV/Excel file."""
+    if file_type == "csv":
+        return pd.read_csv(location, usecols=columns, nrows=nrows)
+    if file_type in ["xls", "xlsx"]:
+        return pd.read_excel(location, usecols=columns, nrows=nrows)
+    raise ValueError(f"Unsupported file format: {file_type}")
+
+
+def write_sidecar(location: str, df: pd.DataFrame) -> bool:
+    """Persist ``df`` as the sidecar of ``location``. Returns False if it cannot be encoded."""
+    sidecar = sidecar_path(location)
+    tmp = f"{sidecar}.tmp"
+    try:
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, sidecar)
+        return True
+    except Exception as e:
+        logger.warning(f"Could not write columnar cache for {location}: {e}")
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return False
+
+
+class SidecarWriter:
+    """
+    Incrementally writes a sidecar from a stream of chunks, so a file that is being
+    streamed anyway (e.g. by the profiler) is converted without a second parse. If a
+    later chunk's types drift from the first one (CSV type inference is per chunk) the
+    sidecar is abandoned and will be built by the next full read instead.
+    """
+
+    def __init__(self, location: str):
+        self.location = location
+        self.tmp = f"{sidecar_path(location)}.tmp"
+        self._writer = None
+        self.failed = False
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        if self.failed:
+            return
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            if self._writer is None:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                self._writer = pq.ParquetWriter(self.tmp, table.schema)
+            else:
+                table = pa.Table.from_pandas(
+                    chunk, schema=self._writer.schema, preserve_index=False
+                )
+            self._writer.write_table(table)
+        except Exception as e:
+            logger.info(f"Streaming columnar cache abandoned for {self.location}: {e}")
+            self.abort()
+
+    def close(self) -> bool:
+        if self.failed or self._writer is None:
+            self.abort()
+            return False
+        self._writer.close()
+        os.replace(self.tmp, sidecar_path(self.location))
+        return True
+
+    def abort(self) -> None:
+        self.failed = True
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            except Exception:
+                pass
+            self._writer = None
+        if os.path.exists(self.tmp):
+            os.remove(self.tmp)
+
+
+def remove_sidecar(location: str) -> None:
+    sidecar = sidecar_path(location)
+    if os.path.exists(sidecar):
+        os.remove(sidecar)
+
+
+def read_columns(location: str, file_type: str) -> list[str]:
+    """Column names of a dataset without loading any rows."""
+    if has_fresh_sidecar(location):
+        try:
+            import pyarrow.parquet as pq
+
+            return list(pq.read_schema(sidecar_path(location)).names)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable columnar cache for {location}: {e}")
+    return read_source(location, file_type, nrows=0).columns.tolist()
+
+
+def read_dtypes(location: str, file_type: str) -> dict[str, str]:
+    """
+    Column dtypes of a dataset without a full parse: exact from the sidecar schema,
+    otherwise inferred from the first ``SCHEMA_SAMPLE_ROWS`` rows of the source.
+    """
+    if has_fresh_sidecar(location):
+        try:
+            import pyarrow.parquet as pq
+
+            empty = pq.read_schema(sidecar_path(location)).empty_table().to_pandas()
+            return empty.dtypes.astype(str).to_dict()
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable columnar cache for {location}: {e}")
+    sample = read_source(location, file_type, nrows=SCHEMA_SAMPLE_ROWS)
+    return sample.dtypes.astype(str).to_dict()
+
+
+def read_dataset(location: str, file_type: str, columns: list[str] | None = None) -> pd.DataFrame:
+    """
+    Load a dataset, preferring its Parquet sidecar. ``columns`` restricts the read to
+    those columns (in that order).
+    """
+    if has_fresh_sidecar(location):
+        try:
+            return pd.read_parquet(sidecar_path(location), columns=columns)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable columnar cache for {location}: {e}")
+
+    df = read_source(location, file_type)
+    write_sidecar(location, df)
+    return df[columns] if columns is not None else df
+
+
+def iter_chunks(
+    location: str, file_type: str, chunk_rows: int, columns: list[str] | None = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a dataset as DataFrames of at most ``chunk_rows`` rows. Parquet sidecars and
+    CSV files are read incrementally; Excel has no streaming reader and is sliced after
+    a full load.
+    """
+    if has_fresh_sidecar(location):
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(sidecar_path(location))
+        for batch in parquet.iter_batches(batch_size=chunk_rows, columns=columns):
+            yield batch.to_pandas()
+        return
+
+    if file_type == "csv":
+        yield from pd.read_csv(location, usecols=columns, chunksize=chunk_rows)
+        return
+
+    df = read_source(location, file_type, columns=columns)
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start : start + chunk_rows]
+
+
+def estimate_chunk_rows(location: str, file_type: str, max_bytes: int) -> int:
+    """
+    Rows per chunk so that one chunk (plus the temporaries built while processing it)
+    stays within ``max_bytes``, based on the in-memory size of a small sample.
+    """
+    sample_rows = 1000
+    if has_fresh_sidecar(location):
+        sample = next(iter_chunks(location, file_type, sample_rows), pd.DataFrame())
+    else:
+        sample = read_source(location, file_type, nrows=sample_rows)
+    if sample.empty:
+        return sample_rows
+    bytes_per_row = sample.memory_usage(index=False, deep=True).sum() / len(sample)
+    # Processing a chunk (null masks, hashes, casts) needs a few times its own size
+    return max(sample_rows, int(max_bytes / (4 * max(bytes_per_row, 1))))
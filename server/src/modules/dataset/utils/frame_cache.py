@@ -0,0 +1,80 @@
+"""
+Process-wide, memory-bounded LRU cache of loaded dataset DataFrames.
+
+Entries are keyed by the dataset's ``file_id`` plus the projected columns (``None``
+for the whole frame) and remember the (mtime, size) of the source file, so a file
+that changes on disk is re-read even if nobody invalidated it. A projection is
+served from a cached full frame when there is one. Bounds, signatures and the
+single-loader locking come from ``src.common.cache.lru``.
+
+Callers always get a copy-on-write copy: under pandas >= 3 (or with
+``mode.copy_on_write`` enabled) that is a cheap shallow copy whose first write
+materializes its own data, otherwise a deep copy. Either way, mutating a returned
+frame (``clean_dataset``, ``transform_dataset``) never touches the cached one.
+"""
+
+import os
+from collections.abc import Callable
+from uuid import UUID
+
+import pandas as pd
+
+from src.common.cache.lru import BoundedLRUCache, Signature
+from src.common.config import settings
+
+_Key = tuple[UUID, tuple[str, ...] | None]
+
+
+def _copy_on_write_enabled() -> bool:
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return bool(pd.get_option("mode.copy_on_write"))
+
+
+_SHALLOW_COPIES = _copy_on_write_enabled()
+
+
+def _handout(df: pd.DataFrame) -> pd.DataFrame:
+    return df.copy(deep=not _SHALLOW_COPIES)
+
+
+class DataFrameCache(BoundedLRUCache):
+    def get(
+        self,
+        file_id: UUID,
+        path: str,
+        loader: Callable[[list[str] | None], pd.DataFrame],
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Return the frame of ``path`` (restricted to ``columns``), calling
+        ``loader(columns)`` on a miss.
+        """
+        stat = os.stat(path)
+        key: _Key = (file_id, tuple(columns) if columns is not None else None)
+        frame = self.load(
+            key,
+            (stat.st_mtime_ns, stat.st_size),
+            lambda: loader(columns),
+            sizeof=lambda df: int(df.memory_usage(index=True, deep=True).sum()),
+        )
+        return _handout(frame)
+
+    def invalidate(self, file_id: UUID | None) -> None:
+        if file_id is not None:
+            self.discard(lambda key: key[0] == file_id)
+
+    def _find(self, key: _Key, signature: Signature) -> pd.DataFrame | None:
+        frame = super()._find(key, signature)
+        if frame is None and key[1] is not None:
+            # A projection can be cut from the whole frame
+            full = super()._find((key[0], None), signature)
+            if full is not None and all(c in full.columns for c in key[1]):
+                frame = full[list(key[1])]
+        return frame
+
+
+frame_cache = DataFrameCache(
+    max_entries=settings.DATAFRAME_CACHE_MAX_ENTRIES,
+    max_bytes=settings.DATAFRAME_CACHE_MAX_MB * 1024 * 1024,
+)
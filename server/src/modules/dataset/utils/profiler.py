@@ -0,0 +1,252 @@
+"""
+Single-pass, chunked dataset profiler.
+
+Builds the same ``dataset_metadata`` dict the UI has always received
+(shape, dtypes, missing values, describe()-style statistics, unique counts, preview)
+without holding the whole dataset in memory. Each chunk is reduced to small,
+mergeable per-column accumulators:
+
+  count / nulls         exact
+  min / max             exact
+  mean / std            exact, Welford/Chan parallel merge
+  25% / 50% / 75%       approximate — bounded uniform sample (exact for small columns)
+  unique                approximate — k-minimum-values sketch (exact below k distinct)
+  top / freq            approximate — bounded frequency table (text-only datasets)
+"""
+
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.modules.dataset.utils.columnar import (
+    SidecarWriter,
+    estimate_chunk_rows,
+    has_fresh_sidecar,
+    iter_chunks,
+)
+
+SAMPLE_SIZE = 10_000  # values kept per numeric column for quantiles
+KMV_SIZE = 4_096  # hashes kept per column for distinct counts
+TOP_K = 1_000  # values kept per text column for top/freq
+PREVIEW_ROWS = 5
+_HASH_SPACE = float(2**64)
+
+
+def _is_numeric(dtype: Any) -> bool:
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+
+def _merge_dtype(a: Any, b: Any) -> Any:
+    """The dtype a column would have had if all chunks had been parsed together."""
+    if a is None or a == b:
+        return b
+    if _is_numeric(a) and _is_numeric(b):
+        return np.result_type(a, b)
+    return np.dtype("O")
+
+
+def _json_number(value: Any) -> Any:
+    if value is None:
+        return None
+    value = float(value)
+    return None if np.isnan(value) or np.isinf(value) else value
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and (np.isnan(value) or np.isinf(value)):
+        return None
+    if value is pd.NaT or value is pd.NA:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    return value
+
+
+class _ColumnProfile:
+    def __init__(self, rng: np.random.Generator):
+        self.rng = rng
+        self.dtype: Any = None
+        self.count = 0
+        self.nulls = 0
+        # numeric accumulators
+        self.num_count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+        self.sample_keys = np.empty(0)
+        self.sample_values = np.empty(0)
+        # distinct-count sketch (sorted unique 64-bit hashes)
+        self.kmv = np.empty(0, dtype=np.uint64)
+        # text top/freq
+        self.freq: Counter | None = None
+
+    def update(self, series: pd.Series, track_freq: bool) -> None:
+        values = series.dropna()
+        n = len(values)
+        self.nulls += len(series) - n
+        self.count += n
+        if n == 0:
+            # An all-null chunk parses as float64 and says nothing about the column
+            return
+
+        self.dtype = _merge_dtype(self.dtype, series.dtype)
+
+        if _is_numeric(series.dtype):
+            values = values.astype("float64")
+            self._update_numeric(values.to_numpy())
+        self._update_kmv(values)
+        if track_freq:
+            self._update_freq(values)
+
+    def _update_numeric(self, x: np.ndarray) -> None:
+        n_b = len(x)
+        mean_b = float(x.mean())
+        m2_b = float(((x - mean_b) ** 2).sum())
+        n_a = self.num_count
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta * delta * n_a * n_b / n
+        self.num_count = n
+
+        lo, hi = float(x.min()), float(x.max())
+        self.min = lo if self.min is None else min(self.min, lo)
+        self.max = hi if self.max is None else max(self.max, hi)
+
+        # Priority sampling: keep the values with the smallest random keys, which is a
+        # uniform sample of everything seen so far
+        keys = np.concatenate([self.sample_keys, self.rng.random(n_b)])
+        vals = np.concatenate([self.sample_values, x])
+        if len(keys) > SAMPLE_SIZE:
+            keep = np.argpartition(keys, SAMPLE_SIZE)[:SAMPLE_SIZE]
+            keys, vals = keys[keep], vals[keep]
+        self.sample_keys, self.sample_values = keys, vals
+
+    def _update_kmv(self, values: pd.Series) -> None:
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        merged = np.unique(np.concatenate([self.kmv, hashes]))
+        self.kmv = merged[:KMV_SIZE]
+
+    def _update_freq(self, values: pd.Series) -> None:
+        if self.freq is None:
+            self.freq = Counter()
+        self.freq.update(values.value_counts().to_dict())
+        if len(self.freq) > 2 * TOP_K:
+            self.freq = Counter(dict(self.freq.most_common(TOP_K)))
+
+    def final_dtype(self) -> Any:
+        """Dtype after nulls from other chunks are taken into account."""
+        if self.dtype is None:
+            return np.dtype("float64")
+        if self.nulls and pd.api.types.is_integer_dtype(self.dtype):
+            return np.dtype("float64")
+        if self.nulls and pd.api.types.is_bool_dtype(self.dtype):
+            return np.dtype("O")
+        return self.dtype
+
+    def distinct(self) -> int:
+        if len(self.kmv) < KMV_SIZE:
+            return len(self.kmv)
+        return int(round((KMV_SIZE - 1) * _HASH_SPACE / float(self.kmv[-1])))
+
+    def numeric_statistics(self) -> dict[str, Any]:
+        n = self.num_count
+        q25, q50, q75 = (
+            np.quantile(self.sample_values, [0.25, 0.5, 0.75]) if n else (None, None, None)
+        )
+        return {
+            "count": float(n),
+            "mean": _json_number(self.mean) if n else None,
+            "std": _json_number(np.sqrt(self.m2 / (n - 1))) if n > 1 else None,
+            "min": _json_number(self.min),
+            "25%": _json_number(q25),
+            "50%": _json_number(q50),
+            "75%": _json_number(q75),
+            "max": _json_number(self.max),
+        }
+
+    def text_statistics(self) -> dict[str, Any]:
+        top, freq = self.freq.most_common(1)[0] if self.freq else (None, None)
+        return {
+            "count": self.count,
+            "unique": self.distinct(),
+            "top": _json_value(top),
+            "freq": freq,
+        }
+
+
+def profile_frames(chunks: Iterable[pd.DataFrame]) -> dict[str, Any]:
+    """Profile a dataset given as an iterable of DataFrame chunks with the same columns."""
+    rng = np.random.default_rng(0)
+    columns: dict[str, _ColumnProfile] = {}
+    rows = 0
+    preview: list[dict[str, Any]] = []
+    track_freq = False
+
+    for i, chunk in enumerate(chunks):
+        if i == 0:
+            columns = {str(c): _ColumnProfile(rng) for c in chunk.columns}
+            # describe() falls back to top/freq only when there is no numeric column
+            track_freq = not any(_is_numeric(t) for t in chunk.dtypes)
+        rows += len(chunk)
+        if len(preview) < PREVIEW_ROWS:
+            head = chunk.head(PREVIEW_ROWS - len(preview))
+            preview.extend(
+                {str(k): _json_value(v) for k, v in rec.items()}
+                for rec in head.to_dict(orient="records")
+            )
+        for col, series in chunk.items():
+            columns[str(col)].update(series, track_freq)
+
+    numeric = [name for name, p in columns.items() if _is_numeric(p.final_dtype())]
+    if numeric:
+        statistics = {name: columns[name].numeric_statistics() for name in numeric}
+    else:
+        statistics = {name: p.text_statistics() for name, p in columns.items()}
+
+    return {
+        "shape": {
+            "rows": rows,
+            "columns": len(columns),
+        },
+        "dtypes": {name: str(p.final_dtype()) for name, p in columns.items()},
+        "missing_values": {name: p.nulls for name, p in columns.items()},
+        "missing_percentage": {
+            name: round(p.nulls / rows * 100, 2) if rows else 0.0 for name, p in columns.items()
+        },
+        "statistics": statistics,
+        "unique_values": {name: p.distinct() for name, p in columns.items()},
+        "preview": preview,
+    }
+
+
+def profile_dataset(location: str, file_type: str, max_memory_bytes: int) -> dict[str, Any]:
+    """
+    Stream a dataset file through the profiler, keeping each chunk under the budget.
+    A file without a columnar cache gets one written from the same chunks.
+    """
+    chunk_rows = estimate_chunk_rows(location, file_type, max_memory_bytes)
+    chunks = iter_chunks(location, file_type, chunk_rows)
+    if has_fresh_sidecar(location):
+        return profile_frames(chunks)
+
+    writer = SidecarWriter(location)
+    try:
+        metadata = profile_frames(_tee(chunks, writer))
+    except Exception:
+        writer.abort()
+        raise
+    writer.close()
+    return metadata
+
+
+def _tee(chunks: Iterable[pd.DataFrame], writer: SidecarWriter) -> Iterable[pd.DataFrame]:
+    for chunk in chunks:
+        writer.write(chunk)
+        yield chunk
@@ -0,0 +1,107 @@
+"""
+Dataset transformation recipes.
+
+A recipe is the ordered list of clean/transform steps that turns a stored file into a
+dataset version::
+
+    [{"op": "clean", "strategy": "fill_mean", "columns": ["age"]},
+     {"op": "transform", "strategy": "standard_scaler", "columns": ["age", "income"]}]
+
+``apply_recipe`` runs the steps fused: column-wise steps only read and write their own
+column, so every run of them between two row filters is applied column by column —
+each column is pulled out once, passed through its whole chain and assigned back once.
+Consecutive ``drop_nulls`` steps collapse into a single ``dropna``. The result is the
+same as applying the steps one after another.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+CLEAN_STRATEGIES = ("drop_nulls", "fill_mean", "fill_median")
+TRANSFORM_STRATEGIES = ("standard_scaler", "min_max_scaler", "label_encoder")
+
+
+def make_step(op: str, strategy: str, columns: list[str] | None) -> dict[str, Any]:
+    return {"op": op, "strategy": strategy, "columns": list(columns) if columns else None}
+
+
+def _fill_mean(s: pd.Series) -> pd.Series | np.ndarray:
+    return s.fillna(s.mean()) if pd.api.types.is_numeric_dtype(s) else s
+
+
+def _fill_median(s: pd.Series) -> pd.Series | np.ndarray:
+    return s.fillna(s.median()) if pd.api.types.is_numeric_dtype(s) else s
+
+
+def _standard_scaler(s: pd.Series) -> pd.Series | np.ndarray:
+    from sklearn.preprocessing import StandardScaler
+
+    if not pd.api.types.is_numeric_dtype(s):
+        return s
+    return StandardScaler().fit_transform(s.to_frame())[:, 0]
+
+
+def _min_max_scaler(s: pd.Series) -> pd.Series | np.ndarray:
+    from sklearn.preprocessing import MinMaxScaler
+
+    if not pd.api.types.is_numeric_dtype(s):
+        return s
+    return MinMaxScaler().fit_transform(s.to_frame())[:, 0]
+
+
+def _label_encoder(s: pd.Series) -> pd.Series | np.ndarray:
+    from sklearn.preprocessing import LabelEncoder
+
+    return LabelEncoder().fit_transform(s.astype(str))
+
+
+_COLUMN_STEPS: dict[str, Callable[[pd.Series], pd.Series | np.ndarray]] = {
+    "fill_mean": _fill_mean,
+    "fill_median": _fill_median,
+    "standard_scaler": _standard_scaler,
+    "min_max_scaler": _min_max_scaler,
+    "label_encoder": _label_encoder,
+}
+
+
+def apply_recipe(df: pd.DataFrame, steps: list[dict[str, Any]]) -> pd.DataFrame:
+    """Apply ``steps`` to ``df`` and return the result (``df`` itself is not modified)."""
+    df = df.copy(deep=False)
+    chains: dict[str, list[str]] = {}  # column -> pending column-wise strategies
+    drop_subset: list[str] = []  # pending drop_nulls columns
+
+    def flush_chains() -> None:
+        nonlocal df
+        for col, strategies in chains.items():
+            values: pd.Series | np.ndarray = df[col]
+            for strategy in strategies:
+                if not isinstance(values, pd.Series):
+                    values = pd.Series(values, index=df.index, name=col)
+                values = _COLUMN_STEPS[strategy](values)
+            df[col] = values
+        chains.clear()
+
+    def flush_drops() -> None:
+        nonlocal df
+        if drop_subset:
+            df = df.dropna(subset=drop_subset)
+            drop_subset.clear()
+
+    for step in steps:
+        strategy = step.get("strategy")
+        cols = [c for c in (step.get("columns") or df.columns) if c in df.columns]
+        if strategy == "drop_nulls":
+            flush_chains()
+            drop_subset.extend(c for c in cols if c not in drop_subset)
+        elif strategy in _COLUMN_STEPS:
+            flush_drops()
+            for c in cols:
+                chains.setdefault(c, []).append(strategy)
+        # Unknown strategies are a no-op, as they have always been
+
+    flush_drops()
+    flush_chains()
+    return df
@@ -35,6 +35,16 @@ def get_file(
     return file_service.get_file_by_id(db=db, id=file_id)
 
 
+@router.get("/file/{file_id}/download")
+def download_file(
+    request: Request,
+    file_id: UUID,
+    db: Session = Depends(get_db),
+    token_payload: AuthToken = Depends(auth_service.security_service.verify_auth_token),
+):
+    return file_service.download_file(db=db, id=file_id, user_id=token_payload.id)
+
+
 @router.get("/files")
 def get_files(
     request: Request,
@@ -4,6 +4,7 @@ from pathlib import Path
 from uuid import UUID
 
 from fastapi import HTTPException, UploadFile
+from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 
 from src.common.logging.logger import log_execution
@@ -59,6 +60,23 @@ class FileService:
             raise HTTPException(status_code=404, detail="File Not found")
         return file
 
+    @log_execution
+    def download_file(self, db: Session, id: UUID, user_id: UUID) -> FileResponse:
+        import os
+
+        file = self.get_file_by_id(db=db, id=id)
+        if file.user_id != user_id:
+            raise HTTPException(status_code=403, detail="Not authorized")
+
+        file_path = Path(file.location)
+        if not file_path.exists():
+            file_path = Path(os.getcwd()) / file.location.lstrip("/").lstrip("\\")
+        if not file_path.exists():
+            raise HTTPException(status_code=404, detail="File not found on disk")
+        return FileResponse(
+            path=file_path, media_type="application/octet-stream", filename=file.name
+        )
+
     @log_execution
     def delete_file(self, db: Session, data: FileDelete) -> FileDeleteResponse:
         import os
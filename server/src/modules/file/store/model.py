@@ -18,6 +18,9 @@ class Files(Base):
     location: Mapped[str] = mapped_column(String, default=None)
     file_type: Mapped[str] = mapped_column(String, default=None)
     category: Mapped[str] = mapped_column(String, default="general", nullable=True)
+    # SHA-256 of the contents, valid while the file's "<mtime_ns>:<size>" matches the signature
+    digest: Mapped[str] = mapped_column(String, nullable=True)
+    digest_signature: Mapped[str] = mapped_column(String, nullable=True)
     user_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey(f"{Tables.USERS}.id"), nullable=False
     )
@@ -0,0 +1,3 @@
+from src.modules.job.service import JobService
+
+__all__ = ["JobService"]
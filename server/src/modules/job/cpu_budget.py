@@ -0,0 +1,62 @@
+"""
+CPU budget for jobs running in the worker pool.
+
+Each job gets an equal share of the cores the server may use (``JOB_CPU_CORES``, or
+every core the process is allowed to run on). The share is decided when the job starts,
+from the number of queued and running jobs in the jobs table — which every worker
+process sees — capped at ``JOB_WORKERS`` since no more than that can run at once. A job
+alone on the box gets all cores; with a full pool each gets ``cores / JOB_WORKERS``.
+
+Inside ``cpu_budget`` the BLAS / OpenMP thread pools of the worker are limited to the
+share and ``current_cores()`` returns it, so code building estimators can set ``n_jobs``
+without being handed the budget explicitly. Outside a budget (e.g. in the web process)
+``current_cores()`` is None and nothing is changed.
+"""
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy.orm import Session
+
+from src.common.config import settings
+from src.modules.job.schema import JobStatus
+from src.modules.job.store import Job
+
+_current: ContextVar[int | None] = ContextVar("cpu_budget", default=None)
+
+
+def available_cores() -> int:
+    """Cores the server may spread jobs over."""
+    if settings.JOB_CPU_CORES > 0:
+        return settings.JOB_CPU_CORES
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def cores_for_job(db: Session) -> int:
+    """This job's share of the cores, given the jobs currently in flight (itself included)."""
+    in_flight = db.query(Job).filter(Job.status.in_(JobStatus.ACTIVE)).count()
+    sharing = min(max(1, in_flight), max(1, settings.JOB_WORKERS))
+    return max(1, available_cores() // sharing)
+
+
+def current_cores() -> int | None:
+    """Cores granted to the job running in this process, or None outside a budget."""
+    return _current.get()
+
+
+@contextmanager
+def cpu_budget(cores: int) -> Iterator[int]:
+    """Limit native thread pools to ``cores`` and expose the budget via ``current_cores``."""
+    # threadpoolctl ships with scikit-learn
+    from threadpoolctl import threadpool_limits
+
+    token = _current.set(cores)
+    try:
+        with threadpool_limits(limits=cores):
+            yield cores
+    finally:
+        _current.reset(token)
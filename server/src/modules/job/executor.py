@@ -0,0 +1,82 @@
+"""
+Process pool that runs long jobs (training, scoring, …) outside the web process.
+
+Workers are started with the ``spawn`` method so they never inherit the server's
+threads, sockets or pooled DB connections. Each task is handed the job id and is
+responsible for recording its own progress and outcome in the jobs table; the
+done-callback below only covers workers that die before they can do so.
+"""
+
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any
+from uuid import UUID
+
+from loguru import logger
+
+from src.common.config import settings
+from src.common.db.session import SessionLocal
+
+_executor: ProcessPoolExecutor | None = None
+_lock = threading.Lock()
+
+
+def get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=max(1, settings.JOB_WORKERS),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def submit_job(job_id: UUID, fn: Callable[..., Any], *args: Any) -> Future:
+    """Run ``fn(job_id, *args)`` in a worker process."""
+    try:
+        future = get_executor().submit(fn, str(job_id), *args)
+    except BrokenProcessPool:
+        _reset_executor()
+        future = get_executor().submit(fn, str(job_id), *args)
+    future.add_done_callback(partial(_on_job_done, job_id))
+    return future
+
+
+def shutdown_executor(wait: bool = False) -> None:
+    global _executor
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait, cancel_futures=True)
+            _executor = None
+
+
+def _reset_executor() -> None:
+    global _executor
+    with _lock:
+        _executor = None
+
+
+def _on_job_done(job_id: UUID, future: Future) -> None:
+    if future.cancelled():
+        error = "Cancelled during server shutdown"
+    elif future.exception() is not None:
+        error = f"Worker process failed: {future.exception()}"
+        if isinstance(future.exception(), BrokenProcessPool):
+            _reset_executor()
+    else:
+        return
+
+    from src.modules.job.service import JobService
+
+    db = SessionLocal()
+    try:
+        JobService().mark_failed(db=db, job_id=job_id, error=error)
+    except Exception as e:
+        logger.exception(e)
+    finally:
+        db.close()
@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class JobStatus:
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+    ACTIVE = (QUEUED, RUNNING)
+
+
+class JobResponse(BaseModel):
+    id: UUID
+    kind: str
+    status: str
+    progress: float
+    message: str | None = None
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+
+class JobSubmitResponse(JobResponse):
+    detail: str
@@ -0,0 +1,123 @@
+import os
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from src.common.logging.logger import log_execution
+from src.modules.job.schema import JobResponse, JobStatus
+from src.modules.job.store import Job, JobRepository
+
+
+def _pid_alive(pid: int | None) -> bool:
+    if not pid:
+        return False
+    if os.name == "nt":
+        # os.kill(pid, 0) would send CTRL_C_EVENT on Windows — assume the owner is gone
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobService:
+    def __init__(self):
+        self.repo = JobRepository()
+
+    @log_execution
+    def create_job(self, db: Session, kind: str, payload: dict, user_id: UUID) -> Job:
+        return self.repo.create(
+            db=db,
+            obj_in={
+                "kind": kind,
+                "status": JobStatus.QUEUED,
+                "progress": 0.0,
+                "message": "Queued",
+                "payload": payload,
+                "owner_pid": os.getpid(),
+                "user_id": user_id,
+            },
+        )
+
+    @log_execution
+    def get_job(self, db: Session, job_id: UUID, user_id: UUID) -> JobResponse:
+        job = self.repo.get_by_id(db=db, id=job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        if job.user_id != user_id:
+            raise HTTPException(status_code=403, detail="Not authorized")
+        return JobResponse.model_validate(job, from_attributes=True)
+
+    def mark_running(self, db: Session, job_id: UUID) -> Job:
+        return self._update(
+            db,
+            job_id,
+            {
+                "status": JobStatus.RUNNING,
+                "message": "Started",
+                "started_at": datetime.now(timezone.utc),
+            },
+        )
+
+    def update_progress(
+        self, db: Session, job_id: UUID, progress: float, message: str | None = None
+    ) -> Job:
+        """Record how far a running job has got. ``progress`` is a fraction 0-1."""
+        return self._update(
+            db, job_id, {"progress": max(0.0, min(1.0, float(progress))), "message": message}
+        )
+
+    def mark_completed(self, db: Session, job_id: UUID, result: dict[str, Any]) -> Job:
+        return self._update(
+            db,
+            job_id,
+            {
+                "status": JobStatus.COMPLETED,
+                "progress": 1.0,
+                "message": "Completed",
+                "result": result,
+                "finished_at": datetime.now(timezone.utc),
+            },
+        )
+
+    def mark_failed(self, db: Session, job_id: UUID, error: str) -> Job:
+        return self._update(
+            db,
+            job_id,
+            {
+                "status": JobStatus.FAILED,
+                "message": "Failed",
+                "error": error,
+                "finished_at": datetime.now(timezone.utc),
+            },
+        )
+
+    @log_execution
+    def fail_orphaned_jobs(self, db: Session) -> int:
+        """
+        Fail queued/running jobs whose submitting process is gone (e.g. after a restart).
+        Their worker pool died with that process, so they would otherwise stay active forever.
+        """
+        orphaned = [
+            job
+            for job in db.query(Job).filter(Job.status.in_(JobStatus.ACTIVE)).all()
+            if not _pid_alive(job.owner_pid)
+        ]
+        for job in orphaned:
+            job.status = JobStatus.FAILED
+            job.error = "Interrupted by server restart"
+            job.finished_at = datetime.now(timezone.utc)
+        db.commit()
+        return len(orphaned)
+
+    def _update(self, db: Session, job_id: UUID, values: dict[str, Any]) -> Job:
+        job = self.repo.get_by_id(db=db, id=UUID(str(job_id)))
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return self.repo.update(db=db, db_obj=job, obj_in=values)
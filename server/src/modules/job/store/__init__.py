@@ -0,0 +1,4 @@
+from src.modules.job.store.model import Job
+from src.modules.job.store.repository import JobRepository
+
+__all__ = ["Job", "JobRepository"]
@@ -0,0 +1,7 @@
+from src.common.repository.base import BaseRepository
+from src.modules.job.store.model import Job
+
+
+class JobRepository(BaseRepository):
+    def __init__(self):
+        super().__init__(Job)
@@ -7,8 +7,12 @@ from src.common.db.session import get_db
 from src.modules.auth.schema import AuthToken
 from src.modules.auth.service import AuthService
 from src.modules.ml_model.schema import (
+    AutoMLRequest,
+    BatchPredictRequest,
     CreateMLModelRequest,
     PredictRequest,
+    ScoreDatasetRequest,
+    SearchModelRequest,
     TrainModelRequest,
     UpdateModelMetaRequest,
 )
@@ -21,14 +25,80 @@ ml_model_service = MLModelService()
 auth_service = AuthService()
 
 
-@router.post("/ml_model/train")
+@router.post("/ml_model/train", status_code=202)
 def train_model(
     request: Request,
     data: TrainModelRequest,
     db: Session = Depends(get_db),
     token_payload: AuthToken = Depends(auth_service.security_service.verify_auth_token),
 ):
-    return ml_model_service.train_model(db=db, data=data, user_id=token_payload.id)
+    """Queue a training job. Poll /ml_model/jobs/{job_id} for progress and the result."""
+    return ml_model_service.submit_training(db=db, data=data, user_id=token_payload.id)
+
+
+@router.post("/ml_model/search", status_code=202)
+def search_model(
+    request: Request,
+    data: SearchModelRequest,
+    db: Session = Depends(get_db),
+    token_payload: AuthToken = Depends(auth_service.security_service.verify_auth_token),
+):
+    """Queue a hyperparameter search. The job result holds the best model and a leaderboard."""
+    return ml_model_service.submit_search(db=db, data=data, user_id=token_payload.id)
+
+
+@router.post("/ml_model/automl", status_code=202)
+def automl(
+    request: Request,
+    data: AutoMLRequest,
+    db: Session = Depends(get_db),
+    token_payload: AuthToken = Depends(auth_service.security_service.verify_auth_token),
+):
+    """Queue an AutoML comparison. The job result holds the ranked leaderboard."""
+    return ml_model_service.submit_automl(db=db, data=data, user_id=token_payload.id)
+
+
+@router.post("/ml_model/{model_id}/score", status_code=202)
+def score_dataset(
+    request: Request,
+    model_id: UUID,
+    data: ScoreDatasetRequest,
+    db: Session = Depends(get_db),
+    token_payload: AuthToken = Depends(auth_service.security_service.verify_auth_token),
+):
+    """Queue bulk scoring of a dataset. The job result holds the id of the result file."""
+    return ml_model_service.submit_scoring(
+        db=db, model_id=model_id, data=data, user_id=token_payload.id
+    )
+
+
+@router.get("/ml_model/jobs/{job_id}")
+def get_job(
+    request: Request,
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    token_payload: AuthToken = Depends(auth_service.security_service.verify_auth_token),
+):
+    """Return status, progress and — once completed — the result of a background job."""
+    return ml_model_service.get_job(db=db, job_id=job_id, user_id=token_payload.id)
+
+
+@router.get("/ml_model/cache/stats")
+def get_cache_stats(
+    request: Request,
+    token_payload: AuthToken = Depends(auth_service.security_service.verify_auth_token),
+):
+    """Loaded-model cache occupancy and hit/miss counters, plus predict coalescer stats."""
+    return ml_model_service.get_cache_stats()
+
+
+@router.get("/ml_model/algorithms")
+def get_algorithms(
+    request: Request,
+    token_payload: AuthToken = Depends(auth_service.security_service.verify_auth_token),
+):
+    """Registered algorithms with their task type, aliases and capabilities."""
+    return ml_model_service.get_algorithms()
 
 
 @router.get("/ml_model/hyperparameters/{algorithm}")
@@ -64,7 +134,21 @@ def predict(
     return ml_model_service.predict(db=db, model_id=model_id, data=data, user_id=token_payload.id)
 
 
-@router.post("/ml_model/{model_id}/retrain")
+@router.post("/ml_model/{model_id}/predict/batch")
+def predict_batch(
+    request: Request,
+    model_id: UUID,
+    data: BatchPredictRequest,
+    db: Session = Depends(get_db),
+    token_payload: AuthToken = Depends(auth_service.security_service.verify_auth_token),
+):
+    """Run inference on many rows at once (list of records or column arrays)."""
+    return ml_model_service.predict_batch(
+        db=db, model_id=model_id, data=data, user_id=token_payload.id
+    )
+
+
+@router.post("/ml_model/{model_id}/retrain", status_code=202)
 def retrain_model(
     request: Request,
     model_id: UUID,
@@ -72,8 +156,9 @@ def retrain_model(
     db: Session = Depends(get_db),
     token_payload: AuthToken = Depends(auth_service.security_service.verify_auth_token),
 ):
-    return ml_model_service.retrain_model(
-        db=db, model_id=model_id, data=data, user_id=token_payload.id
+    """Queue a retraining job that creates a new version of the model."""
+    return ml_model_service.submit_training(
+        db=db, data=data, user_id=token_payload.id, model_id=model_id
     )
 
 
@@ -98,6 +183,28 @@ def get_model(
     return ml_model_service.get_model(db=db, model_id=model_id)
 
 
+@router.get("/ml_model/{model_id}/telemetry")
+def get_model_telemetry(
+    request: Request,
+    model_id: UUID,
+    db: Session = Depends(get_db),
+    token_payload: AuthToken = Depends(auth_service.security_service.verify_auth_token),
+):
+    """Wall time per stage, CPU time, peak memory and data size of the training run."""
+    return ml_model_service.get_model_telemetry(db=db, model_id=model_id, user_id=token_payload.id)
+
+
+@router.get("/ml_model/{model_id}/report")
+def get_model_report(
+    request: Request,
+    model_id: UUID,
+    db: Session = Depends(get_db),
+    token_payload: AuthToken = Depends(auth_service.security_service.verify_auth_token),
+):
+    """Held-out evaluation computed at training time: metrics, curves, importances."""
+    return ml_model_service.get_model_report(db=db, model_id=model_id, user_id=token_payload.id)
+
+
 @router.get("/ml_model/{model_id}/versions")
 def get_model_versions(
     request: Request,
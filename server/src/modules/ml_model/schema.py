@@ -1,7 +1,15 @@
-from typing import Any
+from typing import Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
+
+
+class InputColumn(BaseModel):
+    """One model feature, in training order (see utils.input_schema)."""
+
+    name: str
+    dtype: str | None = None  # integer | float | boolean | category | string
+    categories: list[Any] | None = None
 
 
 class MLModelBase(BaseModel):
@@ -10,12 +18,38 @@ class MLModelBase(BaseModel):
     version: str
     description: str
     model_type: str
-    inputs: str
+    inputs: list[InputColumn]
     outputs: str
     accuracy: float
     error: float
     file_id: UUID
     parent_id: UUID | None = None
+    cpu_cores: int | None = None  # cores the training job was budgeted
+    cv_folds: int | None = None  # set when accuracy is a cross-validated mean
+    accuracy_std: float | None = None
+    artifact_mmap: bool = False  # predict memory-maps the artifact's arrays
+
+
+class ModelTelemetryResponse(BaseModel):
+    """Resources used by the training run that produced a model."""
+
+    model_id: UUID
+    kind: str = "train"  # "search" / "automl": the whole multi-candidate run
+    load_seconds: float
+    split_seconds: float
+    fit_seconds: float
+    score_seconds: float
+    save_seconds: float
+    total_seconds: float
+    cpu_seconds: float
+    peak_rss_bytes: int | None = None
+    rows: int | None = None
+    columns: int | None = None
+    frame_bytes_before: int | None = None
+    frame_bytes_after: int | None = None
+    artifact_bytes: int | None = None
+    reuse_count: int = 0  # requests answered with this model's artifact
+    reused_from_id: UUID | None = None
 
 
 class CreateMLModelRequest(BaseModel):
@@ -23,7 +57,7 @@ class CreateMLModelRequest(BaseModel):
     version: str
     description: str
     model_type: str
-    inputs: str
+    inputs: str  # JSON list of feature names or an input schema
     outputs: str
     accuracy: float
     error: float
@@ -41,6 +75,65 @@ class TrainModelRequest(BaseModel):
     hyperparameters: dict = {}
     name: str | None = None  # custom model name; defaults to "<algo> Model"
     description: str | None = None  # custom description; defaults to auto-generated
+    # Out-of-core training with partial_fit on streamed chunks (incremental estimators only)
+    streaming: bool = False
+    validation_fraction: float = Field(default=0.2, gt=0.0, lt=1.0)  # streamed holdout
+    epochs: int = Field(default=1, ge=1, le=50)  # passes over the file when streaming
+    # Retrain only: continue from the parent estimator instead of fitting from scratch
+    warm_start: bool = False
+    add_estimators: int | None = Field(default=None, ge=1)  # ensembles; default +10%
+    # Return an identical earlier model (same data, features, params) instead of refitting
+    reuse_cached: bool = True
+    # Score by k-fold cross-validation (stratified for classifiers) instead of one split;
+    # the saved model is then refitted on every row
+    cv_folds: int | None = Field(default=None, ge=2, le=20)
+    # Store imputation, encoding and scaling (plus a lazy version's recipe) in the model, so
+    # predict takes the raw column values
+    pipeline: bool = False
+
+
+class SearchModelRequest(TrainModelRequest):
+    """
+    Tune ``model_algorithm`` over the ranges in its hyperparameter schema.
+    ``hyperparameters`` are held fixed; ``search_params`` limits which parameters are
+    searched and ``search_space`` gives explicit candidate values for any of them.
+    """
+
+    strategy: Literal["grid", "random", "halving"] = "random"
+    max_trials: int = Field(default=20, ge=1, le=500)
+    grid_points: int = Field(default=3, ge=2, le=10)  # values per numeric param (grid)
+    search_params: list[str] | None = None
+    search_space: dict[str, list[Any]] | None = None
+
+
+class ScoreDatasetRequest(BaseModel):
+    """
+    Score every row of a dataset with a model. The result file holds ``include_columns``
+    (e.g. an id) copied from the dataset, ``prediction`` and, for classifiers with
+    probabilities, one ``proba_<class>`` column per class.
+    """
+
+    dataset_id: UUID
+    format: Literal["csv", "parquet"] = "csv"
+    include_columns: list[str] = []
+    name: str | None = None  # result file name; defaults to "<model>_<dataset>_scores"
+
+
+class AutoMLRequest(BaseModel):
+    """
+    Compare several algorithms on one load and split of the dataset. ``algorithms`` takes
+    registry names or aliases, plus ``"all_classifiers"`` / ``"all_regressors"``;
+    ``hyperparameters`` optionally maps an algorithm to fixed parameters for it.
+    """
+
+    dataset_id: UUID
+    target_column: str
+    features: list[str] | None = None
+    algorithms: list[str] = Field(min_length=1)
+    hyperparameters: dict[str, dict] = {}
+    time_budget_seconds: float = Field(default=300.0, gt=0.0, le=86_400.0)  # per candidate
+    keep_top: int = Field(default=1, ge=0, le=20)  # best candidates saved as models
+    name: str | None = None  # prefix of saved model names
 
 
 class TrainModelResponse(MLModelBase):
@@ -67,3 +160,32 @@ class PredictResponse(BaseModel):
     target: str
     predictions: list[Any]
     probabilities: list[dict[str, float]] | None = None
+
+
+class BatchPredictRequest(BaseModel):
+    """
+    Provide exactly one of:
+      records: list of row dicts, e.g. [{"sepal_length": 5.1, "sepal_width": 3.5}, ...]
+      columns: feature name → list of values, e.g. {"sepal_length": [5.1, 4.9], ...}
+    """
+
+    records: list[dict[str, Any]] | None = None
+    columns: dict[str, list[Any]] | None = None
+
+    @model_validator(mode="after")
+    def exactly_one_payload(self) -> "BatchPredictRequest":
+        if (self.records is None) == (self.columns is None):
+            raise ValueError("Provide exactly one of 'records' or 'columns'")
+        return self
+
+
+class BatchPredictResponse(BaseModel):
+    """predictions[i] and probabilities[i] belong to input row i; probabilities follow classes."""
+
+    model_id: str
+    model_type: str
+    target: str
+    count: int
+    predictions: list[Any]
+    classes: list[str] | None = None
+    probabilities: list[list[float]] | None = None
@@ -1,25 +1,71 @@
-import ast
 import json
 import os
+from collections.abc import Callable
+from functools import partial
 from uuid import UUID, uuid4
 
 import joblib
 import pandas as pd
 from fastapi import HTTPException, UploadFile
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 
+from src.common.config import settings
 from src.common.logging.logger import log_execution
 from src.modules.dataset.service import DatasetService
+from src.modules.dataset.utils.columnar import estimate_chunk_rows, iter_chunks
 from src.modules.file import FileService
+from src.modules.job import JobService
+from src.modules.job.cpu_budget import available_cores, current_cores
+from src.modules.job.executor import submit_job
+from src.modules.job.schema import JobResponse, JobSubmitResponse
 from src.modules.ml_model.schema import (
+    AutoMLRequest,
+    BatchPredictRequest,
+    BatchPredictResponse,
     CreateMLModelRequest,
     CreateMLModelResponse,
+    ModelTelemetryResponse,
     PredictRequest,
     PredictResponse,
+    ScoreDatasetRequest,
+    SearchModelRequest,
     TrainModelRequest,
 )
-from src.modules.ml_model.store import MLModelRepository
+from src.modules.ml_model.store import MLModel, MLModelRepository, ModelTelemetryRepository
+from src.modules.ml_model.tasks import (
+    run_automl_job,
+    run_scoring_job,
+    run_search_job,
+    run_training_job,
+)
+from src.modules.ml_model.utils.artifacts import load_artifact, save_artifact
+from src.modules.ml_model.utils.automl import Candidate, rank, run_candidates
+from src.modules.ml_model.utils.coalescer import predict_coalescer
+from src.modules.ml_model.utils.evaluation import evaluation_report, report_path, write_report
+from src.modules.ml_model.utils.fingerprint import file_digest, training_fingerprint
+from src.modules.ml_model.utils.folds import can_stratify, fold_assignments, fold_indices
+from src.modules.ml_model.utils.frames import memory_bytes, prepare_training_frame, split_frame
+from src.modules.ml_model.utils.input_schema import (
+    InputError,
+    InputValidator,
+    describe_columns,
+    input_validator,
+    normalize_inputs,
+)
+from src.modules.ml_model.utils.model_cache import model_cache
+from src.modules.ml_model.utils.preprocessing import build_pipeline, final_estimator, preprocessor
+from src.modules.ml_model.utils.registry import registry
+from src.modules.ml_model.utils.scoring import ResultWriter, score_chunk
+from src.modules.ml_model.utils.search import (
+    build_search_space,
+    describe_error,
+    leaderboard,
+    run_search,
+)
+from src.modules.ml_model.utils.streaming import collect_classes, stream_fit, stream_score
+from src.modules.ml_model.utils.telemetry import current_run, note, phase, recorded
 from src.modules.user.service import UserService
 
 
@@ -27,195 +73,988 @@ class MLModelService:
     def __init__(self):
         self.user_service = UserService()
         self.file_service = FileService(dir="/uploads/models")
+        self.results_file_service = FileService(dir="/uploads/predictions")
         self.dataset_service = DatasetService()
         self.repo = MLModelRepository()
+        self.telemetry_repo = ModelTelemetryRepository()
+        self.job_service = JobService()
 
     @log_execution
-    def train_model(self, db: Session, data: TrainModelRequest, user_id: UUID):
-        dataset = self.dataset_service.get_dataset(db=db, dataset_id=data.dataset_id)
-        if not dataset:
+    def submit_training(
+        self,
+        db: Session,
+        data: TrainModelRequest,
+        user_id: UUID,
+        model_id: UUID | None = None,
+    ) -> JobSubmitResponse:
+        """Queue a train (or, with ``model_id``, retrain) job and return immediately."""
+        if not self.dataset_service.get_dataset(db=db, dataset_id=data.dataset_id):
             raise HTTPException(status_code=404, detail="Dataset not found")
+        if model_id is not None and not self.get_model(db=db, model_id=model_id):
+            raise HTTPException(status_code=404, detail="Parent model not found")
+        if model_id is None and data.warm_start:
+            raise HTTPException(status_code=400, detail="warm_start applies to retraining only")
+        if data.pipeline and data.streaming:
+            raise HTTPException(status_code=400, detail="pipeline does not support streaming")
+        if data.cv_folds and (data.streaming or data.warm_start):
+            raise HTTPException(
+                status_code=400, detail="cv_folds does not support streaming or warm_start"
+            )
 
-        file = self.file_service.get_file_by_id(db=db, id=dataset.file_id)
-        if not file:
-            raise HTTPException(status_code=404, detail="Dataset file not found")
+        # Fingerprinting hashes the dataset file, so it happens in the job (run_training)
+        job = self.job_service.create_job(
+            db=db,
+            kind="retrain" if model_id else "train",
+            payload=jsonable_encoder({"request": data, "model_id": model_id}),
+            user_id=user_id,
+        )
+        submit_job(
+            job.id,
+            run_training_job,
+            str(user_id),
+            data.model_dump(mode="json"),
+            str(model_id) if model_id else None,
+        )
+        return JobSubmitResponse(
+            **JobResponse.model_validate(job, from_attributes=True).model_dump(),
+            detail="Training job queued",
+        )
 
-        file_location = file.location
-        if not os.path.exists(file_location):
-            # Try to resolve relative to current dir
-            file_location = os.path.join(os.getcwd(), file_location.lstrip("/"))
-            if not os.path.exists(file_location):
-                raise HTTPException(
-                    status_code=404, detail=f"File not found on disk: {file.location}"
-                )
+    @log_execution
+    def submit_search(
+        self, db: Session, data: SearchModelRequest, user_id: UUID
+    ) -> JobSubmitResponse:
+        """Queue a hyperparameter search job and return immediately."""
+        if data.streaming:
+            raise HTTPException(status_code=400, detail="Search does not support streaming")
+        if data.pipeline:
+            raise HTTPException(status_code=400, detail="Search does not support pipeline")
+        if data.cv_folds:
+            raise HTTPException(status_code=400, detail="Search does not support cv_folds")
+        if not self.dataset_service.get_dataset(db=db, dataset_id=data.dataset_id):
+            raise HTTPException(status_code=404, detail="Dataset not found")
+        # Fail fast on an unknown algorithm or an empty search space
+        self._search_space(data)
 
-        if file.file_type == "csv":
-            df = pd.read_csv(file_location)
-        elif file.file_type in ["xls", "xlsx"]:
-            df = pd.read_excel(file_location)
-        else:
-            raise HTTPException(status_code=400, detail="Unsupported dataset format")
+        job = self.job_service.create_job(
+            db=db,
+            kind="search",
+            payload=jsonable_encoder({"request": data}),
+            user_id=user_id,
+        )
+        submit_job(job.id, run_search_job, str(user_id), data.model_dump(mode="json"))
+        return JobSubmitResponse(
+            **JobResponse.model_validate(job, from_attributes=True).model_dump(),
+            detail="Hyperparameter search queued",
+        )
 
-        if data.target_column not in df.columns:
-            raise HTTPException(status_code=400, detail="Target column not found in dataset")
+    @log_execution
+    def submit_automl(self, db: Session, data: AutoMLRequest, user_id: UUID) -> JobSubmitResponse:
+        """Queue an AutoML comparison job and return immediately."""
+        if not self.dataset_service.get_dataset(db=db, dataset_id=data.dataset_id):
+            raise HTTPException(status_code=404, detail="Dataset not found")
+        self._automl_candidates(data)
 
-        if data.features:
-            missing_features = [f for f in data.features if f not in df.columns]
-            if missing_features:
-                raise HTTPException(
-                    status_code=400, detail=f"Features not found: {missing_features}"
-                )
-            X = df[data.features]
-        else:
-            X = df.drop(columns=[data.target_column])
+        job = self.job_service.create_job(
+            db=db,
+            kind="automl",
+            payload=jsonable_encoder({"request": data}),
+            user_id=user_id,
+        )
+        submit_job(job.id, run_automl_job, str(user_id), data.model_dump(mode="json"))
+        return JobSubmitResponse(
+            **JobResponse.model_validate(job, from_attributes=True).model_dump(),
+            detail="AutoML job queued",
+        )
 
-        # Drop rows with NaNs in targets or features for simplicity
-        df = pd.concat([X, df[data.target_column]], axis=1).dropna()
-        y = df[data.target_column]
-        X = df.drop(columns=[data.target_column])
+    @log_execution
+    def submit_scoring(
+        self, db: Session, model_id: UUID, data: ScoreDatasetRequest, user_id: UUID
+    ) -> JobSubmitResponse:
+        """Queue a bulk scoring job and return immediately."""
+        self._get_owned_model(db=db, model_id=model_id, user_id=user_id)
+        self._scoring_dataset(db, data)
+
+        job = self.job_service.create_job(
+            db=db,
+            kind="score",
+            payload=jsonable_encoder({"request": data, "model_id": model_id}),
+            user_id=user_id,
+        )
+        submit_job(
+            job.id, run_scoring_job, str(user_id), str(model_id), data.model_dump(mode="json")
+        )
+        return JobSubmitResponse(
+            **JobResponse.model_validate(job, from_attributes=True).model_dump(),
+            detail="Scoring job queued",
+        )
 
-        try:
-            from sklearn.model_selection import train_test_split
+    @log_execution
+    def get_job(self, db: Session, job_id: UUID, user_id: UUID) -> JobResponse:
+        return self.job_service.get_job(db=db, job_id=job_id, user_id=user_id)
 
-            X_train, X_test, y_train, y_test = train_test_split(
-                X, y, test_size=0.2, random_state=42
+    @log_execution
+    @recorded
+    def train_model(
+        self,
+        db: Session,
+        data: TrainModelRequest,
+        user_id: UUID,
+        progress: Callable[[float, str], None] | None = None,
+        fingerprint: str | None = None,
+    ):
+        progress = progress or (lambda fraction, message: None)
+        if data.streaming:
+            return self._train_streaming(db, data, user_id, progress, fingerprint=fingerprint)
+        if data.cv_folds:
+            return self._train_cross_validated(db, data, user_id, progress, fingerprint)
+        X_train, X_test, y_train, y_test = self._load_training_data(db, data, progress)
+
+        model = self._build_estimator(
+            data.model_algorithm, self._coerce_hyperparameters(data.hyperparameters)
+        )
+        if data.pipeline:
+            dataset = self.dataset_service.get_dataset(db=db, dataset_id=data.dataset_id)
+            model = build_pipeline(
+                model,
+                X_train,
+                recipe=dataset.recipe,
+                trees=registry.get(data.model_algorithm).float32,
             )
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error in data split: {str(e)}") from e
 
-        model = None
-        algo = data.model_algorithm.lower()
+        progress(0.3, "Fitting model")
+        try:
+            with phase("fit"):
+                model.fit(X_train, y_train)
+            progress(0.8, "Scoring model")
+            with phase("score"):
+                accuracy = model.score(X_test, y_test)
+                report = evaluation_report(model, X_test, y_test)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error during training: {str(e)}") from e
 
-        # ── Coerce hyperparameter types ──────────────────────────────────────
-        # The frontend may send everything as strings (e.g. select inputs).
-        # Convert "None"→None, integer strings→int, float strings→float.
-        safe_params: dict = {}
-        for k, v in data.hyperparameters.items():
-            if v == "None" or v is None:
-                continue  # omit — let sklearn use its own default
-            if isinstance(v, str):
-                # try int first, then float, then keep as string
-                try:
-                    safe_params[k] = int(v)
-                    continue
-                except ValueError:
-                    pass
-                try:
-                    safe_params[k] = float(v)
-                    continue
-                except ValueError:
-                    pass
-            safe_params[k] = v
+        progress(0.9, "Saving model")
+        return self._save_trained_model(
+            db, model, data, describe_columns(X_train), accuracy, user_id, fingerprint, report
+        )
 
-        if algo in ["random_forest_classifier", "randomforestclassifier", "random_forest"]:
-            from sklearn.ensemble import RandomForestClassifier
+    def _train_cross_validated(
+        self,
+        db: Session,
+        data: TrainModelRequest,
+        user_id: UUID,
+        progress: Callable[[float, str], None],
+        fingerprint: str | None = None,
+    ) -> dict:
+        """
+        Score by k-fold cross-validation, the folds fitted in parallel worker processes on
+        the job's CPU budget, then refit on every row and save that model with the mean
+        and standard deviation of the fold scores. Fold assignments are cached per
+        dataset (see utils.folds).
+        """
+        import numpy as np
+        from sklearn.base import is_classifier
+        from sklearn.model_selection import cross_validate
+
+        X, y = self._load_training_data(db, data, progress, split=False)
+        params = self._coerce_hyperparameters(data.hyperparameters)
+        algo = registry.get(data.model_algorithm)
+        dataset = self.dataset_service.get_dataset(db=db, dataset_id=data.dataset_id)
 
-            model = RandomForestClassifier(**safe_params)
+        def estimator(n_jobs: int | None = None):
+            model = self._build_estimator(data.model_algorithm, params, n_jobs=n_jobs)
+            if data.pipeline:
+                model = build_pipeline(model, X, recipe=dataset.recipe, trees=algo.float32)
+            return model
 
-        elif algo in ["random_forest_regressor", "randomforestregressor"]:
-            from sklearn.ensemble import RandomForestRegressor
+        model = estimator()
+        stratified = is_classifier(model) and can_stratify(y, data.cv_folds)
+        with phase("split"):
+            try:
+                _, loc = self.dataset_service._get_dataset_file(db, dataset.file_id)
+                key = (
+                    file_digest(loc),
+                    json.dumps(dataset.recipe, sort_keys=True),
+                    tuple(X.columns),
+                    data.target_column,
+                    data.pipeline,
+                )
+            except HTTPException:
+                key = None
+            folds = fold_indices(fold_assignments(key, y, data.cv_folds, stratified))
 
-            model = RandomForestRegressor(**safe_params)
+        # Folds run side by side; each gets an equal share of the budget
+        cores = current_cores() or available_cores()
+        parallel = max(1, min(data.cv_folds, cores))
+        progress(0.3, f"Cross-validating {data.cv_folds} folds")
+        try:
+            with phase("fit"):
+                cv = cross_validate(
+                    estimator(n_jobs=max(1, cores // parallel)),
+                    X,
+                    y,
+                    cv=folds,
+                    n_jobs=parallel,
+                    error_score="raise",
+                )
+            progress(0.7, "Fitting model on all rows")
+            with phase("fit"):
+                model.fit(X, y)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Error during training: {describe_error(e)}"
+            ) from e
+
+        scores = cv["test_score"]
+        summary = {
+            "folds": data.cv_folds,
+            "stratified": stratified,
+            "mean": round(float(np.mean(scores)), 6),
+            "std": round(float(np.std(scores)), 6),
+            "scores": [round(float(v), 6) for v in scores],
+            "fit_seconds": [round(float(v), 4) for v in cv["fit_time"]],
+            "score_seconds": [round(float(v), 4) for v in cv["score_time"]],
+        }
+        progress(0.9, "Saving model")
+        res = self._save_trained_model(
+            db,
+            model,
+            data,
+            describe_columns(X),
+            float(np.mean(scores)),
+            user_id,
+            fingerprint,
+            {"task": "cross_validation", "cross_validation": summary},
+            accuracy_std=float(np.std(scores)),
+        )
+        res["cross_validation"] = summary
+        return res
 
-        elif algo in ["logistic_regression", "logisticregression"]:
-            from sklearn.linear_model import LogisticRegression
+    @log_execution
+    def score_dataset(
+        self,
+        db: Session,
+        model_id: UUID,
+        data: ScoreDatasetRequest,
+        user_id: UUID,
+        progress: Callable[[float, str], None] | None = None,
+    ) -> dict:
+        """
+        Stream a dataset file through a model in chunks of STREAM_CHUNK_MB and append the
+        predictions to a new CSV / Parquet file (see utils.scoring); memory use does not
+        grow with the dataset. The result file is registered like any other file.
+        """
+        progress = progress or (lambda fraction, message: None)
+        model_record = self._get_owned_model(db=db, model_id=model_id, user_id=user_id)
+        dataset = self._scoring_dataset(db, data)
+        validator = self._input_validator(model_record)
+        available = self.dataset_service._get_columns(db=db, file_id=dataset.file_id)
+        missing = [c for c in validator.names if c not in available]
+        if missing:
+            raise HTTPException(
+                status_code=400, detail=f"Dataset is missing model feature(s): {missing}"
+            )
 
-            model = LogisticRegression(**safe_params)
+        progress(0.02, "Loading model")
+        sklearn_model = self._load_estimator(db=db, model_record=model_record)
+        impute = preprocessor(sklearn_model) is not None
 
-        elif algo in ["linear_regression", "linearregression"]:
-            from sklearn.linear_model import LinearRegression
+        file, loc = self.dataset_service._get_dataset_file(db, dataset.file_id)
+        chunk_rows = estimate_chunk_rows(
+            loc, file.file_type, max_bytes=settings.STREAM_CHUNK_MB * 1024 * 1024
+        )
+        columns = list(dict.fromkeys([*validator.names, *data.include_columns]))
 
-            model = LinearRegression(**safe_params)
+        name = data.name or f"{model_record.name}_{dataset.name}_scores".replace(" ", "_")
+        filename = f"{name}_{uuid4().hex[:8]}.{data.format}"
+        upload_dir = self.results_file_service.dir.lstrip("/")
+        os.makedirs(upload_dir, exist_ok=True)
+        path = os.path.join(upload_dir, filename)
 
-        elif algo in ["ridge", "ridge_regression"]:
-            from sklearn.linear_model import Ridge
+        total = max(dataset.rows or 0, 1)
+        rows = scored = 0
+        writer = ResultWriter(path, data.format)
+        try:
+            for chunk in iter_chunks(loc, file.file_type, chunk_rows, columns=columns):
+                X = self._validated_frame(validator.frame, chunk)
+                out, n_scored = score_chunk(
+                    chunk,
+                    X,
+                    lambda rows_: self._infer(sklearn_model, rows_),
+                    data.include_columns,
+                    impute,
+                )
+                writer.write(out)
+                rows += len(chunk)
+                scored += n_scored
+                progress(0.05 + 0.9 * min(rows / total, 1.0), f"Scored {rows} rows")
+            writer.close()
+        except Exception as e:
+            writer.close()
+            os.remove(path)
+            if isinstance(e, HTTPException):
+                raise
+            raise HTTPException(status_code=500, detail=f"Error during scoring: {e}") from e
 
-            model = Ridge(**safe_params)
+        file_obj = self.results_file_service.repo.create(
+            db=db,
+            obj_in={
+                "name": filename,
+                "size": str(os.path.getsize(path)),
+                "location": path,
+                "file_type": data.format,
+                "category": "predictions",
+                "user_id": user_id,
+            },
+        )
+        return {
+            "detail": "Scoring completed",
+            "file_id": file_obj.id,
+            "name": filename,
+            "format": data.format,
+            "model_id": model_id,
+            "dataset_id": dataset.id,
+            "rows": rows,
+            "scored_rows": scored,
+        }
 
-        elif algo in ["lasso", "lasso_regression"]:
-            from sklearn.linear_model import Lasso
+    def _scoring_dataset(self, db: Session, data: ScoreDatasetRequest):
+        dataset = self.dataset_service.get_dataset(db=db, dataset_id=data.dataset_id)
+        if not dataset:
+            raise HTTPException(status_code=404, detail="Dataset not found")
+        if dataset.recipe:
+            raise HTTPException(
+                status_code=400,
+                detail="Scoring needs a materialized dataset version (not lazy)",
+            )
+        if data.include_columns:
+            available = self.dataset_service._get_columns(db=db, file_id=dataset.file_id)
+            unknown = [c for c in data.include_columns if c not in available]
+            if unknown:
+                raise HTTPException(status_code=400, detail=f"Columns not found: {unknown}")
+        return dataset
 
-            model = Lasso(**safe_params)
+    @log_execution
+    @recorded(kind="search")
+    def search_model(
+        self,
+        db: Session,
+        data: SearchModelRequest,
+        user_id: UUID,
+        progress: Callable[[float, str], None] | None = None,
+    ) -> dict:
+        """
+        Run a grid / random / successive-halving search, persist the best configuration
+        as a regular model and return it with the leaderboard of all trials.
+        """
+        import numpy as np
+
+        progress = progress or (lambda fraction, message: None)
+        fixed = self._coerce_hyperparameters(data.hyperparameters)
+        space = self._search_space(data)
+        X_train, X_test, y_train, y_test = self._load_training_data(db, data, progress)
+
+        # Trials share one copy of the data and score on the same split as train_model
+        X = pd.concat([X_train, X_test])
+        y = pd.concat([y_train, y_test])
+        split = (np.arange(len(X_train)), np.arange(len(X_train), len(X)))
+
+        # Parallelism goes to the trials, each of which fits on a single core
+        search_jobs = settings.SEARCH_N_JOBS
+        cores = current_cores()
+        if cores is not None:
+            search_jobs = cores if search_jobs < 1 else min(search_jobs, cores)
+
+        progress(0.3, f"Running {data.strategy} search")
+        try:
+            with phase("fit"):
+                search = run_search(
+                    self._build_estimator(data.model_algorithm, fixed, n_jobs=1),
+                    space,
+                    data.strategy,
+                    X,
+                    y,
+                    split,
+                    max_trials=data.max_trials,
+                    n_jobs=search_jobs,
+                )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Error during search: {describe_error(e)}"
+            ) from e
 
-        elif algo in ["svm", "svc", "support_vector_machine"]:
-            from sklearn.svm import SVC
+        trials = leaderboard(search.cv_results_)
+        best = trials[0]
+        if best["status"] != "ok":
+            raise HTTPException(status_code=422, detail="Every search trial failed")
 
-            model = SVC(**safe_params)
+        progress(0.85, "Fitting best configuration")
+        model = self._build_estimator(data.model_algorithm, {**fixed, **best["params"]})
+        try:
+            with phase("fit"):
+                model.fit(X_train, y_train)
+            with phase("score"):
+                accuracy = model.score(X_test, y_test)
+                report = evaluation_report(model, X_test, y_test)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error during training: {str(e)}") from e
 
-        elif algo in ["svr", "support_vector_regressor"]:
-            from sklearn.svm import SVR
+        progress(0.9, "Saving model")
+        result = self._save_trained_model(
+            db,
+            model,
+            data.model_copy(
+                update={
+                    "name": data.name or f"{data.model_algorithm} Model (tuned)",
+                    "description": data.description
+                    or f"Best of {len(trials)} {data.strategy} search trials",
+                }
+            ),
+            describe_columns(X_train),
+            accuracy,
+            user_id,
+            report=report,
+        )
+        result["detail"] = "Hyperparameter search completed"
+        result["best_params"] = best["params"]
+        result["strategy"] = data.strategy
+        result["leaderboard"] = trials
+        return result
 
-            model = SVR(**safe_params)
+    @log_execution
+    @recorded(kind="automl")
+    def automl(
+        self,
+        db: Session,
+        data: AutoMLRequest,
+        user_id: UUID,
+        progress: Callable[[float, str], None] | None = None,
+    ) -> dict:
+        """
+        Fit every candidate algorithm on one load and split of the dataset, in parallel
+        processes with a per-candidate time budget (see utils.automl), and save the
+        ``keep_top`` best as regular models. Returns the ranked leaderboard.
+        """
+        import shutil
+        import tempfile
+
+        progress = progress or (lambda fraction, message: None)
+        candidates = self._automl_candidates(data)
+        base = TrainModelRequest(
+            dataset_id=data.dataset_id,
+            model_algorithm=candidates[0][0],
+            target_column=data.target_column,
+            features=data.features,
+        )
+        X_train, X_test, y_train, y_test = self._load_training_data(
+            db,
+            base,
+            progress,
+            float32=all(registry.get(name).float32 for name, _ in candidates),
+        )
+        feature_cols = X_train.columns.tolist()
+        inputs = describe_columns(X_train)
 
-        elif algo in ["decision_tree", "decision_tree_classifier", "decisiontreeclassifier"]:
-            from sklearn.tree import DecisionTreeClassifier
+        # Candidates share the CPU budget: one core each, spare cores spread over them
+        cores = current_cores() or available_cores()
+        parallel = max(1, min(len(candidates), cores))
+        per_candidate = max(1, cores // parallel)
 
-            model = DecisionTreeClassifier(**safe_params)
+        workdir = tempfile.mkdtemp(prefix="mlcore-automl-")
+        try:
+            data_path = os.path.join(workdir, "split.joblib")
+            joblib.dump((X_train, X_test, y_train, y_test), data_path)
+
+            progress(0.2, f"Fitting {len(candidates)} candidates")
+            with phase("fit"):
+                rows = run_candidates(
+                    [Candidate(name, params, per_candidate) for name, params in candidates],
+                    data_path,
+                    workdir,
+                    max_parallel=parallel,
+                    time_budget=data.time_budget_seconds,
+                    on_done=lambda done: progress(
+                        0.2 + 0.7 * done / len(candidates), f"{done}/{len(candidates)} candidates"
+                    ),
+                )
+            leaderboard_rows = rank(rows)
+
+            progress(0.9, "Saving winners")
+            kept = []
+            for row in leaderboard_rows[: data.keep_top]:
+                if row["status"] != "ok":
+                    break
+                request = base.model_copy(
+                    update={
+                        "model_algorithm": row["algorithm"],
+                        "hyperparameters": row["params"],
+                        "name": f"{data.name or row['algorithm']} Model (AutoML #{row['rank']})",
+                        "description": f"Rank {row['rank']} of {len(rows)} AutoML candidates",
+                    }
+                )
+                model = joblib.load(row["model_path"])
+                with phase("score"):
+                    report = evaluation_report(model, X_test, y_test)
+                # The run's telemetry goes to the best model only, so stats count it once
+                saved = self._save_trained_model(
+                    db,
+                    model,
+                    request,
+                    inputs,
+                    row["score"],
+                    user_id,
+                    self._training_fingerprint(db, request),
+                    report,
+                    record_run=not kept,
+                )
+                row["model_id"] = saved["id"]
+                kept.append(saved["id"])
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
 
-        elif algo in ["decision_tree_regressor", "decisiontreeregressor"]:
-            from sklearn.tree import DecisionTreeRegressor
+        for row in leaderboard_rows:
+            row.pop("model_path", None)
+        return {
+            "detail": "AutoML completed",
+            "rows": len(X_train) + len(X_test),
+            "features": feature_cols,
+            "kept_model_ids": kept,
+            "leaderboard": leaderboard_rows,
+        }
 
-            model = DecisionTreeRegressor(**safe_params)
+    def _automl_candidates(self, data: AutoMLRequest) -> list[tuple[str, dict]]:
+        """Expand ``all_classifiers`` / ``all_regressors`` and resolve names; no duplicates."""
+        names: list[str] = []
+        for requested in data.algorithms:
+            if requested.lower() in ("all_classifiers", "all_regressors"):
+                task = "classifier" if requested.lower() == "all_classifiers" else "regressor"
+                expanded = [a.name for a in registry.all() if a.task == task]
+            else:
+                algo = registry.get(requested)
+                if algo is None:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Unsupported algorithm: '{requested}'. "
+                        f"Supported: {', '.join(registry.names())}",
+                    )
+                expanded = [algo.name]
+            names.extend(n for n in expanded if n not in names)
+
+        params = {}
+        for requested, values in data.hyperparameters.items():
+            algo = registry.get(requested)
+            if algo is not None:
+                params[algo.name] = self._coerce_hyperparameters(values)
+        return [(name, params.get(name, {})) for name in names]
+
+    def _search_space(self, data: SearchModelRequest) -> dict:
+        self._build_estimator(data.model_algorithm, {})
+        space = build_search_space(
+            data.model_algorithm,
+            data.strategy,
+            grid_points=data.grid_points,
+            params=data.search_params,
+            overrides=data.search_space,
+            fixed=self._coerce_hyperparameters(data.hyperparameters),
+        )
+        if not space:
+            raise HTTPException(
+                status_code=400,
+                detail=f"No searchable hyperparameters for '{data.model_algorithm}'",
+            )
+        return space
 
-        elif algo in [
-            "gradient_boosting",
-            "gradient_boosting_classifier",
-            "gradientboostingclassifier",
-        ]:
-            from sklearn.ensemble import GradientBoostingClassifier
+    def _train_warm_start(
+        self,
+        db: Session,
+        parent_model,
+        data: TrainModelRequest,
+        user_id: UUID,
+        progress: Callable[[float, str], None] | None = None,
+    ) -> dict:
+        """
+        Continue training the parent estimator instead of starting over: ensembles keep
+        their fitted members and grow by ``add_estimators``, iterative models start from
+        the parent's coefficients. Streaming requests continue with ``partial_fit``.
+        """
+        import time
+
+        progress = progress or (lambda fraction, message: None)
+        if data.target_column != parent_model.outputs:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Warm start must keep the parent's target '{parent_model.outputs}'",
+            )
+        parent_features = self._parse_feature_cols(parent_model)
+        if data.features and list(data.features) != parent_features:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Warm start must keep the parent's features {parent_features}",
+            )
+        data = data.model_copy(
+            update={"model_algorithm": parent_model.model_type, "features": parent_features}
+        )
 
-            model = GradientBoostingClassifier(**safe_params)
+        progress(0.02, "Loading parent model")
+        _, loc = self._model_path(db, parent_model)
+        try:
+            # A private copy: the cached instance serves predictions and must not change
+            with phase("load"):
+                model = load_artifact(loc)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to load model: {e}") from e
 
-        elif algo in ["gradient_boosting_regressor", "gradientboostingregressor"]:
-            from sklearn.ensemble import GradientBoostingRegressor
+        # A pipeline parent keeps its fitted preprocessing; only the estimator grows
+        preprocess = preprocessor(model)
+        estimator = final_estimator(model)
+        if data.streaming:
+            if preprocess is not None:
+                raise HTTPException(
+                    status_code=400, detail="pipeline models cannot continue with streaming"
+                )
+            res = self._train_streaming(db, data, user_id, progress, model=model)
+            res["warm_start"] = True
+            return res
+        data = data.model_copy(update={"pipeline": preprocess is not None})
 
-            model = GradientBoostingRegressor(**safe_params)
+        params = self._coerce_hyperparameters(data.hyperparameters)
+        if "warm_start" not in estimator.get_params():
+            raise HTTPException(
+                status_code=400,
+                detail=f"'{parent_model.model_type}' does not support warm-start retraining",
+            )
+        algo = registry.get(parent_model.model_type)
+        size_param = algo.ensemble_param if algo else None
+        fitted_before = self._ensemble_size(estimator)
+        if size_param and size_param in estimator.get_params():
+            current = estimator.get_params()[size_param]
+            target = params.get(size_param) or current + (
+                data.add_estimators or max(1, current // 10)
+            )
+            if target <= current:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"{size_param} must grow beyond the parent's {current} to warm start",
+                )
+            params[size_param] = target
 
-        elif algo in ["knn", "kneighbors", "k_nearest_neighbors"]:
-            from sklearn.neighbors import KNeighborsClassifier
+        X_train, X_test, y_train, y_test = self._load_training_data(db, data, progress)
 
-            model = KNeighborsClassifier(**safe_params)
+        cores = current_cores()
+        if cores and "n_jobs" in estimator.get_params() and "n_jobs" not in params:
+            params["n_jobs"] = cores
 
-        elif algo in ["naive_bayes", "gaussiannb", "gaussian_naive_bayes"]:
-            from sklearn.naive_bayes import GaussianNB
+        progress(0.3, "Fitting model (warm start)")
+        try:
+            Xt_train, Xt_test = X_train, X_test
+            if preprocess is not None:
+                with phase("split"):
+                    Xt_train, Xt_test = preprocess.transform(X_train), preprocess.transform(X_test)
+            estimator.set_params(**params, warm_start=True)
+            started = time.perf_counter()
+            with phase("fit"):
+                estimator.fit(Xt_train, y_train)
+            fit_seconds = time.perf_counter() - started
+            progress(0.8, "Scoring model")
+            with phase("score"):
+                accuracy = estimator.score(Xt_test, y_test)
+                report = evaluation_report(model, X_test, y_test)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error during training: {str(e)}") from e
 
-            model = GaussianNB(**safe_params)
+        progress(0.9, "Saving model")
+        res = self._save_trained_model(
+            db, model, data, describe_columns(X_train), accuracy, user_id, report=report
+        )
+        res["warm_start"] = True
+        res["estimators_added"] = self._ensemble_size(estimator) - fitted_before
+        res["fit_seconds"] = round(fit_seconds, 4)
+        return res
 
-        else:
+    def _train_streaming(
+        self,
+        db: Session,
+        data: TrainModelRequest,
+        user_id: UUID,
+        progress: Callable[[float, str], None],
+        model=None,
+        fingerprint: str | None = None,
+    ) -> dict:
+        """
+        Train with ``partial_fit`` on chunks of the dataset file so that memory use is
+        bounded by STREAM_CHUNK_MB rather than by the dataset size (see utils.streaming).
+        """
+        import time
+
+        from sklearn.base import is_classifier
+
+        progress(0.05, "Preparing stream")
+        dataset, feature_cols = self._training_columns(db, data)
+        if dataset.recipe:
             raise HTTPException(
                 status_code=400,
-                detail=f"Unsupported algorithm: '{data.model_algorithm}'. Supported: random_forest_classifier, random_forest_regressor, logistic_regression, linear_regression, ridge, lasso, svm, svr, decision_tree, decision_tree_regressor, gradient_boosting, gradient_boosting_regressor, knn, naive_bayes",
+                detail="Streaming training needs a materialized dataset version (not lazy)",
             )
+        if model is None:
+            model = self._build_estimator(
+                data.model_algorithm, self._coerce_hyperparameters(data.hyperparameters)
+            )
+        if not hasattr(model, "partial_fit"):
+            raise HTTPException(
+                status_code=400,
+                detail=f"'{data.model_algorithm}' cannot be trained incrementally. "
+                f"Streaming supports: {', '.join(registry.names('partial_fit'))}",
+            )
+
+        file, loc = self.dataset_service._get_dataset_file(db, dataset.file_id)
+        chunk_rows = estimate_chunk_rows(
+            loc, file.file_type, max_bytes=settings.STREAM_CHUNK_MB * 1024 * 1024
+        )
+        columns = [*feature_cols, data.target_column]
+        note(rows=dataset.rows, columns=len(feature_cols))
+
+        def chunks():
+            return iter_chunks(loc, file.file_type, chunk_rows, columns=columns)
 
         try:
-            model.fit(X_train, y_train)
-            accuracy = model.score(X_test, y_test)
+            # Typed like describe_columns on a loaded frame, from the first chunk's dtypes
+            with phase("load"):
+                first = next(chunks(), None)
+            if first is None:
+                raise ValueError("Dataset is empty")
+            inputs = describe_columns(first[feature_cols])
+
+            classes = None
+            if is_classifier(model):
+                progress(0.1, "Collecting class labels")
+                with phase("load"):
+                    classes = collect_classes(
+                        iter_chunks(loc, file.file_type, chunk_rows, columns=[data.target_column]),
+                        data.target_column,
+                    )
+
+            total = max(dataset.rows, 1) * data.epochs
+            seen = 0
+
+            def on_chunk(rows: int) -> None:
+                nonlocal seen
+                seen += rows
+                progress(0.15 + 0.65 * min(seen / total, 1.0), f"Trained on {seen} rows")
+
+            started = time.perf_counter()
+            with phase("fit"):
+                stream_fit(
+                    model,
+                    chunks,
+                    feature_cols,
+                    data.target_column,
+                    data.validation_fraction,
+                    epochs=data.epochs,
+                    classes=classes,
+                    on_chunk=on_chunk,
+                )
+            fit_seconds = time.perf_counter() - started
+            progress(0.8, "Scoring model")
+            with phase("score"):
+                accuracy, _ = stream_score(
+                    model, chunks, feature_cols, data.target_column, data.validation_fraction
+                )
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error during training: {str(e)}") from e
 
+        progress(0.9, "Saving model")
+        res = self._save_trained_model(db, model, data, inputs, accuracy, user_id, fingerprint)
+        res["fit_seconds"] = round(fit_seconds, 4)
+        return res
+
+    def _load_training_data(
+        self,
+        db: Session,
+        data: TrainModelRequest,
+        progress: Callable[[float, str], None],
+        float32: bool | None = None,
+        split: bool = True,
+    ):
+        """
+        Load, validate and split the dataset columns a training request refers to, as
+        memory-lean frames (see utils.frames). ``float32`` defaults to whether the
+        requested algorithm fits on float32 anyway. With ``split=False`` the whole
+        ``(X, y)`` is returned instead of the train/test split.
+        """
+        progress(0.05, "Loading dataset")
+        with phase("load"):
+            dataset, feature_cols = self._training_columns(db, data)
+
+            if data.pipeline and dataset.recipe:
+                df = self._raw_version_frame(db, dataset, feature_cols, data.target_column)
+            else:
+                # Only the needed columns are decoded when the dataset has a columnar cache
+                df = self.dataset_service._load_dataset_frame(
+                    db=db, dataset=dataset, columns=[*feature_cols, data.target_column]
+                )
+
+        progress(0.2, "Preparing data")
+        if float32 is None:
+            algo = registry.get(data.model_algorithm)
+            float32 = bool(algo and algo.float32)
+        with phase("split"):
+            # Rows with NaNs in targets or features are dropped for simplicity — a
+            # pipeline only drops missing targets and imputes the features
+            X, y, raw_bytes = prepare_training_frame(
+                df,
+                feature_cols,
+                data.target_column,
+                float32=float32,
+                drop_incomplete=not data.pipeline,
+            )
+            if not split:
+                note(
+                    rows=len(X),
+                    columns=len(feature_cols),
+                    frame_bytes_before=raw_bytes,
+                    frame_bytes_after=memory_bytes(X, y),
+                )
+                return X, y
+            try:
+                parts = split_frame(X, y, test_size=0.2, random_state=42)
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Error in data split: {str(e)}") from e
+            note(
+                rows=len(X),
+                columns=len(feature_cols),
+                frame_bytes_before=raw_bytes,
+                frame_bytes_after=memory_bytes(*parts),
+            )
+        return parts
+
+    def _raw_version_frame(self, db: Session, dataset, feature_cols: list[str], target: str):
+        """
+        The rows a lazy dataset version keeps, with the base file's untransformed feature
+        values and the version's target. A pipeline refits the recipe's column steps
+        itself, so the model it produces takes raw values.
+        """
+        version = self.dataset_service._load_dataset_frame(db=db, dataset=dataset)
+        base, _, _ = self.dataset_service._load_dataframe(
+            db=db, file_id=dataset.file_id, columns=feature_cols
+        )
+        return base.loc[version.index, feature_cols].assign(**{target: version[target]})
+
+    def _training_columns(self, db: Session, data: TrainModelRequest):
+        """The requested dataset and its feature columns, validated against its header."""
+        dataset = self.dataset_service.get_dataset(db=db, dataset_id=data.dataset_id)
+        if not dataset:
+            raise HTTPException(status_code=404, detail="Dataset not found")
+
+        available = self.dataset_service._get_columns(db=db, file_id=dataset.file_id)
+        if data.target_column not in available:
+            raise HTTPException(status_code=400, detail="Target column not found in dataset")
+
+        if data.features:
+            missing_features = [f for f in data.features if f not in available]
+            if missing_features:
+                raise HTTPException(
+                    status_code=400, detail=f"Features not found: {missing_features}"
+                )
+            feature_cols = [f for f in data.features if f != data.target_column]
+        else:
+            feature_cols = [c for c in available if c != data.target_column]
+        return dataset, feature_cols
+
+    def _coerce_hyperparameters(self, hyperparameters: dict) -> dict:
+        # The frontend may send everything as strings (e.g. select inputs).
+        # Convert "None"→None, integer strings→int, float strings→float.
+        safe_params: dict = {}
+        for k, v in hyperparameters.items():
+            if v == "None" or v is None:
+                continue  # omit — let sklearn use its own default
+            if isinstance(v, str):
+                # try int first, then float, then keep as string
+                try:
+                    safe_params[k] = int(v)
+                    continue
+                except ValueError:
+                    pass
+                try:
+                    safe_params[k] = float(v)
+                    continue
+                except ValueError:
+                    pass
+            safe_params[k] = v
+        return safe_params
+
+    def _build_estimator(self, algorithm: str, safe_params: dict, n_jobs: int | None = None):
+        """
+        Instantiate the sklearn estimator for an algorithm name (or alias). Estimators
+        that accept ``n_jobs`` get ``n_jobs`` if given, else the job's CPU budget, unless
+        the request set it itself.
+        """
+        algo = registry.get(algorithm)
+        if algo is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported algorithm: '{algorithm}'. "
+                f"Supported: {', '.join(registry.names())}",
+            )
+        n_jobs = n_jobs or current_cores()
+        if algo.n_jobs and n_jobs and "n_jobs" not in safe_params:
+            safe_params = {**safe_params, "n_jobs": n_jobs}
+        return algo.build(safe_params)
+
+    def _save_trained_model(
+        self,
+        db: Session,
+        model,
+        data: TrainModelRequest,
+        inputs: list,
+        accuracy: float,
+        user_id: UUID,
+        fingerprint: str | None = None,
+        report: dict | None = None,
+        accuracy_std: float | None = None,
+        record_run: bool = True,
+    ) -> dict:
+        """
+        Write a fitted estimator (and its evaluation report, if any) to disk and record it
+        as a new MLModel. ``inputs`` is the input schema (see utils.input_schema) or
+        just the feature names. With ``record_run`` the current training run's telemetry
+        is stored with it.
+        """
+        # n_jobs from the training budget says nothing about where the model will be
+        # used — store the estimator's default unless the request asked for a value
+        estimator = final_estimator(model)
+        if "n_jobs" in estimator.get_params() and "n_jobs" not in data.hyperparameters:
+            estimator.set_params(n_jobs=None)
+        # A pipeline encodes category values it has not seen, so it accepts any of them
+        if estimator is not model:
+            inputs = [{**c, "categories": None} for c in normalize_inputs(inputs)]
+
         # Save Model to disk
         model_filename = f"model_{uuid4()}.joblib"
         upload_dir = self.file_service.dir.lstrip("/")
         os.makedirs(upload_dir, exist_ok=True)
         model_path = os.path.join(upload_dir, model_filename)
 
-        try:
-            joblib.dump(model, model_path)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error saving model: {str(e)}") from e
-
-        # Create file record (using dict to bypass UploadFile validation in FileCreate schema)
-        file_obj = self.file_service.repo.create(
-            db=db,
-            obj_in={
-                "name": model_filename,
-                "size": str(os.path.getsize(model_path)),
-                "location": model_path,
-                "file_type": "joblib",
-                "category": "model",
-                "user_id": user_id,
-            },
-        )
+        with phase("save"):
+            try:
+                artifact_mmap = save_artifact(model, model_path)
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Error saving model: {str(e)}") from e
+            artifact_bytes = os.path.getsize(model_path)
+            if report is not None:
+                write_report(report, model_path)
+
+            # Create file record (using dict to bypass UploadFile validation in FileCreate schema)
+            file_obj = self.file_service.repo.create(
+                db=db,
+                obj_in={
+                    "name": model_filename,
+                    "size": str(artifact_bytes),
+                    "location": model_path,
+                    "file_type": "joblib",
+                    "category": "model",
+                    "user_id": user_id,
+                },
+            )
 
         # Save model metadata
         model_db_obj = self.repo.create(
@@ -226,17 +1065,40 @@ class MLModelService:
                 "version": "1.0",
                 "description": data.description or f"Trained {data.model_algorithm} on dataset",
                 "model_type": data.model_algorithm,
-                "inputs": str(X.columns.tolist()),
+                "inputs": normalize_inputs(inputs),
                 "outputs": data.target_column,
                 "accuracy": float(accuracy),
                 "error": float(1 - accuracy),
                 "file_id": file_obj.id,
                 "user_id": user_id,
+                "cpu_cores": current_cores(),
+                "fingerprint": fingerprint,
+                "cv_folds": data.cv_folds if accuracy_std is not None else None,
+                "accuracy_std": accuracy_std,
+                "artifact_mmap": artifact_mmap,
             },
         )
 
+        telemetry = None
+        run = current_run() if record_run else None
+        if run is not None:
+            telemetry = self.telemetry_repo.create(
+                db=db,
+                obj_in={"model_id": model_db_obj.id, **run.summary(artifact_bytes)},
+            )
+
+        res = self._model_result(model_db_obj, "Model trained successfully")
+        res["telemetry"] = self._telemetry_result(telemetry)
+        return res
+
+    def _telemetry_result(self, telemetry) -> dict | None:
+        if telemetry is None:
+            return None
+        return ModelTelemetryResponse.model_validate(telemetry, from_attributes=True).model_dump()
+
+    def _model_result(self, model_db_obj, detail: str) -> dict:
         return {
-            "detail": "Model trained successfully",
+            "detail": detail,
             "id": model_db_obj.id,
             "name": model_db_obj.name,
             "version": model_db_obj.version,
@@ -247,8 +1109,166 @@ class MLModelService:
             "accuracy": model_db_obj.accuracy,
             "error": model_db_obj.error,
             "file_id": model_db_obj.file_id,
+            "cpu_cores": model_db_obj.cpu_cores,
+            "cv_folds": model_db_obj.cv_folds,
+            "accuracy_std": model_db_obj.accuracy_std,
+            "artifact_mmap": model_db_obj.artifact_mmap,
         }
 
+    def _training_fingerprint(self, db: Session, data: TrainModelRequest) -> str | None:
+        """
+        Fingerprint of what a (non warm-start) training request would produce, or None
+        when the result is not reproducible — an estimator left with ``random_state=None``
+        — or the request opted out with ``reuse_cached=False``.
+        """
+        if data.warm_start or not data.reuse_cached:
+            return None
+        algo = registry.get(data.model_algorithm)
+        if algo is None:
+            return None
+        try:
+            estimator = algo.build(self._coerce_hyperparameters(data.hyperparameters))
+        except Exception:
+            return None  # invalid hyperparameters fail in the job with the usual error
+        params = estimator.get_params(deep=False)
+        if "random_state" in params and params["random_state"] is None:
+            return None
+        for name in ("n_jobs", "verbose"):
+            params.pop(name, None)
+
+        try:
+            dataset, feature_cols = self._training_columns(db, data)
+            file, loc = self.dataset_service._get_dataset_file(db, dataset.file_id)
+        except HTTPException:
+            return None  # reported by the training itself
+        if data.streaming:
+            split = {
+                "streaming": True,
+                "validation_fraction": data.validation_fraction,
+                "epochs": data.epochs,
+                "chunk_mb": settings.STREAM_CHUNK_MB,
+            }
+        elif data.cv_folds:
+            split = {"cv_folds": data.cv_folds, "random_state": 42}
+        else:
+            split = {"test_size": 0.2, "random_state": 42}
+        if data.pipeline:
+            split["pipeline"] = True
+        with phase("load"):
+            digest = self._file_digest(db, file, loc)
+        return training_fingerprint(
+            digest,
+            dataset.recipe,
+            feature_cols,
+            data.target_column,
+            algo.name,
+            params,
+            split,
+        )
+
+    def _file_digest(self, db: Session, file, loc: str) -> str:
+        """
+        SHA-256 of a dataset file, stored on its row so that it is computed once rather
+        than once per worker process. Re-uploading a file name overwrites the file in
+        place, so the stored digest only counts while the file's mtime and size match.
+        """
+        stat = os.stat(loc)
+        signature = f"{stat.st_mtime_ns}:{stat.st_size}"
+        if file.digest and file.digest_signature == signature:
+            return file.digest
+        digest = file_digest(loc)
+        self.file_service.repo.update(
+            db=db, db_obj=file, obj_in={"digest": digest, "digest_signature": signature}
+        )
+        return digest
+
+    def _find_cached_model(self, db: Session, fingerprint: str, user_id: UUID):
+        """The user's most recent model with this fingerprint whose artifact still exists."""
+        candidates = (
+            db.query(MLModel)
+            .filter(MLModel.fingerprint == fingerprint, MLModel.user_id == user_id)
+            .order_by(MLModel.created_at.desc())
+            .all()
+        )
+        for candidate in candidates:
+            try:
+                self._model_path(db, candidate)
+            except HTTPException:
+                continue
+            return candidate
+        return None
+
+    def _reuse_cached_model(self, db: Session, cached, parent_id: UUID | None) -> dict:
+        """
+        Answer a training request with an identical earlier model. A plain train returns
+        that model; a retrain records a new version that shares its artifact and metrics.
+        The reuse is counted on the earlier model's telemetry, and a new version gets a
+        telemetry row of its own for what this run cost (fingerprinting).
+        """
+        original = self.telemetry_repo.get_by_model_id(db=db, model_id=cached.id)
+        if original is not None:
+            self.telemetry_repo.update(
+                db=db, db_obj=original, obj_in={"reuse_count": (original.reuse_count or 0) + 1}
+            )
+
+        if parent_id is None:
+            res = self._model_result(cached, "Identical model already trained — reused")
+            res["telemetry"] = self._telemetry_result(original)
+            res["cached"] = True
+            return res
+
+        parent_model = self.get_model(db=db, model_id=parent_id)
+        linked = self.repo.create(
+            db=db,
+            obj_in={
+                **{
+                    column.key: getattr(cached, column.key)
+                    for column in MLModel.__table__.columns
+                    if column.key not in ("id", "parent_id", "created_at", "updated_at")
+                },
+                "id": uuid4(),
+            },
+        )
+        linked = self._link_version(db, parent_model, linked)
+
+        telemetry = None
+        run = current_run()
+        if run is not None:
+            telemetry = self.telemetry_repo.create(
+                db=db,
+                obj_in={
+                    "model_id": linked.id,
+                    **run.summary(),  # the artifact is the earlier model's
+                    "reused_from_id": cached.id,
+                },
+            )
+
+        res = self._model_result(linked, "Identical model already trained — linked as new version")
+        res["telemetry"] = self._telemetry_result(telemetry)
+        res["parent_id"] = linked.parent_id
+        res["cached"] = True
+        res["cached_from"] = cached.id
+        return res
+
+    def _link_version(self, db: Session, parent_model, new_model_db):
+        """Make ``new_model_db`` the next version of ``parent_model``."""
+        # Calculate new semantic version based on parent
+        try:
+            old_major, old_minor = map(int, str(parent_model.version).split("."))
+            new_version = f"{old_major}.{old_minor + 1}"
+        except Exception:
+            new_version = "1.1"  # Fallback if parsing fails
+
+        return self.repo.update(
+            db=db,
+            db_obj=new_model_db,
+            obj_in={
+                "parent_id": parent_model.id,
+                "version": new_version,
+                "name": f"{parent_model.name} (Retrained v{new_version})",
+            },
+        )
+
     @log_execution
     def get_model_versions(self, db: Session, model_id: UUID) -> list[CreateMLModelResponse]:
         model = self.get_model(db=db, model_id=model_id)
@@ -266,32 +1286,64 @@ class MLModelService:
         return models
 
     @log_execution
-    def retrain_model(self, db: Session, model_id: UUID, data: TrainModelRequest, user_id: UUID):
+    @recorded
+    def run_training(
+        self,
+        db: Session,
+        data: TrainModelRequest,
+        user_id: UUID,
+        model_id: UUID | None = None,
+        progress: Callable[[float, str], None] | None = None,
+    ) -> dict:
+        """
+        The job queued by ``submit_training``: answer with an identical earlier model if
+        there is one (see ``_training_fingerprint``), else train — or retrain ``model_id``.
+        """
+        progress = progress or (lambda fraction, message: None)
+        progress(0.01, "Looking for an identical earlier model")
+        fingerprint = self._training_fingerprint(db, data)
+        cached = self._find_cached_model(db, fingerprint, user_id) if fingerprint else None
+        if cached is not None:
+            return self._reuse_cached_model(db, cached, model_id)
+        if model_id is not None:
+            return self.retrain_model(
+                db=db,
+                model_id=model_id,
+                data=data,
+                user_id=user_id,
+                progress=progress,
+                fingerprint=fingerprint,
+            )
+        return self.train_model(
+            db=db, data=data, user_id=user_id, progress=progress, fingerprint=fingerprint
+        )
+
+    @log_execution
+    @recorded
+    def retrain_model(
+        self,
+        db: Session,
+        model_id: UUID,
+        data: TrainModelRequest,
+        user_id: UUID,
+        progress: Callable[[float, str], None] | None = None,
+        fingerprint: str | None = None,
+    ):
         parent_model = self.get_model(db=db, model_id=model_id)
         if not parent_model:
             raise HTTPException(status_code=404, detail="Parent model not found")
 
-        # Calculate new semantic version based on parent
-        try:
-            old_major, old_minor = map(int, str(parent_model.version).split("."))
-            new_version = f"{old_major}.{old_minor + 1}"
-        except Exception:
-            new_version = "1.1"  # Fallback if parsing fails
-
-        # Re-use train_model logic but we simply change the version and parent_id right after
-        # This is a bit duplicative but simpler. Let's just run train_model and then UPDATE the returned model's version and parent_id
-        res = self.train_model(db, data, user_id)
+        # A new version is trained as a model of its own — continuing from the parent's
+        # estimator with warm_start — and then linked under the parent. The parent's
+        # artifact is left as it is, so its cached copy stays valid.
+        if data.warm_start:
+            res = self._train_warm_start(db, parent_model, data, user_id, progress=progress)
+        else:
+            res = self.train_model(db, data, user_id, progress=progress, fingerprint=fingerprint)
 
         # Now update the created model to link it
-        new_model_db = self.repo.get_by_id(db=db, id=res["id"])
-        new_model_db = self.repo.update(
-            db=db,
-            db_obj=new_model_db,
-            obj_in={
-                "parent_id": parent_model.id,
-                "version": new_version,
-                "name": f"{parent_model.name} (Retrained v{new_version})",
-            },
+        new_model_db = self._link_version(
+            db, parent_model, self.repo.get_by_id(db=db, id=res["id"])
         )
 
         res["parent_id"] = new_model_db.parent_id
@@ -306,16 +1358,45 @@ class MLModelService:
         file_res = self.file_service.create_file(
             db=db, file=file, user_id=user_id, category="model"
         )
-        data_dict = data.model_dump()
+        data_dict = self._model_fields(data)
         data_dict["file_id"] = file_res.id
         data_dict["user_id"] = user_id
         model_obj = self.repo.create(db=db, obj_in=data_dict)
         return CreateMLModelResponse(**model_obj.__dict__, detail="Model created successfully")
 
+    def _model_fields(self, data: CreateMLModelRequest) -> dict:
+        """Columns of an uploaded model; ``inputs`` (names or a schema) becomes a schema."""
+        data_dict = data.model_dump()
+        try:
+            data_dict["inputs"] = normalize_inputs(data.inputs)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e)) from e
+        return data_dict
+
     @log_execution
     def get_model(self, db: Session, model_id: UUID) -> CreateMLModelResponse:
         return self.repo.get_by_id(db=db, id=model_id)
 
+    @log_execution
+    def get_model_telemetry(
+        self, db: Session, model_id: UUID, user_id: UUID
+    ) -> ModelTelemetryResponse:
+        self._get_owned_model(db=db, model_id=model_id, user_id=user_id)
+        telemetry = self.telemetry_repo.get_by_model_id(db=db, model_id=model_id)
+        if not telemetry:
+            raise HTTPException(status_code=404, detail="No telemetry recorded for this model")
+        return ModelTelemetryResponse.model_validate(telemetry, from_attributes=True)
+
+    @log_execution
+    def get_model_report(self, db: Session, model_id: UUID, user_id: UUID) -> FileResponse:
+        """The evaluation report written at training time, served as stored."""
+        model_record = self._get_owned_model(db=db, model_id=model_id, user_id=user_id)
+        _, loc = self._model_path(db, model_record)
+        path = report_path(loc)
+        if not os.path.exists(path):
+            raise HTTPException(status_code=404, detail="No evaluation report for this model")
+        return FileResponse(path=path, media_type="application/json")
+
     @log_execution
     def get_models(self, db: Session) -> list[CreateMLModelResponse]:
         return self.repo.get(db=db)
@@ -331,10 +1412,12 @@ class MLModelService:
     ) -> CreateMLModelResponse:
         model_obj = self.repo.get_by_id(db=db, id=model_id)
 
-        data_dict = data.model_dump()
+        data_dict = self._model_fields(data)
         if file:
             file_res = self.file_service.create_file(db=db, file=file, user_id=user_id)
             data_dict["file_id"] = file_res.id
+            data_dict["artifact_mmap"] = False
+            model_cache.invalidate(model_obj.file_id)
 
         model_obj = self.repo.update(db=db, db_obj=model_obj, obj_in=data_dict)
         return CreateMLModelResponse(**model_obj.__dict__, detail="Model updated successfully")
@@ -347,16 +1430,29 @@ class MLModelService:
         if model.user_id != user_id:
             raise HTTPException(status_code=403, detail="Not authorized to delete this model")
 
-        # Delete physical file + file DB record
-        if model.file_id:
+        # Delete physical file + file DB record, unless a reused model still shares it
+        model_cache.invalidate(model.file_id)
+        shared = (
+            db.query(MLModel)
+            .filter(MLModel.file_id == model.file_id, MLModel.id != model.id)
+            .count()
+        )
+        if model.file_id and not shared:
             from src.modules.file.schema import FileDelete
 
+            try:
+                _, loc = self._model_path(db, model)
+                if os.path.exists(report_path(loc)):
+                    os.remove(report_path(loc))
+            except HTTPException:
+                pass
             try:
                 self.file_service.delete_file(db=db, data=FileDelete(id=model.file_id))
             except HTTPException:
                 pass  # File already gone – don't block model deletion
 
         # Delete model DB record
+        self.telemetry_repo.delete_by_model_id(db=db, model_id=model_id)
         self.repo.delete(db=db, id=model_id)
         return {"detail": "Model deleted successfully", "id": str(model_id)}
 
@@ -401,77 +1497,171 @@ class MLModelService:
             filename=filename,
         )
 
+    @log_execution
+    def get_algorithms(self) -> list[dict]:
+        return [algo.describe() for algo in registry.all()]
+
+    @log_execution
+    def get_cache_stats(self) -> dict:
+        return {**model_cache.stats(), "coalescer": predict_coalescer.stats()}
+
     @log_execution
     def predict(
         self, db: Session, model_id: UUID, data: PredictRequest, user_id: UUID
     ) -> PredictResponse:
+        model_record = self._get_owned_model(db=db, model_id=model_id, user_id=user_id)
+        validator = self._input_validator(model_record)
+
+        # Validate all required features are provided
+        missing = validator.missing(data.inputs.keys())
+        if missing:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Missing required feature(s): {missing}",
+            )
+
+        # Typed frame in the same column order as training
+        X = self._validated_frame(validator.row, data.inputs)
+
+        sklearn_model = self._load_estimator(db=db, model_record=model_record)
+        predictions, classes, proba = predict_coalescer.infer(
+            model_record.file_id, X, lambda rows: self._infer(sklearn_model, rows)
+        )
+
+        probabilities = None
+        if proba is not None:
+            probabilities = [
+                {cls: round(float(p), 4) for cls, p in zip(classes, row_proba, strict=False)}
+                for row_proba in proba
+            ]
+
+        return PredictResponse(
+            model_id=str(model_id),
+            model_type=model_record.model_type,
+            target=model_record.outputs,
+            predictions=predictions,
+            probabilities=probabilities,
+        )
+
+    @log_execution
+    def predict_batch(
+        self, db: Session, model_id: UUID, data: BatchPredictRequest, user_id: UUID
+    ) -> BatchPredictResponse:
+        """Score many rows with one vectorized predict / predict_proba call."""
+        model_record = self._get_owned_model(db=db, model_id=model_id, user_id=user_id)
+        validator = self._input_validator(model_record)
+
+        # Sized from the raw payload, so an oversized batch is refused before any of it
+        # is validated or converted
+        if data.records is not None:
+            rows = len(data.records)
+        else:
+            rows = max((len(values) for values in data.columns.values()), default=0)
+        if rows > settings.PREDICT_BATCH_MAX_ROWS:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Batch too large: {rows} rows (max {settings.PREDICT_BATCH_MAX_ROWS})",
+            )
+
+        if data.records is not None:
+            required = validator.required
+            incomplete = [i for i, rec in enumerate(data.records) if not required <= rec.keys()]
+            if incomplete:
+                raise HTTPException(
+                    status_code=422,
+                    detail=f"Records missing required feature(s) at index {incomplete[:10]}",
+                )
+            X = self._validated_frame(validator.records, data.records)
+        else:
+            missing = validator.missing(data.columns.keys())
+            if missing:
+                raise HTTPException(
+                    status_code=422,
+                    detail=f"Missing required feature(s): {missing}",
+                )
+            if len({len(data.columns[f]) for f in validator.names}) > 1:
+                raise HTTPException(
+                    status_code=422, detail="All feature columns must have the same length"
+                )
+            X = self._validated_frame(validator.columns, data.columns)
+
+        sklearn_model = self._load_estimator(db=db, model_record=model_record)
+        predictions, classes, proba = self._infer(sklearn_model, X)
+
+        return BatchPredictResponse(
+            model_id=str(model_id),
+            model_type=model_record.model_type,
+            target=model_record.outputs,
+            count=len(predictions),
+            predictions=predictions,
+            classes=classes,
+            probabilities=proba.round(4).tolist() if proba is not None else None,
+        )
+
+    def _get_owned_model(self, db: Session, model_id: UUID, user_id: UUID):
         model_record = self.repo.get_by_id(db=db, id=model_id)
         if not model_record:
             raise HTTPException(status_code=404, detail="Model not found")
         if model_record.user_id != user_id:
             raise HTTPException(status_code=403, detail="Not authorized")
+        return model_record
+
+    def _ensemble_size(self, model) -> int:
+        """Fitted members of an ensemble (boosting iterations for histogram GB), else 0."""
+        if hasattr(model, "n_iter_") and hasattr(model, "_predictors"):
+            return int(model.n_iter_)
+        return len(getattr(model, "estimators_", ()))
 
-        # Resolve feature column list stored as a Python-repr string or JSON
+    def _parse_feature_cols(self, model_record) -> list[str]:
+        return self._input_validator(model_record).names
+
+    def _input_validator(self, model_record) -> InputValidator:
+        """The model's compiled input validator; recompiled when the record changes."""
         try:
-            stored_inputs = model_record.inputs
-            # Try JSON first, then ast.literal_eval for Python list repr
-            try:
-                feature_cols: list[str] = json.loads(stored_inputs)
-            except (json.JSONDecodeError, TypeError):
-                feature_cols = ast.literal_eval(stored_inputs)
-        except Exception:
+            return input_validator((model_record.id, model_record.updated_at), model_record.inputs)
+        except ValueError:
             raise HTTPException(
                 status_code=500,
                 detail=f"Could not parse model input schema: {model_record.inputs}",
             ) from None
 
-        # Validate all required features are provided
-        missing = [f for f in feature_cols if f not in data.inputs]
-        if missing:
-            raise HTTPException(
-                status_code=422,
-                detail=f"Missing required feature(s): {missing}",
-            )
-
-        # Build DataFrame in the same column order as training
-        row = {col: [data.inputs[col]] for col in feature_cols}
-        X = pd.DataFrame(row)
+    def _validated_frame(self, convert: Callable, payload) -> pd.DataFrame:
+        try:
+            return convert(payload)
+        except InputError as e:
+            raise HTTPException(status_code=422, detail=str(e)) from e
 
-        # Load model from disk
+    def _model_path(self, db: Session, model_record):
         file = self.file_service.get_file_by_id(db=db, id=model_record.file_id)
         loc = file.location
         if not os.path.exists(loc):
             loc = os.path.join(os.getcwd(), loc.lstrip("/").lstrip("\\"))
         if not os.path.exists(loc):
             raise HTTPException(status_code=404, detail="Model file not found on disk")
+        return file, loc
 
+    def _load_estimator(self, db: Session, model_record):
+        file, loc = self._model_path(db, model_record)
+        # Artifacts saved for it are mapped, so workers share their arrays in the page cache
+        loader = partial(load_artifact, mmap=bool(model_record.artifact_mmap))
         try:
-            sklearn_model = joblib.load(loc)
+            return model_cache.get(file.id, loc, loader=loader)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to load model: {e}") from e
 
+    def _infer(self, sklearn_model, X: pd.DataFrame):
+        """Return (predictions, class labels, probability matrix) for a feature frame."""
         try:
             predictions = sklearn_model.predict(X).tolist()
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Prediction failed: {e}") from e
 
         # Probabilities for classifiers
-        probabilities = None
+        classes, proba = None, None
         if hasattr(sklearn_model, "predict_proba"):
             try:
                 proba = sklearn_model.predict_proba(X)
                 classes = [str(c) for c in sklearn_model.classes_]
-                probabilities = [
-                    {cls: round(float(p), 4) for cls, p in zip(classes, row_proba, strict=False)}
-                    for row_proba in proba
-                ]
             except Exception:
-                pass
-
-        return PredictResponse(
-            model_id=str(model_id),
-            model_type=model_record.model_type,
-            target=model_record.outputs,
-            predictions=predictions,
-            probabilities=probabilities,
-        )
+                classes, proba = None, None
+        return predictions, classes, proba
@@ -1,4 +1,4 @@
-from src.modules.ml_model.store.model import MLModel
-from src.modules.ml_model.store.repository import MLModelRepository
+from src.modules.ml_model.store.model import MLModel, ModelTelemetry
+from src.modules.ml_model.store.repository import MLModelRepository, ModelTelemetryRepository
 
-__all__ = ["MLModel", "MLModelRepository"]
+__all__ = ["MLModel", "MLModelRepository", "ModelTelemetry", "ModelTelemetryRepository"]
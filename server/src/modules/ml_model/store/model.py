@@ -1,7 +1,17 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import JSON, DateTime, Float, ForeignKey, String
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    String,
+    false,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.types import Uuid
 
@@ -17,7 +27,8 @@ class MLModel(Base):
     version: Mapped[str] = mapped_column(String, default=None)
     description: Mapped[str] = mapped_column(String, default=None)
     model_type: Mapped[str] = mapped_column(String, default=None)
-    inputs: Mapped[dict] = mapped_column(JSON, default=None)
+    # Input schema: [{"name", "dtype", "categories"}, ...] in training order
+    inputs: Mapped[list] = mapped_column(JSON, default=None)
     outputs: Mapped[dict] = mapped_column(JSON, default=None)
     accuracy: Mapped[float] = mapped_column(Float, default=0.0)
     error: Mapped[float] = mapped_column(Float, default=0.0)
@@ -30,6 +41,14 @@ class MLModel(Base):
     parent_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey(f"{Tables.MODELS}.id"), nullable=True
     )
+    cpu_cores: Mapped[int] = mapped_column(Integer, nullable=True)
+    # Hash of the training inputs (see utils.fingerprint); identical requests reuse the model
+    fingerprint: Mapped[str] = mapped_column(String, nullable=True, index=True)
+    # Cross-validated models: accuracy is the mean over cv_folds, accuracy_std its spread
+    cv_folds: Mapped[int] = mapped_column(Integer, nullable=True)
+    accuracy_std: Mapped[float] = mapped_column(Float, nullable=True)
+    # Saved uncompressed by training (see utils.artifacts): predict maps its arrays read-only
+    artifact_mmap: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
@@ -38,3 +57,37 @@ class MLModel(Base):
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
+
+
+class ModelTelemetry(Base):
+    """Resources used by the training run that produced a model (one row per model)."""
+
+    __tablename__ = Tables.MODEL_TELEMETRY
+
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    model_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, ForeignKey(f"{Tables.MODELS}.id"), nullable=False, unique=True, index=True
+    )
+    # "train", or "search" / "automl" for a run that fitted many candidates (utils.telemetry)
+    kind: Mapped[str] = mapped_column(String, default="train", server_default="train")
+    load_seconds: Mapped[float] = mapped_column(Float, default=0.0)
+    split_seconds: Mapped[float] = mapped_column(Float, default=0.0)
+    fit_seconds: Mapped[float] = mapped_column(Float, default=0.0)
+    score_seconds: Mapped[float] = mapped_column(Float, default=0.0)
+    save_seconds: Mapped[float] = mapped_column(Float, default=0.0)
+    total_seconds: Mapped[float] = mapped_column(Float, default=0.0)
+    cpu_seconds: Mapped[float] = mapped_column(Float, default=0.0)
+    peak_rss_bytes: Mapped[int] = mapped_column(BigInteger, nullable=True)
+    rows: Mapped[int] = mapped_column(Integer, nullable=True)
+    columns: Mapped[int] = mapped_column(Integer, nullable=True)
+    # Memory of the training columns as loaded and after preparation (utils.frames)
+    frame_bytes_before: Mapped[int] = mapped_column(BigInteger, nullable=True)
+    frame_bytes_after: Mapped[int] = mapped_column(BigInteger, nullable=True)
+    artifact_bytes: Mapped[int] = mapped_column(BigInteger, nullable=True)
+    # Later training requests answered with this model's artifact (utils.fingerprint)
+    reuse_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    # Set on a version recorded by such a request: the model whose artifact it shares
+    reused_from_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
@@ -1,7 +1,23 @@
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
 from src.common.repository.base import BaseRepository
-from src.modules.ml_model.store import MLModel
+from src.modules.ml_model.store.model import MLModel, ModelTelemetry
 
 
 class MLModelRepository(BaseRepository):
     def __init__(self):
         super().__init__(MLModel)
+
+
+class ModelTelemetryRepository(BaseRepository):
+    def __init__(self):
+        super().__init__(ModelTelemetry)
+
+    def get_by_model_id(self, db: Session, model_id: UUID) -> ModelTelemetry | None:
+        return db.query(ModelTelemetry).filter(ModelTelemetry.model_id == model_id).first()
+
+    def delete_by_model_id(self, db: Session, model_id: UUID) -> None:
+        db.query(ModelTelemetry).filter(ModelTelemetry.model_id == model_id).delete()
+        db.commit()
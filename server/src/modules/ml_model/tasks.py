@@ -0,0 +1,86 @@
+"""
+Entry points executed inside job worker processes (see ``src.modules.job.executor``).
+
+Each function opens its own DB session, records progress on the job row and stores
+either the normal service response or the error detail when it finishes. The work runs
+inside the job's CPU budget (see ``src.modules.job.cpu_budget``).
+"""
+
+from collections.abc import Callable
+from functools import partial
+from uuid import UUID
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from loguru import logger
+
+from src.common.db.session import SessionLocal
+from src.modules.job import JobService
+from src.modules.job.cpu_budget import cores_for_job, cpu_budget
+from src.modules.ml_model.schema import (
+    AutoMLRequest,
+    ScoreDatasetRequest,
+    SearchModelRequest,
+    TrainModelRequest,
+)
+
+
+def run_training_job(job_id: str, user_id: str, request: dict, model_id: str | None = None) -> None:
+    def work(service, db, progress):
+        return service.run_training(
+            db=db,
+            data=TrainModelRequest(**request),
+            user_id=UUID(user_id),
+            model_id=UUID(model_id) if model_id else None,
+            progress=progress,
+        )
+
+    _run_job(job_id, work)
+
+
+def run_search_job(job_id: str, user_id: str, request: dict) -> None:
+    def work(service, db, progress):
+        data = SearchModelRequest(**request)
+        return service.search_model(db=db, data=data, user_id=UUID(user_id), progress=progress)
+
+    _run_job(job_id, work)
+
+
+def run_automl_job(job_id: str, user_id: str, request: dict) -> None:
+    def work(service, db, progress):
+        data = AutoMLRequest(**request)
+        return service.automl(db=db, data=data, user_id=UUID(user_id), progress=progress)
+
+    _run_job(job_id, work)
+
+
+def run_scoring_job(job_id: str, user_id: str, model_id: str, request: dict) -> None:
+    def work(service, db, progress):
+        data = ScoreDatasetRequest(**request)
+        return service.score_dataset(
+            db=db, model_id=UUID(model_id), data=data, user_id=UUID(user_id), progress=progress
+        )
+
+    _run_job(job_id, work)
+
+
+def _run_job(job_id: str, work: Callable) -> None:
+    from src.modules.ml_model.service import MLModelService
+
+    db = SessionLocal()
+    jobs = JobService()
+    try:
+        jobs.mark_running(db=db, job_id=job_id)
+        progress = partial(jobs.update_progress, db, job_id)
+        with cpu_budget(cores_for_job(db)):
+            result = work(MLModelService(), db, progress)
+        jobs.mark_completed(db=db, job_id=job_id, result=jsonable_encoder(result))
+    except HTTPException as e:
+        db.rollback()
+        jobs.mark_failed(db=db, job_id=job_id, error=str(e.detail))
+    except Exception as e:
+        logger.exception(e)
+        db.rollback()
+        jobs.mark_failed(db=db, job_id=job_id, error=str(e))
+    finally:
+        db.close()
@@ -0,0 +1,70 @@
+"""
+Model artifacts on disk.
+
+``save_artifact`` writes a model with joblib, uncompressed: joblib then stores every
+NumPy array as a raw, aligned buffer inside the file, and ``load_artifact(path,
+mmap=True)`` maps those buffers read-only instead of reading them into the heap. Mapped
+pages belong to the OS page cache, so every uvicorn worker that loads the same artifact
+shares one copy of its arrays rather than holding one each. ``save_artifact`` returns
+whether the model is worth mapping — it holds at least ``MMAP_MIN_BYTES`` of array
+data; smaller models load privately, as mapping them saves nothing and costs a mapping
+per array. The answer is recorded on the model (``MLModel.artifact_mmap``); uploaded
+models, which may be compressed or plain pickles, are loaded privately.
+
+How much of a model that covers depends on where its arrays end up once unpickled:
+
+- mapped: the training matrix and tree of nearest-neighbour models, SVM support vectors,
+  the node arrays of HistGradientBoosting, linear coefficients and the state of
+  pipeline encoders and scalers;
+- copied: the nodes of sklearn's decision trees, and so of random forests, extra trees
+  and GradientBoosting — ``Tree.__setstate__`` copies them into buffers of its own. They
+  are not shared, but loading them mapped still skips the intermediate private copy of
+  every node array, which the allocator tends to keep: about half the memory of a
+  private load.
+
+``scripts/benchmarks/model_memory.py`` measures the difference per model type.
+"""
+
+import io
+import pickle
+from typing import Any
+
+import joblib
+import numpy as np
+
+MMAP_MIN_BYTES = 1 << 20
+
+
+class _ArrayBytes(pickle.Pickler):
+    """Pickles to nowhere, adding up the raw buffers joblib would write for the arrays."""
+
+    def __init__(self):
+        # Protocol 5 with a buffer callback hands array data over out-of-band: not copied
+        super().__init__(io.BytesIO(), protocol=5, buffer_callback=lambda buffer: None)
+        self.nbytes = 0
+
+    def reducer_override(self, obj):
+        if isinstance(obj, np.ndarray) and not obj.dtype.hasobject:
+            self.nbytes += obj.nbytes
+        return NotImplemented
+
+
+def array_bytes(model: Any) -> int:
+    """Bytes of the NumPy arrays in ``model`` that ``save_artifact`` stores as raw buffers."""
+    counter = _ArrayBytes()
+    counter.dump(model)
+    return counter.nbytes
+
+
+def save_artifact(model: Any, path: str) -> bool:
+    """Write ``model`` to ``path``; returns whether to load it memory-mapped."""
+    joblib.dump(model, path, compress=0)
+    return array_bytes(model) >= MMAP_MIN_BYTES
+
+
+def load_artifact(path: str, mmap: bool = False) -> Any:
+    """
+    Load a model written by ``save_artifact``. With ``mmap`` its arrays are read-only
+    views of the file — fine for predicting, not for fitting further.
+    """
+    return joblib.load(path, mmap_mode="r" if mmap else None)
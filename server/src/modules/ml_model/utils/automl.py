@@ -0,0 +1,148 @@
+"""
+Fit several algorithms on the same train/test split and rank them.
+
+The caller loads and splits the dataset once and writes the split to ``data_path`` with
+joblib; every candidate process maps the arrays from that file read-only instead of
+re-reading the dataset. Candidates run in at most ``max_parallel`` spawned processes
+at a time. Each process fits, scores and dumps its model to the work directory, then
+reports back over a pipe. A candidate still running after ``time_budget`` seconds is
+terminated and reported as ``timeout`` — which is why this uses plain processes rather
+than a ``ProcessPoolExecutor``, whose tasks cannot be stopped once started.
+"""
+
+import multiprocessing
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from multiprocessing.connection import wait
+from typing import Any
+
+import joblib
+
+
+@dataclass
+class Candidate:
+    algorithm: str  # canonical registry name
+    params: dict[str, Any] = field(default_factory=dict)
+    n_jobs: int = 1
+
+
+def _fit_candidate(candidate: Candidate, data_path: str, model_path: str, conn) -> None:
+    """Runs in a child process: fit, score and dump one candidate, then report."""
+    try:
+        from threadpoolctl import threadpool_limits
+
+        from src.modules.ml_model.utils.registry import registry
+
+        X_train, X_test, y_train, y_test = joblib.load(data_path, mmap_mode="r")
+        algo = registry.get(candidate.algorithm)
+        params = dict(candidate.params)
+        if algo.n_jobs and "n_jobs" not in params:
+            params["n_jobs"] = candidate.n_jobs
+        model = algo.build(params)
+        with threadpool_limits(limits=candidate.n_jobs):
+            started = time.perf_counter()
+            model.fit(X_train, y_train)
+            fit_seconds = time.perf_counter() - started
+            started = time.perf_counter()
+            score = float(model.score(X_test, y_test))
+            score_seconds = time.perf_counter() - started
+        if "n_jobs" in model.get_params() and "n_jobs" not in candidate.params:
+            model.set_params(n_jobs=None)
+        joblib.dump(model, model_path)
+        conn.send(
+            {
+                "status": "ok",
+                "score": score,
+                "fit_seconds": round(fit_seconds, 4),
+                "score_seconds": round(score_seconds, 4),
+                "model_bytes": os.path.getsize(model_path),
+            }
+        )
+    except Exception as e:
+        from src.modules.ml_model.utils.search import describe_error
+
+        conn.send({"status": "failed", "error": describe_error(e) or repr(e)})
+    finally:
+        conn.close()
+
+
+def run_candidates(
+    candidates: list[Candidate],
+    data_path: str,
+    workdir: str,
+    max_parallel: int,
+    time_budget: float,
+    on_done: Callable[[int], None] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Fit every candidate; returns one row per candidate (in input order) with its status,
+    score, timings, model size and — for successful fits — ``model_path``.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    pending = list(enumerate(candidates))
+    running: dict[Any, tuple[int, Any, float, str]] = {}  # conn -> (index, proc, start, path)
+    rows: list[dict[str, Any] | None] = [None] * len(candidates)
+    finished = 0
+
+    def finish(index: int, row: dict[str, Any]) -> None:
+        nonlocal finished
+        candidate = candidates[index]
+        rows[index] = {"algorithm": candidate.algorithm, "params": candidate.params, **row}
+        finished += 1
+        if on_done:
+            on_done(finished)
+
+    try:
+        while pending or running:
+            while pending and len(running) < max(1, max_parallel):
+                index, candidate = pending.pop(0)
+                model_path = os.path.join(workdir, f"candidate_{index}.joblib")
+                parent_conn, child_conn = ctx.Pipe(duplex=False)
+                proc = ctx.Process(
+                    target=_fit_candidate,
+                    args=(candidate, data_path, model_path, child_conn),
+                    daemon=True,
+                )
+                proc.start()
+                child_conn.close()
+                running[parent_conn] = (index, proc, time.monotonic(), model_path)
+
+            for conn in wait(list(running), timeout=0.2):
+                index, proc, started, model_path = running.pop(conn)
+                try:
+                    row = conn.recv()
+                except EOFError:
+                    row = {"status": "failed", "error": "Candidate process exited unexpectedly"}
+                conn.close()
+                proc.join()
+                if row["status"] == "ok":
+                    row["model_path"] = model_path
+                finish(index, row)
+
+            now = time.monotonic()
+            for conn, (index, proc, started, _) in list(running.items()):
+                if now - started > time_budget:
+                    proc.terminate()
+                    proc.join()
+                    conn.close()
+                    del running[conn]
+                    finish(
+                        index,
+                        {"status": "timeout", "error": f"Exceeded {time_budget:g}s time budget"},
+                    )
+    finally:
+        for conn, (_, proc, _, _) in running.items():
+            proc.terminate()
+            proc.join()
+            conn.close()
+    return rows
+
+
+def rank(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Successful candidates by score (best first), then the failures; adds ``rank``."""
+    ordered = sorted(rows, key=lambda r: (r["status"] != "ok", -(r.get("score") or 0.0)))
+    for position, row in enumerate(ordered, start=1):
+        row["rank"] = position
+    return ordered
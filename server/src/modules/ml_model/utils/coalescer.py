@@ -0,0 +1,113 @@
+"""
+Micro-batching of concurrent single-row predictions.
+
+Predict requests run in the server's thread pool. With ``PREDICT_COALESCE_MS`` set, the
+first request for a model opens a batch and waits up to that many milliseconds (or
+until ``PREDICT_COALESCE_MAX_ROWS`` rows have joined); requests for the same model
+arriving meanwhile append their rows and wait. The opener then runs one vectorized
+inference on the stacked rows and every request takes back its own slice, so N
+concurrent callers pay the per-call overhead of ``predict`` / ``predict_proba`` once.
+
+If the batched call fails — e.g. one request sent a value the model cannot handle —
+each request falls back to its own call, so a bad row only fails its own request.
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import pandas as pd
+
+from src.common.config import settings
+
+# (predictions, class labels, probability matrix), as MLModelService._infer returns them
+Inference = tuple[list, list[str] | None, Any]
+
+
+class _Batch:
+    __slots__ = ("frames", "rows", "full", "done", "result", "failed")
+
+    def __init__(self):
+        self.frames: list[pd.DataFrame] = []
+        self.rows = 0
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.result: Inference | None = None
+        self.failed = False
+
+
+class PredictCoalescer:
+    def __init__(self, max_wait_ms: float, max_rows: int):
+        self.max_wait = max_wait_ms / 1000
+        self.max_rows = max_rows
+        self._open: dict[Hashable, _Batch] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.batches = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_wait > 0 and self.max_rows > 1
+
+    def infer(
+        self, key: Hashable, X: pd.DataFrame, infer: Callable[[pd.DataFrame], Inference]
+    ) -> Inference:
+        """``infer(X)``, run as part of a batch with concurrent calls for the same ``key``."""
+        if not self.enabled:
+            return infer(X)
+
+        with self._lock:
+            self.calls += 1
+            batch = self._open.get(key)
+            opener = batch is None
+            if opener:
+                batch = self._open[key] = _Batch()
+                self.batches += 1
+            start = batch.rows
+            batch.frames.append(X)
+            batch.rows += len(X)
+            stop = batch.rows
+            if batch.rows >= self.max_rows:
+                del self._open[key]
+                batch.full.set()
+
+        if opener:
+            batch.full.wait(self.max_wait)
+            with self._lock:
+                if self._open.get(key) is batch:
+                    del self._open[key]
+            try:
+                stacked = (
+                    batch.frames[0]
+                    if len(batch.frames) == 1
+                    else pd.concat(batch.frames, ignore_index=True)
+                )
+                batch.result = infer(stacked)
+            except Exception:
+                batch.failed = True
+            finally:
+                batch.done.set()
+        else:
+            batch.done.wait()
+
+        if batch.failed:
+            return infer(X)
+        predictions, classes, proba = batch.result
+        return predictions[start:stop], classes, None if proba is None else proba[start:stop]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "max_wait_ms": self.max_wait * 1000,
+                "max_rows": self.max_rows,
+                "calls": self.calls,
+                "batches": self.batches,
+                "rows_per_batch": round(self.calls / self.batches, 2) if self.batches else 0.0,
+            }
+
+
+predict_coalescer = PredictCoalescer(
+    max_wait_ms=settings.PREDICT_COALESCE_MS,
+    max_rows=settings.PREDICT_COALESCE_MAX_ROWS,
+)
@@ -0,0 +1,191 @@
+"""
+Evaluation reports computed on the held-out split while training.
+
+``evaluation_report`` scores the test rows once — one ``predict`` and, for classifiers,
+one ``predict_proba`` — and derives everything from those arrays:
+
+- classifiers: accuracy, the confusion matrix, per-class precision / recall / F1 /
+  support, and for binary targets the ROC and precision-recall curves with their areas
+  (multiclass: the one-vs-rest macro ROC AUC);
+- regressors: R², MAE, RMSE, max error and the residual distribution (quantiles and a
+  histogram);
+- feature importances (``feature_importances_``, else the mean absolute ``coef_``) under
+  the names of the columns the estimator sees, largest first.
+
+Curves are thinned to at most ``MAX_CURVE_POINTS`` points and floats are rounded, so a
+report is a few KB. It is written as JSON next to the model artifact (``report_path``)
+and served from there as is.
+"""
+
+import json
+import os
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+MAX_CURVE_POINTS = 101
+MAX_IMPORTANCES = 50
+HISTOGRAM_BINS = 20
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+def report_path(model_path: str) -> str:
+    return os.path.splitext(model_path)[0] + ".report.json"
+
+
+def write_report(report: dict[str, Any], model_path: str) -> None:
+    with open(report_path(model_path), "w") as f:
+        json.dump(report, f, separators=(",", ":"))
+
+
+def _rounded(values, digits: int = 6) -> list[float]:
+    return np.round(np.asarray(values, dtype=float), digits).tolist()
+
+
+def _thin(*curves: np.ndarray) -> tuple[np.ndarray, ...]:
+    n = len(curves[0])
+    if n <= MAX_CURVE_POINTS:
+        return curves
+    keep = np.unique(np.linspace(0, n - 1, MAX_CURVE_POINTS).round().astype(int))
+    return tuple(c[keep] for c in curves)
+
+
+def _classification(model, X: pd.DataFrame, y: pd.Series) -> dict[str, Any]:
+    from sklearn.metrics import (
+        average_precision_score,
+        confusion_matrix,
+        precision_recall_curve,
+        precision_recall_fscore_support,
+        roc_auc_score,
+        roc_curve,
+    )
+
+    y_true = np.asarray(y)
+    y_pred = np.asarray(model.predict(X))
+    labels = np.unique(np.concatenate([y_true, y_pred]))
+    precision, recall, f1, support = precision_recall_fscore_support(
+        y_true, y_pred, labels=labels, zero_division=0
+    )
+    report: dict[str, Any] = {
+        "task": "classification",
+        "rows": len(y_true),
+        "accuracy": round(float(np.mean(y_true == y_pred)), 6),
+        "labels": [str(label) for label in labels],
+        "confusion_matrix": confusion_matrix(y_true, y_pred, labels=labels).tolist(),
+        "per_class": {
+            str(label): {
+                "precision": round(float(p), 6),
+                "recall": round(float(r), 6),
+                "f1": round(float(f), 6),
+                "support": int(s),
+            }
+            for label, p, r, f, s in zip(labels, precision, recall, f1, support, strict=True)
+        },
+    }
+
+    proba = None
+    if hasattr(model, "predict_proba"):
+        try:
+            proba = model.predict_proba(X)
+        except Exception:
+            proba = None
+    if proba is None:
+        return report
+
+    classes = list(model.classes_)
+    if len(classes) == 2:
+        truth = y_true == classes[1]
+        scores = proba[:, 1]
+        if truth.any() and not truth.all():
+            fpr, tpr, _ = roc_curve(truth, scores)
+            prec, rec, _ = precision_recall_curve(truth, scores)
+            fpr, tpr = _thin(fpr, tpr)
+            prec, rec = _thin(prec, rec)
+            report["roc"] = {
+                "positive_class": str(classes[1]),
+                "auc": round(float(roc_auc_score(truth, scores)), 6),
+                "fpr": _rounded(fpr),
+                "tpr": _rounded(tpr),
+            }
+            report["pr"] = {
+                "positive_class": str(classes[1]),
+                "average_precision": round(float(average_precision_score(truth, scores)), 6),
+                "precision": _rounded(prec),
+                "recall": _rounded(rec),
+            }
+    elif len(classes) > 2:
+        try:
+            auc = roc_auc_score(y_true, proba, multi_class="ovr", labels=classes)
+            report["roc_auc_ovr"] = round(float(auc), 6)
+        except ValueError:
+            pass  # a class absent from the test rows
+    return report
+
+
+def _regression(model, X: pd.DataFrame, y: pd.Series) -> dict[str, Any]:
+    from sklearn.metrics import r2_score
+
+    y_true = np.asarray(y, dtype=float)
+    y_pred = np.asarray(model.predict(X), dtype=float)
+    residuals = y_true - y_pred
+    counts, edges = np.histogram(residuals, bins=HISTOGRAM_BINS)
+    return {
+        "task": "regression",
+        "rows": len(y_true),
+        "r2": round(float(r2_score(y_true, y_pred)), 6),
+        "mae": round(float(np.mean(np.abs(residuals))), 6),
+        "rmse": round(float(np.sqrt(np.mean(residuals**2))), 6),
+        "max_error": round(float(np.max(np.abs(residuals))), 6),
+        "residuals": {
+            "mean": round(float(residuals.mean()), 6),
+            "std": round(float(residuals.std()), 6),
+            "quantiles": dict(
+                zip(map(str, QUANTILES), _rounded(np.quantile(residuals, QUANTILES)), strict=True)
+            ),
+            "histogram": {"counts": counts.tolist(), "edges": _rounded(edges)},
+        },
+    }
+
+
+def _importances(model, columns: list[str]) -> list[dict[str, Any]] | None:
+    from src.modules.ml_model.utils.preprocessing import final_estimator, preprocessor
+
+    estimator = final_estimator(model)
+    values = getattr(estimator, "feature_importances_", None)
+    if values is None:
+        coef = getattr(estimator, "coef_", None)
+        if coef is None:
+            return None
+        values = np.abs(np.atleast_2d(coef)).mean(axis=0)
+    values = np.asarray(values, dtype=float)
+
+    names = columns
+    preprocess = preprocessor(model)
+    if preprocess is not None:
+        try:
+            names = [str(n) for n in preprocess.get_feature_names_out()]
+        except Exception:
+            names = []
+    if len(names) != len(values):
+        names = [f"x{i}" for i in range(len(values))]
+
+    order = np.argsort(values)[::-1][:MAX_IMPORTANCES]
+    return [{"feature": names[i], "importance": round(float(values[i]), 6)} for i in order]
+
+
+def evaluation_report(model, X_test: pd.DataFrame, y_test: pd.Series) -> dict[str, Any] | None:
+    """The report for a fitted model on its test rows, or None if it cannot be computed."""
+    from sklearn.base import is_classifier
+
+    try:
+        if is_classifier(model):
+            report = _classification(model, X_test, y_test)
+        else:
+            report = _regression(model, X_test, y_test)
+        report["feature_importances"] = _importances(model, list(X_test.columns))
+        return report
+    except Exception as e:
+        logger.warning(f"Could not compute evaluation report: {e}")
+        return None
@@ -0,0 +1,67 @@
+"""
+Content-addressed fingerprints of training requests.
+
+A fingerprint is the SHA-256 of everything that decides what a fit produces: the bytes
+of the dataset file (plus the recipe of a lazy version), the feature list, the target,
+the canonical algorithm name, the estimator's full parameter set after defaults are
+applied, the split settings and the scikit-learn version. Two requests with the same
+fingerprint train the same model, so the second can reuse the first one's artifact.
+
+File digests are memoized per process on (path, mtime, size); the training job also
+stores them on the file's row, so a dataset is hashed once until it changes on disk.
+Fingerprinting runs inside that job, never in the request that queues it.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any
+
+FINGERPRINT_VERSION = 2  # 2: memory-lean training frames
+_BLOCK = 1024 * 1024
+
+_digests: dict[tuple[str, int, int], str] = {}
+_lock = threading.Lock()
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file's contents."""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        if key in _digests:
+            return _digests[key]
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(_BLOCK):
+            digest.update(block)
+    with _lock:
+        _digests[key] = digest.hexdigest()
+    return _digests[key]
+
+
+def training_fingerprint(
+    data_digest: str,
+    recipe: list[dict] | None,
+    features: list[str],
+    target: str,
+    algorithm: str,
+    params: dict[str, Any],
+    split: dict[str, Any],
+) -> str:
+    import sklearn
+
+    payload = {
+        "version": FINGERPRINT_VERSION,
+        "data": data_digest,
+        "recipe": recipe,
+        "features": list(features),
+        "target": target,
+        "algorithm": algorithm,
+        "params": params,
+        "split": split,
+        "sklearn": sklearn.__version__,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=repr, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
@@ -0,0 +1,63 @@
+"""
+Cross-validation folds, computed once per dataset and reused.
+
+A fold assignment is one small integer per row — the fold in which that row is held out —
+which is everything ``KFold`` / ``StratifiedKFold`` produce. Assignments are kept in an
+in-process LRU keyed by what decides the rows and their order (the caller passes the
+dataset digest, columns and target) plus the number of folds and whether they are
+stratified, so training on the same dataset again skips shuffling and stratifying.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+
+import numpy as np
+import pandas as pd
+
+FOLD_CACHE_SIZE = 32
+RANDOM_STATE = 42
+
+_cache: OrderedDict[tuple, np.ndarray] = OrderedDict()
+_lock = threading.Lock()
+
+
+def can_stratify(y: pd.Series, n_splits: int) -> bool:
+    """Whether every class has at least one row per fold."""
+    counts = y.value_counts()
+    return len(counts) > 1 and int(counts.min()) >= n_splits
+
+
+def fold_assignments(
+    key: Hashable | None, y: pd.Series, n_splits: int, stratified: bool
+) -> np.ndarray:
+    """The held-out fold of every row of ``y``; cached under ``key`` unless it is None."""
+    from sklearn.model_selection import KFold, StratifiedKFold
+
+    full_key = (key, len(y), n_splits, stratified)
+    if key is not None:
+        with _lock:
+            if full_key in _cache:
+                _cache.move_to_end(full_key)
+                return _cache[full_key]
+
+    splitter_cls = StratifiedKFold if stratified else KFold
+    splitter = splitter_cls(n_splits=n_splits, shuffle=True, random_state=RANDOM_STATE)
+    assignment = np.empty(len(y), dtype=np.int8)
+    for fold, (_, test_idx) in enumerate(splitter.split(np.zeros(len(y)), y)):
+        assignment[test_idx] = fold
+
+    if key is not None:
+        with _lock:
+            _cache[full_key] = assignment
+            while len(_cache) > FOLD_CACHE_SIZE:
+                _cache.popitem(last=False)
+    return assignment
+
+
+def fold_indices(assignment: np.ndarray) -> list[tuple[np.ndarray, np.ndarray]]:
+    """``(train, test)`` row positions per fold, as ``cv=`` accepts them."""
+    return [
+        (np.flatnonzero(assignment != fold), np.flatnonzero(assignment == fold))
+        for fold in range(int(assignment.max()) + 1)
+    ]
@@ -0,0 +1,88 @@
+"""
+Memory-lean preparation of training frames.
+
+``prepare_training_frame`` turns the loaded dataset columns into the ``X`` / ``y`` that
+estimators see, using as little memory as the values allow:
+
+- rows with NaNs in the used columns are dropped — only in the target with
+  ``drop_incomplete=False``, when a pipeline imputes the features;
+- integer columns are downcast to the smallest integer type that holds their range;
+- float64 columns become float32 when ``float32`` is set — meant for tree ensembles,
+  which cast their input to float32 anyway, so the fitted model is unchanged;
+- string columns whose distinct values are at most ``CATEGORY_MAX_RATIO`` of the rows
+  become ``category`` (the values are kept, only stored as codes).
+
+Columns that need no change are not copied: ``X`` is assembled from the dataset's own
+column arrays (safe under pandas copy-on-write), so with nothing to downcast or drop it
+costs no memory of its own. Dropping incomplete rows copies each used column once.
+
+``split_frame`` gives the same partition as ``train_test_split(X, y, test_size=...,
+random_state=...)``. A shuffled split has to gather its rows, so the partitions
+together hold one copy of ``X`` and ``y``.
+
+``scripts/benchmarks/training_frame.py`` measures both steps.
+"""
+
+import numpy as np
+import pandas as pd
+
+CATEGORY_MAX_RATIO = 0.5
+
+
+def memory_bytes(*frames: pd.DataFrame | pd.Series) -> int:
+    return int(sum(np.sum(f.memory_usage(deep=True, index=False)) for f in frames))
+
+
+def _lean(s: pd.Series, float32: bool) -> pd.Series:
+    if pd.api.types.is_bool_dtype(s):
+        return s
+    if pd.api.types.is_integer_dtype(s):
+        return pd.to_numeric(s, downcast="integer")
+    if pd.api.types.is_float_dtype(s):
+        return s.astype("float32") if float32 and s.dtype == "float64" else s
+    if pd.api.types.is_object_dtype(s) or pd.api.types.is_string_dtype(s):
+        if len(s) and s.nunique() <= CATEGORY_MAX_RATIO * len(s):
+            return s.astype("category")
+    return s
+
+
+def prepare_training_frame(
+    df: pd.DataFrame,
+    feature_cols: list[str],
+    target: str,
+    float32: bool = False,
+    drop_incomplete: bool = True,
+) -> tuple[pd.DataFrame, pd.Series, int]:
+    """Lean ``X`` and ``y`` from ``df``; also returns the footprint of the raw columns."""
+    used = [*feature_cols, target]
+    before = memory_bytes(*(df[c] for c in used))
+    complete = df[target].notna()
+    if drop_incomplete:
+        for c in feature_cols:
+            complete &= df[c].notna()
+    keep = None if complete.all() else complete.to_numpy()
+    index = df.index if keep is None else df.index[keep]
+
+    def rows(c: str) -> pd.Series:
+        # Each column is cut to the kept rows on its own, so a raw copy lives only
+        # until it is leaned, and all of them share one index
+        if keep is None:
+            return df[c]
+        return pd.Series(df[c].array[keep], index=index, name=c, copy=False)
+
+    X = pd.DataFrame({c: _lean(rows(c), float32) for c in feature_cols}, index=index, copy=False)
+    y = rows(target)
+    if pd.api.types.is_object_dtype(y) or pd.api.types.is_string_dtype(y):
+        y = _lean(y, float32=False)
+    return X, y, before
+
+
+def split_frame(
+    X: pd.DataFrame, y: pd.Series, test_size: float = 0.2, random_state: int = 42
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series]:
+    from sklearn.model_selection import train_test_split
+
+    train_idx, test_idx = train_test_split(
+        np.arange(len(X)), test_size=test_size, random_state=random_state
+    )
+    return X.iloc[train_idx], X.iloc[test_idx], y.iloc[train_idx], y.iloc[test_idx]
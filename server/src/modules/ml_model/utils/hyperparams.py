@@ -300,6 +300,308 @@ HYPERPARAMETER_SCHEMAS: dict[str, list[HyperparamDef]] = {
             "description": "Portion of the largest variance added to variances for stability.",
         },
     ],
+    "multinomial_nb": [
+        {
+            "name": "alpha",
+            "type": "float",
+            "default": 1.0,
+            "min": 0.0,
+            "max": 100.0,
+            "description": "Additive (Laplace/Lidstone) smoothing. Features must be non-negative.",
+        },
+        {
+            "name": "fit_prior",
+            "type": "bool",
+            "default": True,
+            "description": "Whether to learn class prior probabilities.",
+        },
+    ],
+    "sgd_classifier": [
+        {
+            "name": "loss",
+            "type": "select",
+            "default": "hinge",
+            "options": ["hinge", "log_loss", "modified_huber", "squared_hinge", "perceptron"],
+            "description": "Loss function. log_loss / modified_huber enable probabilities.",
+        },
+        {
+            "name": "penalty",
+            "type": "select",
+            "default": "l2",
+            "options": ["l2", "l1", "elasticnet", "None"],
+            "description": "Regularization term.",
+        },
+        {
+            "name": "alpha",
+            "type": "float",
+            "default": 0.0001,
+            "min": 0.0000001,
+            "max": 10.0,
+            "description": "Regularization strength.",
+        },
+        {
+            "name": "learning_rate",
+            "type": "select",
+            "default": "optimal",
+            "options": ["optimal", "constant", "invscaling", "adaptive"],
+            "description": "Learning rate schedule.",
+        },
+        {
+            "name": "eta0",
+            "type": "float",
+            "default": 0.01,
+            "min": 0.000001,
+            "max": 10.0,
+            "description": "Initial learning rate (not used by 'optimal').",
+        },
+        {
+            "name": "max_iter",
+            "type": "int",
+            "default": 1000,
+            "min": 1,
+            "max": 100000,
+            "description": "Max passes over the data (ignored when streaming).",
+        },
+        {
+            "name": "random_state",
+            "type": "int",
+            "default": 42,
+            "min": 0,
+            "max": 99999,
+            "description": "Random seed for reproducibility.",
+        },
+    ],
+    "passive_aggressive": [
+        {
+            "name": "eta0",
+            "type": "float",
+            "default": 1.0,
+            "min": 0.0001,
+            "max": 100.0,
+            "description": "Maximum step size (the C of passive-aggressive).",
+        },
+        {
+            "name": "learning_rate",
+            "type": "select",
+            "default": "pa1",
+            "options": ["pa1", "pa2"],
+            "description": "Passive-aggressive variant.",
+        },
+        {
+            "name": "random_state",
+            "type": "int",
+            "default": 42,
+            "min": 0,
+            "max": 99999,
+            "description": "Random seed for reproducibility.",
+        },
+    ],
+    "hist_gradient_boosting": [
+        {
+            "name": "learning_rate",
+            "type": "float",
+            "default": 0.1,
+            "min": 0.001,
+            "max": 1.0,
+            "description": "Shrinkage applied to each tree's contribution.",
+        },
+        {
+            "name": "max_iter",
+            "type": "int",
+            "default": 100,
+            "min": 1,
+            "max": 10000,
+            "description": "Maximum number of boosting iterations (trees).",
+        },
+        {
+            "name": "max_leaf_nodes",
+            "type": "int",
+            "default": 31,
+            "min": 2,
+            "max": 1024,
+            "nullable": True,
+            "description": "Max leaves per tree. Leave empty for unlimited.",
+        },
+        {
+            "name": "max_depth",
+            "type": "int",
+            "default": None,
+            "min": 1,
+            "max": 100,
+            "nullable": True,
+            "description": "Max depth of each tree. Leave empty for unlimited.",
+        },
+        {
+            "name": "min_samples_leaf",
+            "type": "int",
+            "default": 20,
+            "min": 1,
+            "max": 1000,
+            "description": "Min samples per leaf.",
+        },
+        {
+            "name": "l2_regularization",
+            "type": "float",
+            "default": 0.0,
+            "min": 0.0,
+            "max": 100.0,
+            "description": "L2 regularization of leaf values.",
+        },
+        {
+            "name": "max_bins",
+            "type": "int",
+            "default": 255,
+            "min": 2,
+            "max": 255,
+            "description": "Histogram bins per feature. Fewer bins train faster.",
+        },
+        {
+            "name": "loss",
+            "type": "select",
+            "default": "log_loss",
+            "options": ["log_loss"],
+            "description": "Loss function to be optimized.",
+        },
+        {
+            "name": "early_stopping",
+            "type": "bool",
+            "default": True,
+            "description": "Stop adding trees once the validation score stops improving.",
+        },
+        {
+            "name": "validation_fraction",
+            "type": "float",
+            "default": 0.1,
+            "min": 0.01,
+            "max": 0.5,
+            "description": "Share of training rows held out to decide early stopping.",
+        },
+        {
+            "name": "n_iter_no_change",
+            "type": "int",
+            "default": 10,
+            "min": 1,
+            "max": 100,
+            "description": "Iterations without improvement before stopping early.",
+        },
+        {
+            "name": "random_state",
+            "type": "int",
+            "default": 42,
+            "min": 0,
+            "max": 99999,
+            "description": "Random seed for reproducibility.",
+        },
+    ],
+    "extra_trees": [
+        {
+            "name": "n_estimators",
+            "type": "int",
+            "default": 100,
+            "min": 1,
+            "max": 2000,
+            "description": "Number of trees in the forest.",
+        },
+        {
+            "name": "max_depth",
+            "type": "int",
+            "default": None,
+            "min": 1,
+            "max": 100,
+            "nullable": True,
+            "description": "Max depth of each tree. Leave empty for unlimited.",
+        },
+        {
+            "name": "min_samples_split",
+            "type": "int",
+            "default": 2,
+            "min": 2,
+            "max": 50,
+            "description": "Min samples required to split an internal node.",
+        },
+        {
+            "name": "min_samples_leaf",
+            "type": "int",
+            "default": 1,
+            "min": 1,
+            "max": 50,
+            "description": "Min samples required to be at a leaf node.",
+        },
+        {
+            "name": "criterion",
+            "type": "select",
+            "default": "gini",
+            "options": ["gini", "entropy", "log_loss"],
+            "description": "Function to measure quality of split.",
+        },
+        {
+            "name": "max_features",
+            "type": "select",
+            "default": "sqrt",
+            "options": ["sqrt", "log2", "None"],
+            "description": "Number of features to consider for best split.",
+        },
+        {
+            "name": "bootstrap",
+            "type": "bool",
+            "default": False,
+            "description": "Whether to use bootstrap samples when building trees.",
+        },
+        {
+            "name": "random_state",
+            "type": "int",
+            "default": 42,
+            "min": 0,
+            "max": 99999,
+            "description": "Random seed for reproducibility.",
+        },
+    ],
+    "linear_svc": [
+        {
+            "name": "C",
+            "type": "float",
+            "default": 1.0,
+            "min": 0.0001,
+            "max": 1000.0,
+            "description": "Inverse of regularization strength.",
+        },
+        {
+            "name": "penalty",
+            "type": "select",
+            "default": "l2",
+            "options": ["l2", "l1"],
+            "description": "Regularization norm (l1 requires squared_hinge loss).",
+        },
+        {
+            "name": "loss",
+            "type": "select",
+            "default": "squared_hinge",
+            "options": ["squared_hinge", "hinge"],
+            "description": "Loss function.",
+        },
+        {
+            "name": "fit_intercept",
+            "type": "bool",
+            "default": True,
+            "description": "Whether to add a bias/intercept term.",
+        },
+        {
+            "name": "max_iter",
+            "type": "int",
+            "default": 1000,
+            "min": 10,
+            "max": 100000,
+            "description": "Maximum number of iterations.",
+        },
+        {
+            "name": "random_state",
+            "type": "int",
+            "default": 42,
+            "min": 0,
+            "max": 99999,
+            "description": "Random seed for reproducibility.",
+        },
+    ],
     # ── Regressors ───────────────────────────────────────────────────────
     "linear_regression": [
         {
@@ -482,6 +784,92 @@ HYPERPARAMETER_SCHEMAS: dict[str, list[HyperparamDef]] = {
             "description": "Hard limit on iterations (-1 = no limit).",
         },
     ],
+    "sgd_regressor": [
+        {
+            "name": "loss",
+            "type": "select",
+            "default": "squared_error",
+            "options": [
+                "squared_error",
+                "huber",
+                "epsilon_insensitive",
+                "squared_epsilon_insensitive",
+            ],
+            "description": "Loss function.",
+        },
+        {
+            "name": "penalty",
+            "type": "select",
+            "default": "l2",
+            "options": ["l2", "l1", "elasticnet", "None"],
+            "description": "Regularization term.",
+        },
+        {
+            "name": "alpha",
+            "type": "float",
+            "default": 0.0001,
+            "min": 0.0000001,
+            "max": 10.0,
+            "description": "Regularization strength.",
+        },
+        {
+            "name": "learning_rate",
+            "type": "select",
+            "default": "invscaling",
+            "options": ["invscaling", "constant", "optimal", "adaptive"],
+            "description": "Learning rate schedule.",
+        },
+        {
+            "name": "eta0",
+            "type": "float",
+            "default": 0.01,
+            "min": 0.000001,
+            "max": 10.0,
+            "description": "Initial learning rate.",
+        },
+        {
+            "name": "max_iter",
+            "type": "int",
+            "default": 1000,
+            "min": 1,
+            "max": 100000,
+            "description": "Max passes over the data (ignored when streaming).",
+        },
+        {
+            "name": "random_state",
+            "type": "int",
+            "default": 42,
+            "min": 0,
+            "max": 99999,
+            "description": "Random seed for reproducibility.",
+        },
+    ],
+    "passive_aggressive_regressor": [
+        {
+            "name": "eta0",
+            "type": "float",
+            "default": 1.0,
+            "min": 0.0001,
+            "max": 100.0,
+            "description": "Maximum step size (the C of passive-aggressive).",
+        },
+        {
+            "name": "epsilon",
+            "type": "float",
+            "default": 0.1,
+            "min": 0.0,
+            "max": 10.0,
+            "description": "Errors smaller than this are ignored.",
+        },
+        {
+            "name": "random_state",
+            "type": "int",
+            "default": 42,
+            "min": 0,
+            "max": 99999,
+            "description": "Random seed for reproducibility.",
+        },
+    ],
     "decision_tree_regressor": [
         {
             "name": "max_depth",
@@ -573,35 +961,219 @@ HYPERPARAMETER_SCHEMAS: dict[str, list[HyperparamDef]] = {
             "description": "Random seed for reproducibility.",
         },
     ],
+    "hist_gradient_boosting_regressor": [
+        {
+            "name": "learning_rate",
+            "type": "float",
+            "default": 0.1,
+            "min": 0.001,
+            "max": 1.0,
+            "description": "Shrinkage applied to each tree's contribution.",
+        },
+        {
+            "name": "max_iter",
+            "type": "int",
+            "default": 100,
+            "min": 1,
+            "max": 10000,
+            "description": "Maximum number of boosting iterations (trees).",
+        },
+        {
+            "name": "max_leaf_nodes",
+            "type": "int",
+            "default": 31,
+            "min": 2,
+            "max": 1024,
+            "nullable": True,
+            "description": "Max leaves per tree. Leave empty for unlimited.",
+        },
+        {
+            "name": "max_depth",
+            "type": "int",
+            "default": None,
+            "min": 1,
+            "max": 100,
+            "nullable": True,
+            "description": "Max depth of each tree. Leave empty for unlimited.",
+        },
+        {
+            "name": "min_samples_leaf",
+            "type": "int",
+            "default": 20,
+            "min": 1,
+            "max": 1000,
+            "description": "Min samples per leaf.",
+        },
+        {
+            "name": "l2_regularization",
+            "type": "float",
+            "default": 0.0,
+            "min": 0.0,
+            "max": 100.0,
+            "description": "L2 regularization of leaf values.",
+        },
+        {
+            "name": "max_bins",
+            "type": "int",
+            "default": 255,
+            "min": 2,
+            "max": 255,
+            "description": "Histogram bins per feature. Fewer bins train faster.",
+        },
+        {
+            "name": "loss",
+            "type": "select",
+            "default": "squared_error",
+            "options": ["squared_error", "absolute_error", "gamma", "poisson", "quantile"],
+            "description": "Loss function to be optimized.",
+        },
+        {
+            "name": "early_stopping",
+            "type": "bool",
+            "default": True,
+            "description": "Stop adding trees once the validation score stops improving.",
+        },
+        {
+            "name": "validation_fraction",
+            "type": "float",
+            "default": 0.1,
+            "min": 0.01,
+            "max": 0.5,
+            "description": "Share of training rows held out to decide early stopping.",
+        },
+        {
+            "name": "n_iter_no_change",
+            "type": "int",
+            "default": 10,
+            "min": 1,
+            "max": 100,
+            "description": "Iterations without improvement before stopping early.",
+        },
+        {
+            "name": "random_state",
+            "type": "int",
+            "default": 42,
+            "min": 0,
+            "max": 99999,
+            "description": "Random seed for reproducibility.",
+        },
+    ],
+    "extra_trees_regressor": [
+        {
+            "name": "n_estimators",
+            "type": "int",
+            "default": 100,
+            "min": 1,
+            "max": 2000,
+            "description": "Number of trees in the forest.",
+        },
+        {
+            "name": "max_depth",
+            "type": "int",
+            "default": None,
+            "min": 1,
+            "max": 100,
+            "nullable": True,
+            "description": "Max depth of each tree. Leave empty for unlimited.",
+        },
+        {
+            "name": "min_samples_split",
+            "type": "int",
+            "default": 2,
+            "min": 2,
+            "max": 50,
+            "description": "Min samples required to split an internal node.",
+        },
+        {
+            "name": "min_samples_leaf",
+            "type": "int",
+            "default": 1,
+            "min": 1,
+            "max": 50,
+            "description": "Min samples required to be at a leaf node.",
+        },
+        {
+            "name": "criterion",
+            "type": "select",
+            "default": "squared_error",
+            "options": ["squared_error", "absolute_error", "friedman_mse", "poisson"],
+            "description": "Function to measure quality of split.",
+        },
+        {
+            "name": "max_features",
+            "type": "select",
+            "default": "None",
+            "options": ["sqrt", "log2", "None"],
+            "description": "Number of features to consider for best split.",
+        },
+        {
+            "name": "bootstrap",
+            "type": "bool",
+            "default": False,
+            "description": "Whether to use bootstrap samples when building trees.",
+        },
+        {
+            "name": "random_state",
+            "type": "int",
+            "default": 42,
+            "min": 0,
+            "max": 99999,
+            "description": "Random seed for reproducibility.",
+        },
+    ],
+    "linear_svr": [
+        {
+            "name": "C",
+            "type": "float",
+            "default": 1.0,
+            "min": 0.0001,
+            "max": 1000.0,
+            "description": "Inverse of regularization strength.",
+        },
+        {
+            "name": "epsilon",
+            "type": "float",
+            "default": 0.0,
+            "min": 0.0,
+            "max": 10.0,
+            "description": "Errors smaller than this are ignored.",
+        },
+        {
+            "name": "loss",
+            "type": "select",
+            "default": "epsilon_insensitive",
+            "options": ["epsilon_insensitive", "squared_epsilon_insensitive"],
+            "description": "Loss function.",
+        },
+        {
+            "name": "fit_intercept",
+            "type": "bool",
+            "default": True,
+            "description": "Whether to add a bias/intercept term.",
+        },
+        {
+            "name": "max_iter",
+            "type": "int",
+            "default": 1000,
+            "min": 10,
+            "max": 100000,
+            "description": "Maximum number of iterations.",
+        },
+        {
+            "name": "random_state",
+            "type": "int",
+            "default": 42,
+            "min": 0,
+            "max": 99999,
+            "description": "Random seed for reproducibility.",
+        },
+    ],
 }
 
 
 def get_hyperparams(algorithm: str) -> list[HyperparamDef]:
-    """Return the hyperparameter schema list for the given algorithm key."""
-    # Normalise common aliases
-    alias_map = {
-        "randomforestclassifier": "random_forest_classifier",
-        "random_forest": "random_forest_classifier",
-        "logisticregression": "logistic_regression",
-        "svc": "svm",
-        "support_vector_machine": "svm",
-        "decisiontreeclassifier": "decision_tree",
-        "decision_tree_classifier": "decision_tree",
-        "gradientboostingclassifier": "gradient_boosting",
-        "gradient_boosting_classifier": "gradient_boosting",
-        "kneighbors": "knn",
-        "k_nearest_neighbors": "knn",
-        "gaussiannb": "naive_bayes",
-        "gaussian_naive_bayes": "naive_bayes",
-        "linearregression": "linear_regression",
-        "randomforestregressor": "random_forest_regressor",
-        "ridge_regression": "ridge",
-        "lasso_regression": "lasso",
-        "svr": "svr",
-        "support_vector_regressor": "svr",
-        "decisiontreeregressor": "decision_tree_regressor",
-        "gradientboostingregressor": "gradient_boosting_regressor",
-        "gradient_boosting_regressor": "gradient_boosting_regressor",
-    }
-    key = alias_map.get(algorithm.lower(), algorithm.lower())
-    return HYPERPARAMETER_SCHEMAS.get(key, [])
+    """Return the hyperparameter schema list for the given algorithm name or alias."""
+    from src.modules.ml_model.utils.registry import registry
+
+    algo = registry.get(algorithm)
+    return algo.hyperparameters if algo else []
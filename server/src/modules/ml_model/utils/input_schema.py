@@ -0,0 +1,179 @@
+"""
+Input schemas of models and the validators compiled from them.
+
+A model's ``inputs`` is a JSON array with one entry per feature, in training order::
+
+    [{"name": "age", "dtype": "integer", "categories": null},
+     {"name": "color", "dtype": "category", "categories": ["blue", "red"]}]
+
+``dtype`` is one of ``DTYPES``, or null for models recorded before dtypes were stored
+and for uploaded models that only name their columns. ``categories`` lists the values
+seen in training for category columns of at most ``MAX_CATEGORIES`` values — the values
+the model accepts. Models with a preprocessing pipeline encode unseen values themselves
+and are saved without it.
+
+``input_validator`` compiles a schema once per model (cached by model id and update
+time) into an ``InputValidator`` that checks request payloads for missing features and
+turns them into a typed frame in training column order: number columns become
+float64 (a value that is not a number is rejected), booleans become 0/1, columns with
+``categories`` become ``pd.Categorical`` over them (a value outside them is rejected),
+other strings and categories are passed through as given, and untyped columns keep
+pandas' inference. Missing values are let through everywhere.
+"""
+
+import ast
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+DTYPES = ("integer", "float", "boolean", "category", "string")
+MAX_CATEGORIES = 256
+VALIDATOR_CACHE_SIZE = 256
+
+
+class InputError(ValueError):
+    """A predict payload that does not match the model's input schema."""
+
+
+def _column_dtype(s: pd.Series) -> str:
+    if pd.api.types.is_bool_dtype(s):
+        return "boolean"
+    if pd.api.types.is_integer_dtype(s):
+        return "integer"
+    if pd.api.types.is_float_dtype(s):
+        return "float"
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        return "category"
+    return "string"
+
+
+def describe_columns(X: pd.DataFrame) -> list[dict[str, Any]]:
+    """The input schema of a training frame."""
+    schema = []
+    for name in X.columns:
+        s = X[name]
+        dtype = _column_dtype(s)
+        categories = None
+        if dtype == "category" and len(s.cat.categories) <= MAX_CATEGORIES:
+            categories = s.cat.categories.tolist()
+        schema.append({"name": str(name), "dtype": dtype, "categories": categories})
+    return schema
+
+
+def normalize_inputs(inputs: Any) -> list[dict[str, Any]]:
+    """
+    An input schema from what a model may carry: a schema, a list of column names, or
+    either as a JSON string, or the Python list repr that older models stored.
+    """
+    if isinstance(inputs, str):
+        try:
+            inputs = json.loads(inputs)
+        except json.JSONDecodeError:
+            try:
+                inputs = ast.literal_eval(inputs)
+            except (ValueError, SyntaxError) as e:
+                raise ValueError(f"Could not parse input schema: {inputs!r}") from e
+    if not isinstance(inputs, list):
+        raise ValueError(f"Input schema must be a list, got {type(inputs).__name__}")
+
+    schema = []
+    for column in inputs:
+        if isinstance(column, dict) and "name" in column:
+            dtype = column.get("dtype")
+            schema.append(
+                {
+                    "name": str(column["name"]),
+                    "dtype": dtype if dtype in DTYPES else None,
+                    "categories": column.get("categories"),
+                }
+            )
+        elif isinstance(column, str):
+            schema.append({"name": column, "dtype": None, "categories": None})
+        else:
+            raise ValueError(f"Invalid input schema entry: {column!r}")
+    return schema
+
+
+class InputValidator:
+    def __init__(self, schema: list[dict[str, Any]]):
+        self.names = [c["name"] for c in schema]
+        self.required = frozenset(self.names)
+        self._numeric = [c["name"] for c in schema if c["dtype"] in ("integer", "float")]
+        self._boolean = [c["name"] for c in schema if c["dtype"] == "boolean"]
+        self._categories = {
+            c["name"]: c["categories"]
+            for c in schema
+            if c["dtype"] == "category" and c["categories"] is not None
+        }
+
+    def missing(self, keys) -> list[str]:
+        """Required features absent from ``keys``, in training order."""
+        absent = self.required - keys
+        return [n for n in self.names if n in absent] if absent else []
+
+    def row(self, inputs: dict[str, Any]) -> pd.DataFrame:
+        return self.records([inputs])
+
+    def records(self, records: list[dict[str, Any]]) -> pd.DataFrame:
+        return self._typed(pd.DataFrame.from_records(records, columns=self.names))
+
+    def columns(self, columns: dict[str, list[Any]]) -> pd.DataFrame:
+        return self._typed(pd.DataFrame({name: columns[name] for name in self.names}))
+
+    def frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        return self._typed(df[self.names].copy(deep=False))
+
+    def _typed(self, X: pd.DataFrame) -> pd.DataFrame:
+        for name in self._numeric:
+            try:
+                X[name] = pd.to_numeric(X[name]).astype(np.float64)
+            except (ValueError, TypeError) as e:
+                raise InputError(f"Feature '{name}' expects numbers") from e
+        for name in self._boolean:
+            try:
+                X[name] = pd.array(X[name], dtype="boolean").to_numpy(
+                    dtype=np.float64, na_value=np.nan
+                )
+            except (ValueError, TypeError) as e:
+                raise InputError(f"Feature '{name}' expects true / false") from e
+        for name, categories in self._categories.items():
+            X[name] = _categorical(name, X[name], categories)
+        return X
+
+
+def _categorical(name: str, values: pd.Series, categories: list) -> pd.Categorical:
+    if all(isinstance(c, str) for c in categories):
+        # JSON may carry a code like 10001 as a number; training saw it as text
+        values = values.where(values.isna(), values.astype(str))
+    coded = pd.Categorical(values, categories=categories)
+    unseen = values[values.notna().to_numpy() & (coded.codes == -1)].unique()
+    if len(unseen):
+        shown = ", ".join(map(repr, categories[:10])) + (", ..." if len(categories) > 10 else "")
+        raise InputError(
+            f"Feature '{name}' got value(s) not seen in training: {unseen[:5].tolist()}; "
+            f"expects one of {shown}"
+        )
+    return coded
+
+
+_validators: OrderedDict[Hashable, InputValidator] = OrderedDict()
+_lock = threading.Lock()
+
+
+def input_validator(key: Hashable, inputs: Any) -> InputValidator:
+    """The compiled validator for ``inputs``, cached under ``key``."""
+    with _lock:
+        if key in _validators:
+            _validators.move_to_end(key)
+            return _validators[key]
+    validator = InputValidator(normalize_inputs(inputs))
+    with _lock:
+        _validators[key] = validator
+        while len(_validators) > VALIDATOR_CACHE_SIZE:
+            _validators.popitem(last=False)
+    return validator
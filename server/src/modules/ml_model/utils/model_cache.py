@@ -0,0 +1,41 @@
+"""
+Process-wide LRU cache of deserialized models for the predict path.
+
+Entries are keyed by the model's ``file_id`` and remember the (mtime, size) of the
+artifact they were loaded from, so a file that changes on disk is reloaded even if
+nobody invalidated it explicitly. The cache is bounded both by entry count and by
+an estimate of the bytes held (the artifact size on disk); see
+``src.common.cache.lru``.
+"""
+
+import os
+from collections.abc import Callable
+from typing import Any
+from uuid import UUID
+
+import joblib
+
+from src.common.cache.lru import BoundedLRUCache
+from src.common.config import settings
+
+
+class ModelCache(BoundedLRUCache):
+    def get(self, file_id: UUID, path: str, loader: Callable[[str], Any] = joblib.load) -> Any:
+        """Return the model stored at ``path``, loading it on a miss."""
+        stat = os.stat(path)
+        return self.load(
+            file_id,
+            (stat.st_mtime_ns, stat.st_size),
+            lambda: loader(path),
+            sizeof=lambda model: stat.st_size,
+        )
+
+    def invalidate(self, file_id: UUID | None) -> None:
+        if file_id is not None:
+            self.discard(lambda key: key == file_id)
+
+
+model_cache = ModelCache(
+    max_entries=settings.MODEL_CACHE_MAX_ENTRIES,
+    max_bytes=settings.MODEL_CACHE_MAX_MB * 1024 * 1024,
+)
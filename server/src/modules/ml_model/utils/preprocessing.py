@@ -0,0 +1,130 @@
+"""
+Preprocessing stored together with the estimator.
+
+``build_pipeline`` wraps an estimator in ``Pipeline([("preprocess", ColumnTransformer),
+("model", estimator)])`` so that a saved model takes the raw values of the columns it was
+trained on and ``predict`` runs every transform in the same vectorized call. Each
+feature column is passed through:
+
+- the column-wise steps of the dataset version's recipe (``fill_mean``, ``fill_median``,
+  the scalers, ``label_encoder``), refitted on the training rows — a model trained on a
+  lazy transformed version therefore accepts the untransformed values of its base file;
+- imputation of whatever is still missing: the median for numbers, the most frequent
+  value for strings;
+- for string columns an encoder: ordinal codes for tree models, one-hot (at most
+  ``MAX_ONE_HOT`` columns) otherwise. Values unseen in training encode as -1 / the
+  infrequent bucket instead of failing;
+- for numeric columns of non-tree models, standard scaling.
+
+Columns with the same chain of steps share one transformer.
+"""
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+MAX_ONE_HOT = 50
+
+
+def _as_str(X):
+    # What ``label_encoder`` encodes: every value as its string (NaN as "nan")
+    return np.asarray(X, dtype=object).astype(str)
+
+
+def _recipe_chains(recipe: list[dict[str, Any]] | None, columns: list[str]) -> dict:
+    from src.modules.dataset.utils.recipe import CLEAN_STRATEGIES, TRANSFORM_STRATEGIES
+
+    chains: dict[str, list[str]] = {c: [] for c in columns}
+    for step in recipe or ():
+        # drop_nulls filters rows, which is up to the caller when loading the training rows
+        strategy = step.get("strategy")
+        if strategy == "drop_nulls" or strategy not in (*CLEAN_STRATEGIES, *TRANSFORM_STRATEGIES):
+            continue
+        for c in step.get("columns") or columns:
+            if c in chains:
+                chains[c].append(strategy)
+    return chains
+
+
+def _column_steps(strategies: tuple[str, ...], numeric: bool, trees: bool) -> list:
+    from sklearn.impute import SimpleImputer
+    from sklearn.preprocessing import (
+        FunctionTransformer,
+        MinMaxScaler,
+        OneHotEncoder,
+        OrdinalEncoder,
+        StandardScaler,
+    )
+
+    numeric_steps = {
+        "fill_mean": lambda: SimpleImputer(strategy="mean"),
+        "fill_median": lambda: SimpleImputer(strategy="median"),
+        "standard_scaler": StandardScaler,
+        "min_max_scaler": MinMaxScaler,
+    }
+    steps = []
+    for strategy in strategies:
+        if strategy == "label_encoder":
+            steps.append(FunctionTransformer(_as_str, feature_names_out="one-to-one"))
+            steps.append(OrdinalEncoder(handle_unknown="use_encoded_value", unknown_value=-1))
+            numeric = True
+        elif numeric:
+            steps.append(numeric_steps[strategy]())
+        # Filling and scaling leave string columns alone, as they do in apply_recipe
+
+    if numeric:
+        steps.append(SimpleImputer(strategy="median"))
+        if not trees:
+            steps.append(StandardScaler())
+    else:
+        steps.append(SimpleImputer(strategy="most_frequent"))
+        if trees:
+            steps.append(OrdinalEncoder(handle_unknown="use_encoded_value", unknown_value=-1))
+        else:
+            steps.append(
+                OneHotEncoder(
+                    handle_unknown="infrequent_if_exist",
+                    max_categories=MAX_ONE_HOT,
+                    sparse_output=False,
+                )
+            )
+    return steps
+
+
+def build_pipeline(
+    estimator, X: pd.DataFrame, recipe: list[dict[str, Any]] | None = None, trees: bool = False
+):
+    """An unfitted preprocessing + ``estimator`` pipeline for the columns of ``X``."""
+    from sklearn.compose import ColumnTransformer
+    from sklearn.pipeline import Pipeline, make_pipeline
+
+    chains = _recipe_chains(recipe, list(X.columns))
+    groups: dict[tuple[tuple[str, ...], bool], list[str]] = {}
+    for col in X.columns:
+        numeric = pd.api.types.is_numeric_dtype(X[col])
+        groups.setdefault((tuple(chains[col]), numeric), []).append(col)
+
+    preprocess = ColumnTransformer(
+        [
+            (f"columns_{i}", make_pipeline(*_column_steps(strategies, numeric, trees)), cols)
+            for i, ((strategies, numeric), cols) in enumerate(groups.items())
+        ],
+        sparse_threshold=0.0,
+        verbose_feature_names_out=False,
+    )
+    return Pipeline([("preprocess", preprocess), ("model", estimator)])
+
+
+def final_estimator(model):
+    """The estimator itself, whether ``model`` is a bare estimator or a pipeline."""
+    from sklearn.pipeline import Pipeline
+
+    return model[-1] if isinstance(model, Pipeline) else model
+
+
+def preprocessor(model):
+    """The fitted preprocessing part of a pipeline model, or None for a bare estimator."""
+    from sklearn.pipeline import Pipeline
+
+    return model[:-1] if isinstance(model, Pipeline) else None
@@ -0,0 +1,424 @@
+"""
+Registry of trainable algorithms.
+
+Each ``Algorithm`` maps a canonical name and its aliases to an estimator class given as
+an import path, so sklearn modules are only imported when an algorithm is first built.
+It also carries the task type, the hyperparameter schema (``HYPERPARAMETER_SCHEMAS``
+unless the entry brings its own) and the capabilities the service checks before
+streaming, warm starts or parallel fits. For ensembles, ``ensemble_param`` names the
+parameter that warm-start retraining grows (``n_estimators``, or ``max_iter`` for
+histogram gradient boosting).
+
+New estimators are added with ``registry.register(Algorithm(...))`` or, from another
+installed package, through an ``mlcore.algorithms`` entry point whose target is an
+``Algorithm`` (or a list of them); entry points are loaded on the first lookup.
+"""
+
+import importlib
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from loguru import logger
+
+from src.modules.ml_model.utils.hyperparams import HYPERPARAMETER_SCHEMAS, HyperparamDef
+
+ENTRY_POINT_GROUP = "mlcore.algorithms"
+CAPABILITIES = ("partial_fit", "warm_start", "n_jobs", "predict_proba")
+
+
+@dataclass(frozen=True)
+class Algorithm:
+    name: str
+    estimator: str  # "package.module:ClassName" (or a function returning the estimator)
+    task: Literal["classifier", "regressor"]
+    aliases: tuple[str, ...] = ()
+    defaults: dict[str, Any] = field(default_factory=dict)  # applied before user params
+    schema: list[HyperparamDef] | None = None
+    partial_fit: bool = False
+    warm_start: bool = False
+    n_jobs: bool = False
+    predict_proba: bool = False
+    # Parameter that sets the ensemble size, grown when warm-start retraining
+    ensemble_param: str | None = None
+    # Fits on float32 internally (sklearn trees), so float32 training frames lose nothing
+    float32: bool = False
+
+    def load(self) -> type:
+        module, _, cls = self.estimator.partition(":")
+        return getattr(importlib.import_module(module), cls)
+
+    def build(self, params: dict[str, Any] | None = None) -> Any:
+        return self.load()(**{**self.defaults, **(params or {})})
+
+    @property
+    def hyperparameters(self) -> list[HyperparamDef]:
+        if self.schema is not None:
+            return self.schema
+        return HYPERPARAMETER_SCHEMAS.get(self.name, [])
+
+    def describe(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "task": self.task,
+            "aliases": list(self.aliases),
+            "capabilities": [c for c in CAPABILITIES if getattr(self, c)],
+        }
+
+
+class AlgorithmRegistry:
+    def __init__(self):
+        self._algorithms: dict[str, Algorithm] = {}
+        self._aliases: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._plugins_loaded = False
+
+    def register(self, algorithm: Algorithm) -> Algorithm:
+        """Add (or replace) an algorithm; its name and aliases are matched case-insensitively."""
+        with self._lock:
+            self._algorithms[algorithm.name] = algorithm
+            for key in (algorithm.name, *algorithm.aliases):
+                self._aliases[key.lower()] = algorithm.name
+        return algorithm
+
+    def get(self, name: str) -> Algorithm | None:
+        self._load_plugins()
+        canonical = self._aliases.get(name.lower())
+        return self._algorithms.get(canonical) if canonical else None
+
+    def all(self, capability: str | None = None) -> list[Algorithm]:
+        self._load_plugins()
+        algorithms = list(self._algorithms.values())
+        if capability is not None:
+            algorithms = [a for a in algorithms if getattr(a, capability)]
+        return algorithms
+
+    def names(self, capability: str | None = None) -> list[str]:
+        return [a.name for a in self.all(capability)]
+
+    def _load_plugins(self) -> None:
+        if self._plugins_loaded:
+            return
+        self._plugins_loaded = True
+        from importlib.metadata import entry_points
+
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            try:
+                loaded = entry_point.load()
+                for algorithm in loaded if isinstance(loaded, (list, tuple)) else [loaded]:
+                    self.register(algorithm)
+            except Exception as e:
+                logger.warning(f"Could not load algorithm plugin {entry_point.name}: {e}")
+
+
+registry = AlgorithmRegistry()
+
+
+def _sgd_has_pa() -> bool:
+    # learning_rate="pa1" / "pa2", which replaces PassiveAggressive*, came with sklearn 1.8
+    from importlib.metadata import version
+
+    major, minor = (int(part) for part in version("scikit-learn").split(".")[:2])
+    return (major, minor) >= (1, 8)
+
+
+def _passive_aggressive(sgd: str, legacy: str, losses: dict[str, str], **params):
+    from sklearn import linear_model
+
+    if _sgd_has_pa():
+        return getattr(linear_model, sgd)(**params)
+    # Older sklearn: the same model under its former class and parameter names
+    params.pop("penalty", None)
+    params["loss"] = losses[params.pop("learning_rate", "pa1")]
+    if "eta0" in params:
+        params["C"] = params.pop("eta0")
+    return getattr(linear_model, legacy)(**params)
+
+
+def _passive_aggressive_classifier(**params):
+    return _passive_aggressive(
+        "SGDClassifier",
+        "PassiveAggressiveClassifier",
+        {"pa1": "hinge", "pa2": "squared_hinge"},
+        **params,
+    )
+
+
+def _passive_aggressive_regressor(**params):
+    return _passive_aggressive(
+        "SGDRegressor",
+        "PassiveAggressiveRegressor",
+        {"pa1": "epsilon_insensitive", "pa2": "squared_epsilon_insensitive"},
+        **params,
+    )
+
+
+# ── Classifiers ──────────────────────────────────────────────────────────
+registry.register(
+    Algorithm(
+        name="random_forest_classifier",
+        estimator="sklearn.ensemble:RandomForestClassifier",
+        task="classifier",
+        aliases=("randomforestclassifier", "random_forest"),
+        warm_start=True,
+        n_jobs=True,
+        predict_proba=True,
+        ensemble_param="n_estimators",
+        float32=True,
+    )
+)
+registry.register(
+    Algorithm(
+        name="logistic_regression",
+        estimator="sklearn.linear_model:LogisticRegression",
+        task="classifier",
+        aliases=("logisticregression",),
+        warm_start=True,
+        n_jobs=True,
+        predict_proba=True,
+    )
+)
+registry.register(
+    Algorithm(
+        name="svm",
+        estimator="sklearn.svm:SVC",
+        task="classifier",
+        aliases=("svc", "support_vector_machine"),
+    )
+)
+registry.register(
+    Algorithm(
+        name="decision_tree",
+        estimator="sklearn.tree:DecisionTreeClassifier",
+        task="classifier",
+        aliases=("decision_tree_classifier", "decisiontreeclassifier"),
+        predict_proba=True,
+        float32=True,
+    )
+)
+registry.register(
+    Algorithm(
+        name="gradient_boosting",
+        estimator="sklearn.ensemble:GradientBoostingClassifier",
+        task="classifier",
+        aliases=("gradient_boosting_classifier", "gradientboostingclassifier"),
+        warm_start=True,
+        predict_proba=True,
+        ensemble_param="n_estimators",
+        float32=True,
+    )
+)
+registry.register(
+    Algorithm(
+        name="knn",
+        estimator="sklearn.neighbors:KNeighborsClassifier",
+        task="classifier",
+        aliases=("kneighbors", "k_nearest_neighbors"),
+        n_jobs=True,
+        predict_proba=True,
+    )
+)
+registry.register(
+    Algorithm(
+        name="naive_bayes",
+        estimator="sklearn.naive_bayes:GaussianNB",
+        task="classifier",
+        aliases=("gaussiannb", "gaussian_naive_bayes"),
+        partial_fit=True,
+        predict_proba=True,
+    )
+)
+registry.register(
+    Algorithm(
+        name="multinomial_nb",
+        estimator="sklearn.naive_bayes:MultinomialNB",
+        task="classifier",
+        aliases=("multinomialnb", "multinomial_naive_bayes"),
+        partial_fit=True,
+        predict_proba=True,
+    )
+)
+registry.register(
+    Algorithm(
+        name="sgd_classifier",
+        estimator="sklearn.linear_model:SGDClassifier",
+        task="classifier",
+        aliases=("sgdclassifier", "sgd"),
+        partial_fit=True,
+        warm_start=True,
+        n_jobs=True,
+    )
+)
+registry.register(
+    Algorithm(
+        # PassiveAggressiveClassifier is deprecated in sklearn 1.8 in favour of
+        # SGDClassifier(learning_rate="pa1"); earlier versions build the former
+        name="passive_aggressive",
+        estimator="src.modules.ml_model.utils.registry:_passive_aggressive_classifier",
+        task="classifier",
+        aliases=("passive_aggressive_classifier", "passiveaggressiveclassifier"),
+        defaults={"loss": "hinge", "penalty": None, "learning_rate": "pa1", "eta0": 1.0},
+        partial_fit=True,
+        warm_start=True,
+        n_jobs=True,
+    )
+)
+
+registry.register(
+    Algorithm(
+        name="hist_gradient_boosting",
+        estimator="sklearn.ensemble:HistGradientBoostingClassifier",
+        task="classifier",
+        aliases=("hist_gradient_boosting_classifier", "histgradientboostingclassifier"),
+        defaults={"early_stopping": True},
+        warm_start=True,
+        predict_proba=True,
+        ensemble_param="max_iter",
+    )
+)
+registry.register(
+    Algorithm(
+        name="extra_trees",
+        estimator="sklearn.ensemble:ExtraTreesClassifier",
+        task="classifier",
+        aliases=("extra_trees_classifier", "extratreesclassifier"),
+        warm_start=True,
+        n_jobs=True,
+        predict_proba=True,
+        ensemble_param="n_estimators",
+        float32=True,
+    )
+)
+registry.register(
+    Algorithm(
+        name="linear_svc",
+        estimator="sklearn.svm:LinearSVC",
+        task="classifier",
+        aliases=("linearsvc", "linear_svm"),
+    )
+)
+
+# ── Regressors ───────────────────────────────────────────────────────────
+registry.register(
+    Algorithm(
+        name="linear_regression",
+        estimator="sklearn.linear_model:LinearRegression",
+        task="regressor",
+        aliases=("linearregression",),
+        n_jobs=True,
+    )
+)
+registry.register(
+    Algorithm(
+        name="random_forest_regressor",
+        estimator="sklearn.ensemble:RandomForestRegressor",
+        task="regressor",
+        aliases=("randomforestregressor",),
+        warm_start=True,
+        n_jobs=True,
+        ensemble_param="n_estimators",
+        float32=True,
+    )
+)
+registry.register(
+    Algorithm(
+        name="ridge",
+        estimator="sklearn.linear_model:Ridge",
+        task="regressor",
+        aliases=("ridge_regression",),
+    )
+)
+registry.register(
+    Algorithm(
+        name="lasso",
+        estimator="sklearn.linear_model:Lasso",
+        task="regressor",
+        aliases=("lasso_regression",),
+        warm_start=True,
+    )
+)
+registry.register(
+    Algorithm(
+        name="svr",
+        estimator="sklearn.svm:SVR",
+        task="regressor",
+        aliases=("support_vector_regressor",),
+    )
+)
+registry.register(
+    Algorithm(
+        name="decision_tree_regressor",
+        estimator="sklearn.tree:DecisionTreeRegressor",
+        task="regressor",
+        aliases=("decisiontreeregressor",),
+        float32=True,
+    )
+)
+registry.register(
+    Algorithm(
+        name="gradient_boosting_regressor",
+        estimator="sklearn.ensemble:GradientBoostingRegressor",
+        task="regressor",
+        aliases=("gradientboostingregressor",),
+        warm_start=True,
+        ensemble_param="n_estimators",
+        float32=True,
+    )
+)
+registry.register(
+    Algorithm(
+        name="sgd_regressor",
+        estimator="sklearn.linear_model:SGDRegressor",
+        task="regressor",
+        aliases=("sgdregressor",),
+        partial_fit=True,
+        warm_start=True,
+    )
+)
+registry.register(
+    Algorithm(
+        name="passive_aggressive_regressor",
+        estimator="src.modules.ml_model.utils.registry:_passive_aggressive_regressor",
+        task="regressor",
+        aliases=("passiveaggressiveregressor",),
+        defaults={
+            "loss": "epsilon_insensitive",
+            "penalty": None,
+            "learning_rate": "pa1",
+            "eta0": 1.0,
+        },
+        partial_fit=True,
+        warm_start=True,
+    )
+)
+registry.register(
+    Algorithm(
+        name="hist_gradient_boosting_regressor",
+        estimator="sklearn.ensemble:HistGradientBoostingRegressor",
+        task="regressor",
+        aliases=("histgradientboostingregressor",),
+        defaults={"early_stopping": True},
+        warm_start=True,
+        ensemble_param="max_iter",
+    )
+)
+registry.register(
+    Algorithm(
+        name="extra_trees_regressor",
+        estimator="sklearn.ensemble:ExtraTreesRegressor",
+        task="regressor",
+        aliases=("extratreesregressor",),
+        warm_start=True,
+        n_jobs=True,
+        ensemble_param="n_estimators",
+        float32=True,
+    )
+)
+registry.register(
+    Algorithm(
+        name="linear_svr",
+        estimator="sklearn.svm:LinearSVR",
+        task="regressor",
+        aliases=("linearsvr",),
+    )
+)
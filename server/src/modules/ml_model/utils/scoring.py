@@ -0,0 +1,95 @@
+"""
+Bulk scoring of a dataset file, one chunk at a time.
+
+``score_chunk`` turns a chunk of the dataset into its rows of output: the requested
+pass-through columns, ``prediction`` and — for classifiers with ``predict_proba`` —
+one ``proba_<class>`` column per class. Rows a bare estimator cannot score (missing
+feature values; a pipeline imputes them instead) get an empty prediction.
+
+``ResultWriter`` appends those frames to a CSV or Parquet file as they come, so memory
+use is bounded by the chunk size whatever the size of the dataset.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import pandas as pd
+
+FORMATS = ("csv", "parquet")
+
+
+def score_chunk(
+    chunk: pd.DataFrame,
+    X: pd.DataFrame,
+    infer: Callable[[pd.DataFrame], tuple[list, list[str] | None, Any]],
+    include_columns: list[str],
+    impute: bool,
+) -> tuple[pd.DataFrame, int]:
+    """The output rows for ``chunk`` (features ``X``) and how many of them were scored."""
+    out = chunk[include_columns].reset_index(drop=True)
+    X = X.reset_index(drop=True)
+    complete = None if impute else X.notna().all(axis=1)
+    if complete is not None and not complete.all():
+        X = X[complete]
+
+    if len(X):
+        predictions, classes, proba = infer(X)
+    else:
+        predictions, classes, proba = [], None, None
+    # Nullable dtypes keep the column's type when some rows have no prediction
+    out["prediction"] = pd.Series(pd.array(predictions), index=X.index).reindex(out.index)
+    if proba is not None:
+        for i, cls in enumerate(classes):
+            out[f"proba_{cls}"] = pd.Series(proba[:, i], index=X.index).reindex(out.index)
+    return out, len(X)
+
+
+class ResultWriter:
+    """Append frames with the same columns to a CSV or Parquet file."""
+
+    def __init__(self, path: str, fmt: str):
+        self.path = path
+        self.fmt = fmt
+        self._csv = None
+        self._parquet = None
+        self._columns: list[str] | None = None
+
+    def write(self, frame: pd.DataFrame) -> None:
+        if self._columns is None:
+            self._columns = list(frame.columns)
+        elif list(frame.columns) != self._columns:
+            # A chunk without a single scorable row has no probability columns
+            frame = frame.reindex(columns=self._columns)
+
+        if self.fmt == "csv":
+            if self._csv is None:
+                self._csv = open(self.path, "w", newline="")
+                frame.to_csv(self._csv, index=False)
+            else:
+                frame.to_csv(self._csv, index=False, header=False)
+            return
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self._parquet is None:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            self._parquet = pq.ParquetWriter(self.path, table.schema)
+        else:
+            try:
+                table = pa.Table.from_pandas(
+                    frame, schema=self._parquet.schema, preserve_index=False
+                )
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                raise ValueError(
+                    f"Column types changed between chunks ({e}); write CSV instead"
+                ) from e
+        self._parquet.write_table(table)
+
+    def close(self) -> None:
+        if self._csv is not None:
+            self._csv.close()
+        if self._parquet is not None:
+            self._parquet.close()
+        if self._columns is None:  # no chunks: an empty file
+            open(self.path, "w").close()
@@ -0,0 +1,248 @@
+"""
+Hyperparameter search built on the ranges in ``HYPERPARAMETER_SCHEMAS``.
+
+The schema bounds are form-validation limits (``n_estimators`` goes up to 2000), so
+numeric parameters are searched within a decade either side of their default, clipped
+to ``min``/``max``; ``select`` params use their ``options`` and ``bool`` params both
+values. Parameters that only control the budget or the seed are left out unless the
+request asks for them, and ``search_space`` can pin any parameter to explicit values.
+
+Trials are run by sklearn's search classes on a single predefined train/test split —
+the same 80/20 split ``train_model`` scores on — with ``n_jobs`` workers. joblib hands
+the training arrays to those workers as one shared memory-mapped copy.
+"""
+
+import math
+from typing import Any
+
+import numpy as np
+from scipy import stats
+
+from src.modules.ml_model.utils.hyperparams import HyperparamDef, get_hyperparams
+
+NOT_SEARCHED = {"random_state", "n_jobs", "verbose", "max_iter"}
+HALVING_MIN_ROWS = 200
+
+
+class _MaybeNone:
+    """Distribution that returns None with probability ``p_none``, else samples ``dist``."""
+
+    def __init__(self, dist: Any, p_none: float):
+        self.dist = dist
+        self.p_none = p_none
+
+    def rvs(self, random_state=None):
+        rng = random_state if random_state is not None else np.random.default_rng()
+        if rng.random() < self.p_none:
+            return None
+        return self.dist.rvs(random_state=rng)
+
+
+def _option(value: Any) -> Any:
+    return None if value == "None" else value
+
+
+def _window(param: HyperparamDef) -> tuple[float, float] | None:
+    """Numeric range to search: a decade around the default, clipped to the schema."""
+    lo, hi, default = param.get("min"), param.get("max"), param.get("default")
+    if default is None:
+        if lo is None or hi is None:
+            return None
+        return float(lo), float(hi)
+    if not isinstance(default, (int, float)) or default <= 0:
+        return None
+    lo = default / 10 if lo is None else max(lo, default / 10)
+    hi = default * 10 if hi is None else min(hi, default * 10)
+    if param["type"] == "int":
+        lo, hi = max(lo, 1), max(hi, 1)
+    return (float(lo), float(hi)) if hi > lo else None
+
+
+def _log_scale(lo: float, hi: float) -> bool:
+    return lo > 0 and hi / lo >= 20
+
+
+def _grid_values(param: HyperparamDef, points: int) -> list[Any] | None:
+    kind = param["type"]
+    if kind == "bool":
+        return [True, False]
+    if kind == "select":
+        return [_option(o) for o in param.get("options", [])] or None
+    if kind not in ("int", "float"):
+        return None
+    window = _window(param)
+    if window is None:
+        return None
+    lo, hi = window
+    values = np.geomspace(lo, hi, points) if _log_scale(lo, hi) else np.linspace(lo, hi, points)
+    if kind == "int":
+        values = sorted({int(round(v)) for v in values})
+    else:
+        values = [float(f"{v:.6g}") for v in values]
+    if param.get("nullable"):
+        values = [*values, None]
+    return values
+
+
+def _distribution(param: HyperparamDef) -> Any:
+    kind = param["type"]
+    if kind in ("bool", "select"):
+        return _grid_values(param, 0)
+    if kind not in ("int", "float"):
+        return None
+    window = _window(param)
+    if window is None:
+        return None
+    lo, hi = window
+    if kind == "int":
+        if _log_scale(lo, hi):
+            dist = _IntLogUniform(lo, hi)
+        else:
+            dist = stats.randint(int(math.ceil(lo)), int(math.floor(hi)) + 1)
+    else:
+        dist = stats.loguniform(lo, hi) if _log_scale(lo, hi) else stats.uniform(lo, hi - lo)
+    return _MaybeNone(dist, 0.2) if param.get("nullable") else dist
+
+
+class _IntLogUniform:
+    def __init__(self, lo: float, hi: float):
+        self.dist = stats.loguniform(lo, hi)
+
+    def rvs(self, random_state=None):
+        return int(round(float(self.dist.rvs(random_state=random_state))))
+
+
+def build_search_space(
+    algorithm: str,
+    strategy: str,
+    grid_points: int = 3,
+    params: list[str] | None = None,
+    overrides: dict[str, list[Any]] | None = None,
+    fixed: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Parameter grid (``strategy="grid"``) or distributions (random / halving) for an
+    algorithm. ``params`` restricts which schema parameters are searched, ``overrides``
+    supplies explicit candidate values and ``fixed`` parameters are never searched.
+    """
+    schema = {p["name"]: p for p in get_hyperparams(algorithm)}
+    overrides = overrides or {}
+    fixed = fixed or {}
+    names = params if params is not None else [n for n in schema if n not in NOT_SEARCHED]
+
+    space: dict[str, Any] = {}
+    for name in names:
+        if name in fixed or name in overrides or name not in schema:
+            continue
+        if strategy == "grid":
+            values = _grid_values(schema[name], grid_points)
+        else:
+            values = _distribution(schema[name])
+        if values:
+            space[name] = values
+    for name, values in overrides.items():
+        if name not in fixed:
+            space[name] = [_option(v) for v in values]
+    return space
+
+
+def _json_safe(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def leaderboard(cv_results: dict[str, Any]) -> list[dict[str, Any]]:
+    """One row per evaluated trial, best first (later halving rounds rank above earlier)."""
+    rows = []
+    for i, params in enumerate(cv_results["params"]):
+        score = _json_safe(cv_results["mean_test_score"][i])
+        row = {
+            "params": {k: _json_safe(v) for k, v in params.items()},
+            "score": score,
+            "status": "ok" if score is not None else "failed",
+            "fit_time": round(float(cv_results["mean_fit_time"][i]), 4),
+            "score_time": round(float(cv_results["mean_score_time"][i]), 4),
+        }
+        if "iter" in cv_results:
+            row["round"] = int(cv_results["iter"][i])
+            row["n_resources"] = int(cv_results["n_resources"][i])
+        rows.append(row)
+    rows.sort(
+        key=lambda r: (-r.get("round", 0), r["score"] is None, -(r["score"] or 0.0)),
+    )
+    for rank, row in enumerate(rows, start=1):
+        row["rank"] = rank
+    return rows
+
+
+def run_search(
+    estimator: Any,
+    space: dict[str, Any],
+    strategy: str,
+    X: Any,
+    y: Any,
+    split: tuple[np.ndarray, np.ndarray],
+    max_trials: int,
+    n_jobs: int,
+    random_state: int = 42,
+) -> Any:
+    """Run the search over one predefined ``split`` of ``X``/``y``; returns the fitted search."""
+    import warnings
+
+    from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+    from sklearn.model_selection import (
+        GridSearchCV,
+        HalvingRandomSearchCV,
+        ParameterGrid,
+        RandomizedSearchCV,
+    )
+
+    common = {"cv": [split], "n_jobs": n_jobs, "refit": False, "error_score": np.nan}
+    if strategy == "grid":
+        grid = ParameterGrid(space)
+        if len(grid) > max_trials:
+            # Too many combinations: evaluate a uniform sample of the grid instead
+            rng = np.random.default_rng(random_state)
+            picks = rng.choice(len(grid), size=max_trials, replace=False)
+            search = GridSearchCV(estimator, [_as_grid(grid[int(i)]) for i in picks], **common)
+        else:
+            search = GridSearchCV(estimator, space, **common)
+    elif strategy == "random":
+        search = RandomizedSearchCV(
+            estimator, space, n_iter=max_trials, random_state=random_state, **common
+        )
+    else:
+        # Rounds keep the best third of candidates on three times the rows. The first
+        # round gets enough rows for its subsampled test fold to be meaningful.
+        rounds = 1 + int(math.log(max_trials, 3)) if max_trials > 1 else 1
+        min_resources = min(len(y), max(len(y) // 3 ** (rounds - 1), HALVING_MIN_ROWS))
+        search = HalvingRandomSearchCV(
+            estimator,
+            space,
+            n_candidates=max_trials,
+            factor=3,
+            min_resources=min_resources,
+            random_state=random_state,
+            **common,
+        )
+
+    with warnings.catch_warnings():
+        # Failed trials are reported on the leaderboard; don't flood the log with them
+        warnings.simplefilter("ignore")
+        search.fit(X, y)
+    return search
+
+
+def _as_grid(params: dict[str, Any]) -> dict[str, list[Any]]:
+    return {k: [v] for k, v in params.items()}
+
+
+def describe_error(e: Exception) -> str:
+    """First and last line of an error — sklearn's all-trials-failed message is a traceback."""
+    lines = [line for line in str(e).strip().splitlines() if line.strip()]
+    if len(lines) <= 2:
+        return " ".join(lines)
+    return f"{lines[0]} {lines[-1]}"
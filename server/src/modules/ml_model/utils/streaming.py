@@ -0,0 +1,107 @@
+"""
+Out-of-core training for estimators with ``partial_fit``.
+
+The dataset is streamed in bounded chunks and never held in memory as a whole. Each
+chunk is split into train / validation rows by a mask drawn from a generator seeded
+with the chunk's position, so every pass over the file sees the same split without
+storing it. Training rows go to ``partial_fit`` (shuffled within the chunk, for
+``epochs`` passes); a final pass scores the validation rows with running sums —
+accuracy for classifiers, R² for regressors — which match ``model.score`` on the
+same rows.
+"""
+
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+ChunkSource = Callable[[], Iterator[pd.DataFrame]]
+
+
+def _split_mask(index: int, rows: int, validation_fraction: float, seed: int) -> np.ndarray:
+    """True for the validation rows of chunk number ``index``."""
+    return np.random.default_rng([seed, index]).random(rows) < validation_fraction
+
+
+def _clean(chunk: pd.DataFrame, feature_cols: list[str], target: str):
+    # Same rule as train_model: drop rows with NaNs in targets or features
+    chunk = chunk[[*feature_cols, target]].dropna()
+    return chunk[feature_cols], chunk[target]
+
+
+def collect_classes(chunks: Iterator[pd.DataFrame], target: str) -> np.ndarray:
+    """Every target label in the dataset, as ``partial_fit`` needs them up front."""
+    classes: set = set()
+    for chunk in chunks:
+        classes.update(chunk[target].dropna().unique().tolist())
+    return np.array(sorted(classes))
+
+
+def stream_fit(
+    model: Any,
+    chunks: ChunkSource,
+    feature_cols: list[str],
+    target: str,
+    validation_fraction: float,
+    epochs: int = 1,
+    classes: np.ndarray | None = None,
+    seed: int = 42,
+    on_chunk: Callable[[int], None] | None = None,
+) -> int:
+    """Fit ``model`` with ``partial_fit`` on the training rows; returns rows trained on."""
+    trained = 0
+    for epoch in range(epochs):
+        rng = np.random.default_rng([seed, epoch])
+        for i, chunk in enumerate(chunks()):
+            train = chunk[~_split_mask(i, len(chunk), validation_fraction, seed)]
+            X, y = _clean(train, feature_cols, target)
+            if len(X):
+                order = rng.permutation(len(X))
+                X, y = X.iloc[order], y.iloc[order]
+                if classes is not None:
+                    model.partial_fit(X, y, classes=classes)
+                else:
+                    model.partial_fit(X, y)
+                trained += len(X)
+            if on_chunk:
+                on_chunk(len(chunk))
+    return trained
+
+
+def stream_score(
+    model: Any,
+    chunks: ChunkSource,
+    feature_cols: list[str],
+    target: str,
+    validation_fraction: float,
+    seed: int = 42,
+) -> tuple[float, int]:
+    """Score ``model`` on the validation rows; returns (score, validation rows)."""
+    from sklearn.base import is_classifier
+
+    classifier = is_classifier(model)
+    n = 0
+    correct = 0
+    sum_y = sum_y2 = ss_res = 0.0
+    for i, chunk in enumerate(chunks()):
+        valid = chunk[_split_mask(i, len(chunk), validation_fraction, seed)]
+        X, y = _clean(valid, feature_cols, target)
+        if not len(X):
+            continue
+        pred = model.predict(X)
+        n += len(X)
+        if classifier:
+            correct += int((pred == y.to_numpy()).sum())
+        else:
+            y_true = y.to_numpy(dtype="float64")
+            sum_y += float(y_true.sum())
+            sum_y2 += float((y_true**2).sum())
+            ss_res += float(((y_true - pred) ** 2).sum())
+
+    if n == 0:
+        raise ValueError("No validation rows — increase validation_fraction")
+    if classifier:
+        return correct / n, n
+    ss_tot = sum_y2 - sum_y * sum_y / n
+    return (1.0 - ss_res / ss_tot if ss_tot > 0 else 0.0), n
@@ -0,0 +1,196 @@
+"""
+Resource telemetry for training runs.
+
+``training_run()`` opens a run for the current context (a nested ``train_model`` inside
+``retrain_model`` joins the outer run). Code along the training path wraps its stages in
+``phase("load" | "split" | "fit" | "score" | "save")`` and reports the data size with
+``note(rows=..., columns=...)`` (plus the training frame's memory before and after
+preparation); both are no-ops outside a run, so the same helpers serve
+search and predict code paths untouched.
+
+A run has a ``kind``: ``"train"`` for one estimator fitted (and scored) once, or
+``"search"`` / ``"automl"`` for a job that fits many candidates before saving the one it
+keeps — those are opened with ``@recorded(kind=...)``. Their telemetry is the cost of
+the whole job, so it is stored with the kept model but left out of per-algorithm
+statistics.
+
+Wall time is measured per phase and for the whole run. CPU seconds are what the process
+used during the run, measured from inside it — every thread (``getrusage(RUSAGE_SELF)``)
+plus its worker processes: those still alive, like joblib's persistent loky workers, are
+read from ``/proc/<pid>/stat`` at the start and end of the run, and those that exited
+and were reaped during it from ``RUSAGE_CHILDREN``. Without ``/proc`` only reaped
+workers are counted. Peak RSS is the process high-water mark: on Linux it is reset when
+the run starts, so it covers the run alone; elsewhere it is the peak since the worker
+process started.
+"""
+
+import functools
+import os
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+PHASES = ("load", "split", "fit", "score", "save")
+
+_current: ContextVar["TrainingRun | None"] = ContextVar("training_run", default=None)
+
+
+def _rusage_seconds() -> tuple[float, float]:
+    """(this process, reaped children) CPU seconds."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return time.process_time(), 0.0
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime, children.ru_utime + children.ru_stime
+
+
+def _live_children_cpu() -> dict[int, float]:
+    """CPU seconds of each running child process, read from /proc (empty elsewhere)."""
+    parent = os.getpid()
+    tick = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+    children = {}
+    try:
+        pids = [int(name) for name in os.listdir("/proc") if name.isdigit()]
+    except OSError:
+        return children
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                # The command name may hold spaces, so fields are counted after it
+                fields = f.read().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        if int(fields[1]) == parent:
+            children[pid] = (int(fields[11]) + int(fields[12])) / tick
+    return children
+
+
+class _CpuClock:
+    """CPU seconds used by this process and its child processes since creation."""
+
+    def __init__(self):
+        self._self, self._reaped = _rusage_seconds()
+        self._live = _live_children_cpu()
+
+    def elapsed(self) -> float:
+        own, reaped = _rusage_seconds()
+        live = _live_children_cpu()
+        # A child reaped since the start is in RUSAGE_CHILDREN with its whole lifetime
+        before = sum(cpu for pid, cpu in self._live.items() if pid not in live)
+        running = sum(cpu - self._live.get(pid, 0.0) for pid, cpu in live.items())
+        return own - self._self + reaped - self._reaped - before + running
+
+
+def _reset_peak_rss() -> None:
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _peak_rss_bytes() -> int | None:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # bytes on macOS, KiB elsewhere
+
+
+class TrainingRun:
+    def __init__(self, kind: str = "train"):
+        _reset_peak_rss()
+        self.kind = kind
+        self.seconds: dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.rows: int | None = None
+        self.columns: int | None = None
+        self.frame_bytes_before: int | None = None
+        self.frame_bytes_after: int | None = None
+        self._wall = time.perf_counter()
+        self._cpu = _CpuClock()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] = self.seconds.get(name, 0.0) + time.perf_counter() - started
+
+    def summary(self, artifact_bytes: int | None = None) -> dict[str, Any]:
+        """Everything recorded so far, as the columns of a ``ModelTelemetry`` row."""
+        return {
+            "kind": self.kind,
+            **{f"{name}_seconds": round(self.seconds[name], 4) for name in PHASES},
+            "total_seconds": round(time.perf_counter() - self._wall, 4),
+            "cpu_seconds": round(self._cpu.elapsed(), 4),
+            "peak_rss_bytes": _peak_rss_bytes(),
+            "rows": self.rows,
+            "columns": self.columns,
+            "frame_bytes_before": self.frame_bytes_before,
+            "frame_bytes_after": self.frame_bytes_after,
+            "artifact_bytes": artifact_bytes,
+        }
+
+
+def current_run() -> TrainingRun | None:
+    return _current.get()
+
+
+@contextmanager
+def training_run(kind: str = "train") -> Iterator[TrainingRun]:
+    run = _current.get()
+    if run is not None:
+        yield run
+        return
+    token = _current.set(TrainingRun(kind))
+    try:
+        yield _current.get()
+    finally:
+        _current.reset(token)
+
+
+def recorded(fn: Callable | None = None, *, kind: str = "train") -> Callable:
+    """Run ``fn`` inside a ``training_run``: ``@recorded`` or ``@recorded(kind=...)``."""
+    if fn is None:
+        return functools.partial(recorded, kind=kind)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with training_run(kind):
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    run = _current.get()
+    if run is None:
+        yield
+        return
+    with run.phase(name):
+        yield
+
+
+def note(**sizes: int | None) -> None:
+    """Record data sizes on the run: ``rows``, ``columns``, ``frame_bytes_before/after``."""
+    run = _current.get()
+    if run is None:
+        return
+    for name, value in sizes.items():
+        if value is not None:
+            setattr(run, name, int(value))
@@ -49,12 +49,38 @@ class RecentModelItem(BaseModel):
 class RecentDatasetItem(BaseModel):
     id: str
     name: str
-    rows: int
-    columns: int
+    rows: int | None
+    columns: int | None
     version: str
     created_at: str
 
 
+# ── Training telemetry ───────────────────────────────────────────────────────
+
+
+class TrainingTelemetrySummary(BaseModel):
+    runs: int = 0
+    total_fit_seconds: float = 0.0
+    avg_fit_seconds: float = 0.0
+    max_fit_seconds: float = 0.0
+    avg_total_seconds: float = 0.0
+    total_cpu_seconds: float = 0.0
+    avg_peak_rss_bytes: int = 0
+    max_peak_rss_bytes: int = 0
+    total_rows_trained: int = 0
+    total_artifact_bytes: int = 0
+    reuses: int = 0  # training requests answered with an identical earlier model
+
+
+class TrainingTelemetryByTypeItem(BaseModel):
+    type: str
+    runs: int
+    avg_fit_seconds: float
+    avg_total_seconds: float
+    avg_peak_rss_bytes: int
+    max_peak_rss_bytes: int
+
+
 # ── Full stats response ───────────────────────────────────────────────────────
 
 
@@ -65,3 +91,5 @@ class StatsResponse(BaseModel):
     datasets_over_time: list[DatasetTimelineItem]
     recent_models: list[RecentModelItem]
     recent_datasets: list[RecentDatasetItem]
+    training: TrainingTelemetrySummary = TrainingTelemetrySummary()
+    training_by_type: list[TrainingTelemetryByTypeItem] = []
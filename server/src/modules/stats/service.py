@@ -11,6 +11,8 @@ from src.modules.stats.schema import (
     RecentModelItem,
     StatsResponse,
     SummarySchema,
+    TrainingTelemetryByTypeItem,
+    TrainingTelemetrySummary,
 )
 from src.modules.stats.store.repository import StatsRepository
 
@@ -68,6 +70,15 @@ class StatsService:
             for d in self.repo.get_recent_datasets(db=db, user_id=user_id)
         ]
 
+        # Training telemetry
+        training = TrainingTelemetrySummary(
+            **self.repo.get_training_telemetry(db=db, user_id=user_id)
+        )
+        training_by_type = [
+            TrainingTelemetryByTypeItem(**t)
+            for t in self.repo.get_training_telemetry_by_type(db=db, user_id=user_id)
+        ]
+
         return StatsResponse(
             summary=SummarySchema(
                 total_datasets=total_datasets,
@@ -82,4 +93,6 @@ class StatsService:
             datasets_over_time=datasets_over_time,
             recent_models=recent_models,
             recent_datasets=recent_datasets,
+            training=training,
+            training_by_type=training_by_type,
         )
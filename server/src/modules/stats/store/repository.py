@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session
 
 from src.modules.dataset.store.models import Dataset
 from src.modules.file.store.model import Files
-from src.modules.ml_model.store.model import MLModel
+from src.modules.ml_model.store.model import MLModel, ModelTelemetry
 
 
 class StatsRepository:
@@ -97,3 +97,69 @@ class StatsRepository:
             .limit(limit)
             .all()
         )
+
+    def get_training_telemetry(self, db: Session, user_id: UUID) -> dict:
+        row = (
+            db.query(
+                func.count(ModelTelemetry.id),
+                func.sum(ModelTelemetry.fit_seconds),
+                func.avg(ModelTelemetry.fit_seconds),
+                func.max(ModelTelemetry.fit_seconds),
+                func.avg(ModelTelemetry.total_seconds),
+                func.sum(ModelTelemetry.cpu_seconds),
+                func.avg(ModelTelemetry.peak_rss_bytes),
+                func.max(ModelTelemetry.peak_rss_bytes),
+                func.sum(ModelTelemetry.rows),
+                func.sum(ModelTelemetry.artifact_bytes),
+                func.sum(ModelTelemetry.reuse_count),
+            )
+            .join(MLModel, MLModel.id == ModelTelemetry.model_id)
+            # Versions that reuse an artifact ran no training of their own
+            .filter(MLModel.user_id == user_id, ModelTelemetry.reused_from_id.is_(None))
+            .first()
+        )
+        return {
+            "runs": row[0] or 0,
+            "total_fit_seconds": round(float(row[1] or 0), 3),
+            "avg_fit_seconds": round(float(row[2] or 0), 3),
+            "max_fit_seconds": round(float(row[3] or 0), 3),
+            "avg_total_seconds": round(float(row[4] or 0), 3),
+            "total_cpu_seconds": round(float(row[5] or 0), 3),
+            "avg_peak_rss_bytes": int(row[6] or 0),
+            "max_peak_rss_bytes": int(row[7] or 0),
+            "total_rows_trained": int(row[8] or 0),
+            "total_artifact_bytes": int(row[9] or 0),
+            "reuses": int(row[10] or 0),
+        }
+
+    def get_training_telemetry_by_type(self, db: Session, user_id: UUID) -> list[dict]:
+        rows = (
+            db.query(
+                MLModel.model_type,
+                func.count(ModelTelemetry.id),
+                func.avg(ModelTelemetry.fit_seconds),
+                func.avg(ModelTelemetry.total_seconds),
+                func.avg(ModelTelemetry.peak_rss_bytes),
+                func.max(ModelTelemetry.peak_rss_bytes),
+            )
+            .join(MLModel, MLModel.id == ModelTelemetry.model_id)
+            .filter(
+                MLModel.user_id == user_id,
+                ModelTelemetry.reused_from_id.is_(None),
+                # A search / AutoML run timed every candidate, not one fit of this type
+                ModelTelemetry.kind == "train",
+            )
+            .group_by(MLModel.model_type)
+            .all()
+        )
+        return [
+            {
+                "type": r[0],
+                "runs": r[1],
+                "avg_fit_seconds": round(float(r[2] or 0), 3),
+                "avg_total_seconds": round(float(r[3] or 0), 3),
+                "avg_peak_rss_bytes": int(r[4] or 0),
+                "max_peak_rss_bytes": int(r[5] or 0),
+            }
+            for r in rows
+        ]
@@ -0,0 +1,78 @@
+import threading
+import time
+
+from src.common.cache.lru import BoundedLRUCache
+
+
+def _load(cache, key, signature, value, nbytes=1, calls=None):
+    def loader():
+        if calls is not None:
+            calls.append(key)
+        return value
+
+    return cache.load(key, signature, loader, sizeof=lambda v: nbytes)
+
+
+def test_hit_until_the_signature_changes():
+    cache = BoundedLRUCache(max_entries=4, max_bytes=100)
+    calls = []
+    assert _load(cache, "k", (1, 10), "v1", calls=calls) == "v1"
+    assert _load(cache, "k", (1, 10), "other", calls=calls) == "v1"
+    assert _load(cache, "k", (2, 10), "v2", calls=calls) == "v2"  # rewritten file
+    assert calls == ["k", "k"]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 1)
+
+
+def test_evicts_least_recently_used_by_count_and_bytes():
+    cache = BoundedLRUCache(max_entries=2, max_bytes=10)
+    _load(cache, "a", (0, 0), "a", nbytes=4)
+    _load(cache, "b", (0, 0), "b", nbytes=4)
+    _load(cache, "a", (0, 0), "a", nbytes=4)  # a is now the most recent
+    _load(cache, "c", (0, 0), "c", nbytes=4)
+    assert set(cache._entries) == {"a", "c"}
+
+    _load(cache, "d", (0, 0), "d", nbytes=8)  # over the byte budget: a and c go
+    assert set(cache._entries) == {"d"}
+    assert cache.stats()["bytes"] == 8
+    assert cache.stats()["evictions"] == 3
+
+
+def test_values_larger_than_the_budget_are_not_kept():
+    cache = BoundedLRUCache(max_entries=2, max_bytes=10)
+    assert _load(cache, "big", (0, 0), "big", nbytes=11) == "big"
+    assert cache.stats()["entries"] == 0
+
+
+def test_discard_and_clear():
+    cache = BoundedLRUCache(max_entries=4, max_bytes=100)
+    for key in ("a1", "a2", "b1"):
+        _load(cache, key, (0, 0), key, nbytes=5)
+    cache.discard(lambda key: key.startswith("a"))
+    assert set(cache._entries) == {"b1"}
+    assert cache.stats()["bytes"] == 5
+    cache.clear()
+    assert cache.stats()["entries"] == 0 and cache.stats()["bytes"] == 0
+
+
+def test_concurrent_misses_share_one_load_and_leave_no_lock_behind():
+    cache = BoundedLRUCache(max_entries=4, max_bytes=100)
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.2)
+        return object()
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.load("k", (0, 0), slow, lambda v: 1)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert len({id(r) for r in results}) == 1
+    assert cache._loading == {}
@@ -0,0 +1,195 @@
+"""
+Shared fixtures.
+
+The app runs against a fresh SQLite database in a temporary working directory, set up
+before ``src`` is imported (settings read the environment at import time). Uploads are
+written relative to the working directory, and the app's startup migrates the database
+with the server's own ``alembic.ini`` and migrations, linked into that directory. Job
+worker processes are spawned from here, so they inherit all of it.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+
+SERVER_DIR = Path(__file__).resolve().parent.parent
+WORKDIR = Path(tempfile.mkdtemp(prefix="mlcore-tests-"))
+
+os.environ["DB_PATH"] = str(WORKDIR / "test.db")
+os.environ["BCRYPT_ROUNDS"] = "4"
+os.environ["JWT_SECRET"] = "test-secret-long-enough-for-hs256-keys"
+os.environ["JOB_WORKERS"] = "2"
+for name in ("alembic.ini", "migrations"):
+    (WORKDIR / name).symlink_to(SERVER_DIR / name)
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.common.db.session import SessionLocal  # noqa: E402
+from src.main import app as _app  # noqa: E402
+
+JOB_TIMEOUT = 180
+FEATURES = ["a", "b", "c"]
+
+
+@pytest.fixture(scope="session")
+def app():
+    cwd = os.getcwd()
+    os.chdir(WORKDIR)
+    try:
+        with TestClient(_app):  # runs startup (migrations) and, at the end, shutdown
+            yield _app
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(WORKDIR, ignore_errors=True)
+
+
+def signed_in(app) -> TestClient:
+    """A client signed in as a new user; ``client.user_id`` is that user's id."""
+    c = TestClient(app)
+    tag = uuid.uuid4().hex[:12]
+    r = c.post(
+        "/api/auth/signup",
+        json={
+            "username": f"user-{tag}",
+            "email": f"user-{tag}@example.com",
+            "password": "pw",
+            "phone": str(int(tag, 16)),
+        },
+    )
+    assert r.status_code == 200, r.text
+    c.headers["Authorization"] = f"Bearer {r.json()['token']}"
+    c.user_id = uuid.UUID(c.get("/api/auth/profile").json()["id"])
+    return c
+
+
+@pytest.fixture
+def client(app) -> TestClient:
+    return signed_in(app)
+
+
+@pytest.fixture
+def db() -> Iterator:
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def make_frame(n: int = 400, seed: int = 0, nulls: bool = False) -> pd.DataFrame:
+    """Two numeric features, an integer, a colour, a binary label and a regression target."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "a": rng.normal(size=n),
+            "b": rng.integers(0, 10, size=n),
+            "c": rng.normal(size=n),
+            "color": rng.choice(["red", "green", "blue"], size=n),
+        }
+    )
+    if nulls:
+        df.loc[::17, "c"] = None
+    df["label"] = (df["a"] + df["c"].fillna(0) > 0).astype(int)
+    df["y"] = 2 * df["a"] + df["b"] + rng.normal(size=n) * 0.1
+    return df
+
+
+def payload(dataset: dict, algorithm: str, target: str = "label", **extra: Any) -> dict:
+    """A training request on the numeric features of a ``make_frame()`` dataset."""
+    return {
+        "dataset_id": dataset["id"],
+        "model_algorithm": algorithm,
+        "target_column": target,
+        "features": FEATURES,
+        **extra,
+    }
+
+
+@pytest.fixture
+def upload_file(client) -> Callable[..., dict]:
+    """Upload ``df`` as a CSV named ``name``; returns the file record."""
+
+    def upload(df: pd.DataFrame, name: str | None = None) -> dict:
+        name = name or f"data-{uuid.uuid4().hex[:8]}.csv"
+        r = client.post(
+            "/api/dataset/upload",
+            files={"file": (name, df.to_csv(index=False).encode(), "text/csv")},
+        )
+        assert r.status_code == 200, r.text
+        return r.json()
+
+    return upload
+
+
+@pytest.fixture
+def upload_dataset(client, upload_file) -> Callable[..., dict]:
+    """Upload ``df`` (default ``make_frame()``) and register it as a dataset."""
+
+    def upload(df: pd.DataFrame | None = None, name: str | None = None) -> dict:
+        file = upload_file(make_frame() if df is None else df, name)
+        r = client.post(
+            "/api/dataset",
+            json={
+                "name": "ds",
+                "description": "test data",
+                "file_id": file["id"],
+                "rows": 0,
+                "columns": 0,
+                "dataset_metadata": {},
+            },
+        )
+        assert r.status_code == 200, r.text
+        return r.json()
+
+    return upload
+
+
+@pytest.fixture
+def wait_job(client) -> Callable[..., dict]:
+    """Poll a job until it completes or fails."""
+
+    def wait(job_id: str, timeout: float = JOB_TIMEOUT) -> dict:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            r = client.get(f"/api/ml_model/jobs/{job_id}")
+            assert r.status_code == 200, r.text
+            job = r.json()
+            if job["status"] in ("completed", "failed"):
+                return job
+            time.sleep(0.1)
+        raise TimeoutError(f"job {job_id} still {job['status']}")
+
+    return wait
+
+
+@pytest.fixture
+def run_job(client, wait_job) -> Callable[..., dict]:
+    """POST ``payload`` to a job endpoint (training by default) and wait for the job."""
+
+    def run(payload: dict[str, Any], url: str = "/api/ml_model/train") -> dict:
+        r = client.post(url, json=payload)
+        assert r.status_code == 202, r.text
+        return wait_job(r.json()["id"])
+
+    return run
+
+
+@pytest.fixture
+def train(run_job) -> Callable[..., dict]:
+    """Train through the job queue and return the completed job's result."""
+
+    def fit(payload: dict[str, Any], url: str = "/api/ml_model/train") -> dict:
+        job = run_job(payload, url)
+        assert job["status"] == "completed", job["error"]
+        return job["result"]
+
+    return fit
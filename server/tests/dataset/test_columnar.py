@@ -0,0 +1,113 @@
+import os
+
+import pandas as pd
+import pytest
+from conftest import make_frame
+
+from src.modules.dataset.utils import columnar
+from src.modules.dataset.utils.columnar import (
+    SidecarWriter,
+    has_fresh_sidecar,
+    iter_chunks,
+    read_columns,
+    read_dataset,
+    read_dtypes,
+    sidecar_path,
+)
+
+
+@pytest.fixture
+def csv(tmp_path) -> str:
+    path = str(tmp_path / "data.csv")
+    make_frame(n=50).to_csv(path, index=False)
+    return path
+
+
+def _set_mtime(path: str, than: str, offset_s: int) -> None:
+    mtime = os.stat(than).st_mtime_ns + offset_s * 1_000_000_000
+    os.utime(path, ns=(mtime, mtime))
+
+
+def test_first_read_writes_a_sidecar_that_later_reads_use(csv, monkeypatch):
+    df = read_dataset(csv, "csv")
+    assert has_fresh_sidecar(csv)
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError("parsed the CSV again")
+
+    monkeypatch.setattr(columnar, "read_source", no_parse)
+    again = read_dataset(csv, "csv")
+    pd.testing.assert_frame_equal(again, df)
+    pd.testing.assert_frame_equal(read_dataset(csv, "csv", columns=["c", "a"]), df[["c", "a"]])
+    assert read_columns(csv, "csv") == df.columns.tolist()
+    assert read_dtypes(csv, "csv") == df.dtypes.astype(str).to_dict()
+
+
+def test_sidecar_older_than_its_source_is_ignored(csv):
+    read_dataset(csv, "csv")
+    make_frame(n=20, seed=3).to_csv(csv, index=False)
+    _set_mtime(sidecar_path(csv), csv, -1)
+
+    assert not has_fresh_sidecar(csv)
+    assert len(read_dataset(csv, "csv")) == 20
+    assert has_fresh_sidecar(csv)  # rebuilt
+    assert len(read_dataset(csv, "csv")) == 20
+
+
+def test_unreadable_sidecar_falls_back_to_the_source(csv):
+    with open(sidecar_path(csv), "wb") as f:
+        f.write(b"not parquet")
+    _set_mtime(sidecar_path(csv), csv, 1)
+
+    assert len(read_dataset(csv, "csv")) == 50
+    assert read_columns(csv, "csv")[:3] == ["a", "b", "c"]
+
+
+def test_chunks_cover_the_dataset_with_or_without_a_sidecar(csv):
+    expected = pd.read_csv(csv, usecols=["a", "color"])
+    from_csv = list(iter_chunks(csv, "csv", 16, columns=["a", "color"]))
+    read_dataset(csv, "csv")
+    from_sidecar = list(iter_chunks(csv, "csv", 16, columns=["a", "color"]))
+
+    for chunks in (from_csv, from_sidecar):
+        assert [len(c) for c in chunks] == [16, 16, 16, 2]
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+
+
+def test_streamed_sidecar_is_abandoned_when_chunk_types_drift(tmp_path):
+    location = str(tmp_path / "drift.csv")
+    pd.DataFrame({"x": [1]}).to_csv(location, index=False)
+
+    writer = SidecarWriter(location)
+    writer.write(pd.DataFrame({"x": [1, 2]}))
+    writer.write(pd.DataFrame({"x": ["a", "b"]}))
+    assert not writer.close()
+    assert not os.path.exists(sidecar_path(location))
+    assert not os.path.exists(writer.tmp)
+
+    writer = SidecarWriter(location)
+    for start in (0, 2):
+        writer.write(pd.DataFrame({"x": [start, start + 1]}))
+    assert writer.close()
+    assert pd.read_parquet(sidecar_path(location))["x"].tolist() == [0, 1, 2, 3]
+
+
+def test_dataset_sidecar_is_built_on_upload_and_removed_with_the_dataset(client, upload_file):
+    file = upload_file(make_frame())
+    location = file["location"].lstrip("/")  # relative to the app's working directory
+    dataset = client.post(
+        "/api/dataset",
+        json={
+            "name": "ds",
+            "description": "",
+            "file_id": file["id"],
+            "rows": 0,
+            "columns": 0,
+            "dataset_metadata": {},
+        },
+    ).json()
+    assert has_fresh_sidecar(location)
+
+    assert client.delete(f"/api/dataset/{dataset['id']}").status_code == 200
+    assert not os.path.exists(location)
+    assert not os.path.exists(sidecar_path(location))
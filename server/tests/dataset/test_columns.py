@@ -0,0 +1,52 @@
+import uuid
+from contextlib import contextmanager
+
+import pandas as pd
+import pytest
+from conftest import make_frame, signed_in
+
+from src.modules.dataset.store.models import Dataset
+
+
+@contextmanager
+def no_full_parse():
+    def refuse(*args, **kwargs):
+        raise AssertionError("parsed the whole dataset")
+
+    with pytest.MonkeyPatch.context() as mp:
+        for reader in ("read_csv", "read_parquet", "read_excel"):
+            mp.setattr(pd, reader, refuse)
+        yield
+
+
+def test_columns_come_from_the_stored_profile(client, upload_dataset):
+    df = make_frame()
+    dataset = upload_dataset(df)
+
+    with no_full_parse():
+        columns = client.get(f"/api/dataset/{dataset['id']}/columns")
+        details = client.get(f"/api/dataset/{dataset['id']}/columns/details")
+    assert columns.status_code == 200, columns.text
+    assert columns.json() == df.columns.tolist()
+    assert details.json() == df.dtypes.astype(str).to_dict()
+
+
+def test_datasets_without_a_profile_use_the_sidecar_schema(client, db, upload_dataset):
+    df = make_frame()
+    dataset = upload_dataset(df)
+    db.query(Dataset).filter(Dataset.id == uuid.UUID(dataset["id"])).update(
+        {"dataset_metadata": {}}
+    )
+    db.commit()
+
+    with no_full_parse():
+        details = client.get(f"/api/dataset/{dataset['id']}/columns/details")
+    assert details.status_code == 200, details.text
+    assert details.json() == df.dtypes.astype(str).to_dict()
+
+
+def test_columns_are_private(app, client, upload_dataset):
+    dataset = upload_dataset()
+    other = signed_in(app)
+    assert other.get(f"/api/dataset/{dataset['id']}/columns").status_code == 403
+    assert other.get(f"/api/dataset/{dataset['id']}/columns/details").status_code == 403
@@ -0,0 +1,87 @@
+import os
+import uuid
+
+import pandas as pd
+import pytest
+from conftest import make_frame
+
+from src.modules.dataset.utils.frame_cache import DataFrameCache
+
+
+@pytest.fixture
+def cache() -> DataFrameCache:
+    return DataFrameCache(max_entries=8, max_bytes=1 << 24)
+
+
+@pytest.fixture
+def csv(tmp_path) -> str:
+    path = str(tmp_path / "data.csv")
+    make_frame(n=50).to_csv(path, index=False)
+    return path
+
+
+class Loader:
+    def __init__(self, path: str):
+        self.path = path
+        self.calls: list[list[str] | None] = []
+
+    def __call__(self, columns: list[str] | None) -> pd.DataFrame:
+        self.calls.append(columns)
+        return pd.read_csv(self.path, usecols=columns)
+
+
+def test_hit_until_the_file_is_rewritten(cache, csv):
+    file_id = uuid.uuid4()
+    load = Loader(csv)
+    first = cache.get(file_id, csv, load)
+    pd.testing.assert_frame_equal(cache.get(file_id, csv, load), first)
+    assert load.calls == [None]
+
+    make_frame(n=20, seed=1).to_csv(csv, index=False)
+    assert len(cache.get(file_id, csv, load)) == 20
+    assert load.calls == [None, None]
+
+    # Same size, newer mtime
+    stat = os.stat(csv)
+    os.utime(csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    cache.get(file_id, csv, load)
+    assert len(load.calls) == 3
+    assert cache.stats()["hits"] == 1
+
+
+def test_projection_is_cut_from_the_cached_full_frame(cache, csv):
+    file_id = uuid.uuid4()
+    load = Loader(csv)
+    full = cache.get(file_id, csv, load)
+    projected = cache.get(file_id, csv, load, columns=["c", "a"])
+    pd.testing.assert_frame_equal(projected, full[["c", "a"]])
+    assert load.calls == [None]
+
+    # Without a full frame only the projection is read
+    other = uuid.uuid4()
+    cache.get(other, csv, load, columns=["a"])
+    assert load.calls == [None, ["a"]]
+
+
+def test_handed_out_frames_do_not_share_writes_with_the_cache(cache, csv):
+    file_id = uuid.uuid4()
+    load = Loader(csv)
+    df = cache.get(file_id, csv, load)
+    original = df["a"].copy()
+    df["a"] = 0.0
+    df.drop(columns=["b"], inplace=True)
+
+    again = cache.get(file_id, csv, load)
+    pd.testing.assert_series_equal(again["a"], original)
+    assert "b" in again.columns
+    assert load.calls == [None]
+
+
+def test_invalidate_drops_every_projection_of_a_file(cache, csv):
+    file_id, other = uuid.uuid4(), uuid.uuid4()
+    load = Loader(csv)
+    cache.get(file_id, csv, load, columns=["a"])
+    cache.get(file_id, csv, load, columns=["b"])
+    cache.get(other, csv, load)
+    cache.invalidate(file_id)
+    assert set(cache._entries) == {(other, None)}
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import make_frame
+
+from src.modules.dataset.utils import profiler
+from src.modules.dataset.utils.columnar import has_fresh_sidecar
+from src.modules.dataset.utils.profiler import profile_dataset, profile_frames
+
+
+def _chunks(df: pd.DataFrame, size: int) -> list[pd.DataFrame]:
+    return [df.iloc[i : i + size] for i in range(0, len(df), size)]
+
+
+def test_chunked_profile_matches_the_whole_frame():
+    df = make_frame(n=500, nulls=True)
+    profile = profile_frames(_chunks(df, 37))
+
+    assert profile["shape"] == {"rows": 500, "columns": df.shape[1]}
+    assert profile["dtypes"] == df.dtypes.astype(str).to_dict()
+    assert profile["missing_values"] == df.isnull().sum().to_dict()
+    assert profile["unique_values"] == df.nunique().to_dict()
+    assert profile["preview"] == df.head(5).replace({np.nan: None}).to_dict("records")
+
+    described = df.describe()
+    assert profile["statistics"].keys() == set(described.columns)
+    for name, stats in profile["statistics"].items():
+        assert stats == pytest.approx(described[name].to_dict())
+
+
+def test_nulls_in_a_later_chunk_widen_an_integer_column():
+    df = pd.DataFrame({"n": [1.0, 2.0, 3.0, None]})
+    chunks = [df.iloc[:3].astype({"n": "int64"}), df.iloc[3:]]
+    profile = profile_frames(chunks)
+    assert profile["dtypes"] == {"n": "float64"}
+    assert profile["missing_values"] == {"n": 1}
+    assert profile["statistics"]["n"]["mean"] == pytest.approx(2.0)
+
+
+def test_text_only_dataset_reports_top_and_frequency():
+    df = pd.DataFrame({"word": ["b", "a", "b", None, "b", "c"]})
+    profile = profile_frames(_chunks(df, 2))
+    assert profile["statistics"] == {"word": {"count": 5, "unique": 3, "top": "b", "freq": 3}}
+
+
+def test_distinct_count_is_estimated_past_the_sketch_size(monkeypatch):
+    monkeypatch.setattr(profiler, "KMV_SIZE", 256)
+    df = pd.DataFrame({"x": np.arange(20_000)})
+    distinct = profile_frames(_chunks(df, 1_000))["unique_values"]["x"]
+    assert distinct == pytest.approx(20_000, rel=0.2)
+
+
+def test_file_is_profiled_in_budgeted_chunks_and_gets_a_sidecar(tmp_path, monkeypatch):
+    path = str(tmp_path / "big.csv")
+    df = make_frame(n=3_500)
+    df.to_csv(path, index=False)
+
+    seen = []
+    original = profiler.profile_frames
+
+    def spy(chunks):
+        return original(seen.append(len(c)) or c for c in chunks)
+
+    monkeypatch.setattr(profiler, "profile_frames", spy)
+    profile = profile_dataset(path, "csv", max_memory_bytes=1)
+    assert seen == [1_000, 1_000, 1_000, 500]
+    whole = original([pd.read_csv(path)])
+    statistics = whole.pop("statistics")
+    for name, stats in profile.pop("statistics").items():
+        assert stats == pytest.approx(statistics[name])
+    assert profile == whole
+    assert has_fresh_sidecar(path)
@@ -0,0 +1,94 @@
+import uuid
+
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import make_frame
+
+from src.modules.dataset.service import DatasetService
+from src.modules.dataset.utils.recipe import apply_recipe, make_step
+
+STEPS = [
+    ("clean", {"strategy": "fill_mean", "columns": ["c"]}),
+    ("transform", {"strategy": "standard_scaler", "columns": ["a", "c"]}),
+    ("clean", {"strategy": "drop_nulls", "columns": None}),
+    ("transform", {"strategy": "label_encoder", "columns": ["color"]}),
+]
+
+
+def _one_by_one(df: pd.DataFrame, steps: list[dict]) -> pd.DataFrame:
+    for step in steps:
+        df = apply_recipe(df, [step])
+    return df
+
+
+def test_fused_recipe_equals_the_steps_applied_one_by_one():
+    df = make_frame(nulls=True)
+    df.loc[::5, "a"] = np.nan
+    steps = [
+        make_step("clean", "fill_median", ["a"]),
+        make_step("transform", "min_max_scaler", ["a", "b"]),
+        make_step("clean", "drop_nulls", ["c"]),
+        make_step("clean", "drop_nulls", None),
+        make_step("transform", "standard_scaler", None),
+        make_step("transform", "label_encoder", ["color"]),
+        make_step("transform", "unknown", ["a"]),
+    ]
+    before = df.copy()
+    pd.testing.assert_frame_equal(apply_recipe(df, steps), _one_by_one(df, steps))
+    pd.testing.assert_frame_equal(df, before)  # the input is left alone
+
+
+def _derive(client, dataset: dict, lazy: bool) -> dict:
+    for op, body in STEPS:
+        r = client.post(f"/api/dataset/{dataset['id']}/{op}", json={**body, "lazy": lazy})
+        assert r.status_code == 200, r.text
+        dataset = r.json()
+    return dataset
+
+
+def test_lazy_version_materializes_to_the_eager_frame(client, db, upload_dataset):
+    base = upload_dataset(make_frame(nulls=True))
+    lazy = _derive(client, base, lazy=True)
+    eager = _derive(client, base, lazy=False)
+
+    assert lazy["file_id"] == base["file_id"]  # no new file was written
+    assert lazy["rows"] is None and lazy["dataset_metadata"] == {"materialized": False}
+    assert [s["strategy"] for s in lazy["recipe"]] == [body["strategy"] for _, body in STEPS]
+    assert eager["file_id"] != base["file_id"] and not eager["recipe"]
+    assert lazy["version"] == eager["version"] == "1.4"
+
+    service = DatasetService()
+    frames = [
+        service._load_dataset_frame(db, service.get_dataset(db=db, dataset_id=uuid.UUID(d["id"])))
+        for d in (lazy, eager)
+    ]
+    pd.testing.assert_frame_equal(frames[0].reset_index(drop=True), frames[1])
+
+    opened = client.get(f"/api/dataset/{lazy['id']}").json()
+    assert (opened["rows"], opened["columns"]) == (eager["rows"], eager["columns"])
+    assert opened["dataset_metadata"]["dtypes"] == eager["dataset_metadata"]["dtypes"]
+
+
+def test_a_model_trains_on_a_lazy_version(client, upload_dataset, train):
+    lazy = _derive(client, upload_dataset(make_frame(nulls=True)), lazy=True)
+    model = train(
+        {
+            "dataset_id": lazy["id"],
+            "model_algorithm": "logistic_regression",
+            "target_column": "label",
+            "features": ["a", "b", "c"],
+        }
+    )
+    assert model["model_type"] == "logistic_regression"
+
+
+@pytest.mark.parametrize("path", ["", "/clean"])
+def test_unknown_dataset(client, path):
+    missing = uuid.uuid4()
+    if path:
+        r = client.post(f"/api/dataset/{missing}{path}", json={"strategy": "drop_nulls"})
+        assert r.status_code == 404
+    else:
+        r = client.get(f"/api/dataset/{missing}")
+        assert r.status_code == 200 and r.json() is None
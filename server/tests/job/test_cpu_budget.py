@@ -0,0 +1,54 @@
+import io
+
+import joblib
+from conftest import payload
+from threadpoolctl import threadpool_info
+
+from src.common.config import settings
+from src.modules.job import JobService
+from src.modules.job.cpu_budget import cores_for_job, cpu_budget, current_cores
+from src.modules.job.schema import JobStatus
+from src.modules.job.store import Job
+
+
+def test_cores_are_shared_between_jobs_in_flight(client, db, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_CPU_CORES", 24)
+    monkeypatch.setattr(settings, "JOB_WORKERS", 8)
+    service = JobService()
+    in_flight = db.query(Job).filter(Job.status.in_(JobStatus.ACTIVE)).count()
+
+    jobs, shares = [], []
+    for _ in range(3):
+        jobs.append(service.create_job(db=db, kind="train", payload={}, user_id=client.user_id))
+        in_flight += 1
+        shares.append((cores_for_job(db), 24 // in_flight))
+    assert all(got == expected for got, expected in shares)
+
+    # No more than JOB_WORKERS jobs run at once, and a job gets at least one core
+    monkeypatch.setattr(settings, "JOB_WORKERS", 2)
+    assert cores_for_job(db) == 12
+    monkeypatch.setattr(settings, "JOB_CPU_CORES", 1)
+    assert cores_for_job(db) == 1
+
+    for job in jobs:
+        service.mark_failed(db=db, job_id=job.id, error="test")
+
+
+def test_budget_limits_native_thread_pools():
+    assert current_cores() is None
+    with cpu_budget(1) as cores:
+        assert cores == current_cores() == 1
+        assert all(pool["num_threads"] == 1 for pool in threadpool_info())
+    assert current_cores() is None
+
+
+def test_training_records_its_budget_but_saves_default_n_jobs(client, upload_dataset, train):
+    model = train(payload(upload_dataset(), "random_forest", reuse_cached=False))
+    assert model["cpu_cores"] >= 1
+
+    r = client.get(f"/api/ml_model/{model['id']}/download")
+    assert joblib.load(io.BytesIO(r.content)).n_jobs is None
+
+    pinned = train(payload(upload_dataset(), "random_forest", hyperparameters={"n_jobs": 2}))
+    r = client.get(f"/api/ml_model/{pinned['id']}/download")
+    assert joblib.load(io.BytesIO(r.content)).n_jobs == 2
@@ -0,0 +1,104 @@
+import os
+import subprocess
+import sys
+import uuid
+
+from conftest import payload, signed_in
+
+from src.modules.job import JobService
+from src.modules.job.executor import get_executor, submit_job
+from src.modules.job.schema import JobStatus
+from src.modules.job.store import Job
+
+
+def _crash(job_id: str) -> None:
+    os._exit(1)  # the worker dies without recording anything
+
+
+def _dead_pid() -> int:
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+def test_training_is_queued_and_completes_in_a_worker(client, upload_dataset, wait_job):
+    ds = upload_dataset()
+    r = client.post("/api/ml_model/train", json=payload(ds, "decision_tree"))
+    assert r.status_code == 202
+    submitted = r.json()
+    assert submitted["status"] == JobStatus.QUEUED
+    assert submitted["kind"] == "train"
+
+    job = wait_job(submitted["id"])
+    assert job["status"] == JobStatus.COMPLETED, job["error"]
+    assert job["progress"] == 1.0
+    assert job["started_at"] and job["finished_at"]
+    assert (
+        client.get(f"/api/ml_model/{job['result']['id']}").json()["model_type"] == "decision_tree"
+    )
+
+
+def test_failed_training_records_the_error(client, upload_dataset, run_job):
+    ds = upload_dataset()
+    job = run_job(payload(ds, "linear_regression", target="color"))
+    assert job["status"] == JobStatus.FAILED
+    assert job["error"]
+
+
+def test_unknown_dataset_is_rejected_before_queueing(client):
+    r = client.post(
+        "/api/ml_model/train",
+        json={"dataset_id": str(uuid.uuid4()), "model_algorithm": "ridge", "target_column": "y"},
+    )
+    assert r.status_code == 404
+
+
+def test_jobs_are_private_to_their_user(app, client, upload_dataset, wait_job):
+    ds = upload_dataset()
+    job = client.post("/api/ml_model/train", json=payload(ds, "decision_tree")).json()
+    wait_job(job["id"])
+
+    other = signed_in(app)
+    assert other.get(f"/api/ml_model/jobs/{job['id']}").status_code == 403
+    assert client.get(f"/api/ml_model/jobs/{uuid.uuid4()}").status_code == 404
+
+
+def test_worker_crash_fails_the_job_and_the_pool_recovers(client, db, upload_dataset, wait_job):
+    service = JobService()
+    job = service.create_job(db=db, kind="train", payload={}, user_id=client.user_id)
+    submit_job(job.id, _crash).exception(timeout=60)
+
+    crashed = wait_job(str(job.id))
+    assert crashed["status"] == JobStatus.FAILED
+    assert crashed["error"].startswith("Worker process failed")
+
+    # The broken pool is replaced on the next submission
+    ds = upload_dataset()
+    job = client.post("/api/ml_model/train", json=payload(ds, "decision_tree")).json()
+    assert wait_job(job["id"])["status"] == JobStatus.COMPLETED
+    assert get_executor() is not None
+
+
+def test_orphaned_jobs_are_failed_on_startup(client, db):
+    service = JobService()
+    orphan = service.create_job(db=db, kind="train", payload={}, user_id=client.user_id)
+    running = service.create_job(db=db, kind="train", payload={}, user_id=client.user_id)
+    service.mark_running(db=db, job_id=running.id)
+    for job in (orphan, running):
+        job.owner_pid = _dead_pid()
+    alive = service.create_job(db=db, kind="train", payload={}, user_id=client.user_id)
+    done = service.create_job(db=db, kind="train", payload={}, user_id=client.user_id)
+    service.mark_completed(db=db, job_id=done.id, result={})
+    done.owner_pid = _dead_pid()
+    db.commit()
+
+    assert service.fail_orphaned_jobs(db=db) == 2
+    for job in (orphan, running):
+        db.refresh(job)
+        assert job.status == JobStatus.FAILED
+        assert job.error == "Interrupted by server restart"
+    db.refresh(alive)
+    db.refresh(done)
+    assert alive.status == JobStatus.QUEUED and alive.owner_pid == os.getpid()
+    assert done.status == JobStatus.COMPLETED
+    assert db.query(Job).filter(Job.id == done.id).one().error is None
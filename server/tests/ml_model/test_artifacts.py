@@ -0,0 +1,66 @@
+import os
+
+import numpy as np
+from conftest import FEATURES, make_frame, payload
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.neighbors import KNeighborsClassifier
+
+from src.modules.ml_model.utils.artifacts import (
+    MMAP_MIN_BYTES,
+    array_bytes,
+    load_artifact,
+    save_artifact,
+)
+
+
+def _data(rows: int):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(rows, 10))
+    return X, (X[:, 0] > 0).astype(int)
+
+
+def test_array_bytes_counts_the_raw_buffers():
+    X, y = _data(20_000)
+    assert array_bytes(KNeighborsClassifier().fit(X, y)) >= X.nbytes  # keeps the training data
+    assert array_bytes(LogisticRegression().fit(X, y)) < 1_000
+    assert array_bytes({"values": np.array(["x", "y"], dtype=object)}) == 0
+
+
+def test_only_models_with_large_arrays_are_mapped(tmp_path):
+    X, y = _data(20_000)
+    noise = np.random.default_rng(1).integers(0, 2, size=len(y))
+    assert X.nbytes > MMAP_MIN_BYTES
+    for model, mapped in (
+        (KNeighborsClassifier().fit(X, y), True),
+        # Fully grown on noise: megabytes of tree nodes
+        (RandomForestClassifier(n_estimators=5, random_state=0).fit(X, noise), True),
+        (LogisticRegression().fit(X, y), False),
+    ):
+        path = str(tmp_path / "model.joblib")
+        assert save_artifact(model, path) is mapped, type(model).__name__
+        loaded = load_artifact(path, mmap=mapped)
+        np.testing.assert_array_equal(loaded.predict(X[:100]), model.predict(X[:100]))
+
+
+def test_mapped_arrays_are_read_only_views_of_the_file(tmp_path):
+    X, y = _data(20_000)
+    path = str(tmp_path / "knn.joblib")
+    save_artifact(KNeighborsClassifier().fit(X, y), path)
+
+    fit_X = load_artifact(path, mmap=True)._fit_X
+    assert isinstance(fit_X, np.memmap) and not fit_X.flags.writeable
+    assert os.path.samefile(fit_X.filename, path)
+    assert load_artifact(path)._fit_X.flags.writeable
+
+
+def test_the_verdict_is_stored_on_the_model(client, upload_dataset, train):
+    small = train(payload(upload_dataset(), "logistic_regression"))
+    large = train(payload(upload_dataset(make_frame(n=60_000)), "k_nearest_neighbors"))
+    assert small["artifact_mmap"] is False
+    assert large["artifact_mmap"] is True
+
+    row = dict(zip(FEATURES, [0.5, 3, 0.2], strict=True))
+    for model in (small, large):
+        r = client.post(f"/api/ml_model/{model['id']}/predict", json={"inputs": row})
+        assert r.status_code == 200, r.text
@@ -0,0 +1,93 @@
+import time
+import uuid
+
+import joblib
+from conftest import FEATURES, make_frame
+
+from src.modules.ml_model.schema import AutoMLRequest
+from src.modules.ml_model.service import MLModelService
+from src.modules.ml_model.utils.automl import Candidate, rank, run_candidates
+from src.modules.ml_model.utils.registry import registry
+
+BUDGET = 8.0
+SLOW = Candidate("gradient_boosting", {"n_estimators": 200_000, "random_state": 0})
+
+
+def _split(tmp_path) -> str:
+    df = make_frame()
+    X, y = df[FEATURES], df["label"]
+    path = str(tmp_path / "split.joblib")
+    joblib.dump((X[:300], X[300:], y[:300], y[300:]), path)
+    return path
+
+
+def test_candidates_over_the_time_budget_are_stopped(tmp_path):
+    # The slow fit starts once a slot frees up, so it does not starve the quick ones of CPU
+    candidates = [
+        Candidate("logistic_regression"),
+        Candidate("decision_tree", {"max_depth": -1}),
+        SLOW,
+    ]
+    done = []
+    started = time.monotonic()
+    rows = run_candidates(
+        candidates,
+        _split(tmp_path),
+        str(tmp_path),
+        max_parallel=2,
+        time_budget=BUDGET,
+        on_done=done.append,
+    )
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 2 * BUDGET + 5  # the slow fit alone would take far longer
+    assert [r["status"] for r in rows] == ["ok", "failed", "timeout"]
+    assert rows[0]["score"] > 0.5 and joblib.load(rows[0]["model_path"]).n_iter_[0] > 0
+    assert "max_depth" in rows[1]["error"]
+    assert rows[2]["error"] == f"Exceeded {BUDGET:g}s time budget"
+    assert done == [1, 2, 3]
+
+    ranked = rank(rows)
+    assert [r["algorithm"] for r in ranked][0] == "logistic_regression"
+    assert [r["rank"] for r in ranked] == [1, 2, 3]
+
+
+def test_candidate_lists_expand_and_deduplicate():
+    request = AutoMLRequest(
+        dataset_id=uuid.uuid4(),
+        target_column="label",
+        algorithms=["random_forest", "all_classifiers", "DecisionTreeClassifier"],
+        hyperparameters={"random_forest": {"n_estimators": 10}},
+    )
+    candidates = MLModelService()._automl_candidates(request)
+    names = [name for name, _ in candidates]
+    classifiers = [a.name for a in registry.all() if a.task == "classifier"]
+    assert names[0] == "random_forest_classifier"
+    assert sorted(names) == sorted(classifiers)
+    assert dict(candidates)["random_forest_classifier"] == {"n_estimators": 10}
+
+
+def test_automl_job_keeps_the_best_within_its_budget(client, upload_dataset, train):
+    ds = upload_dataset()
+    started = time.monotonic()
+    result = train(
+        {
+            "dataset_id": ds["id"],
+            "target_column": "label",
+            "features": FEATURES,
+            "algorithms": ["gradient_boosting", "logistic_regression", "decision_tree"],
+            "hyperparameters": {"gradient_boosting": SLOW.params},
+            "time_budget_seconds": BUDGET,
+            "keep_top": 3,
+        },
+        url="/api/ml_model/automl",
+    )
+    assert time.monotonic() - started < 60
+
+    board = {row["algorithm"]: row for row in result["leaderboard"]}
+    assert board["gradient_boosting"]["status"] == "timeout"
+    assert "model_id" not in board["gradient_boosting"]
+    kept = [row["model_id"] for row in result["leaderboard"] if row["status"] == "ok"]
+    assert result["kept_model_ids"] == kept and len(kept) == 2
+    best = client.get(f"/api/ml_model/{kept[0]}").json()
+    assert best["description"] == "Rank 1 of 3 AutoML candidates"
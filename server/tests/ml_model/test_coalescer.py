@@ -0,0 +1,110 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from conftest import make_frame, payload
+
+from src.modules.ml_model.utils import coalescer
+from src.modules.ml_model.utils.coalescer import PredictCoalescer
+
+
+class Recorder:
+    """An ``infer`` that doubles ``x`` and remembers the batches it was called with."""
+
+    def __init__(self, fail_on: int | None = None):
+        self.batches: list[list[int]] = []
+        self.fail_on = fail_on
+        self.lock = threading.Lock()
+
+    def __call__(self, X: pd.DataFrame):
+        with self.lock:
+            self.batches.append(X["x"].tolist())
+        if self.fail_on in X["x"].values:
+            raise ValueError("bad row")
+        x = X["x"].to_numpy()
+        return (x * 2).tolist(), ["p"], np.c_[x]
+
+
+def _concurrently(c: PredictCoalescer, infer, values: list[int], key="model"):
+    def one(v):
+        return c.infer(key, pd.DataFrame({"x": [v]}), infer)
+
+    with ThreadPoolExecutor(len(values)) as pool:
+        return list(pool.map(one, values))
+
+
+def test_disabled_coalescer_calls_through():
+    c = PredictCoalescer(max_wait_ms=0, max_rows=64)
+    infer = Recorder()
+    assert not c.enabled
+    assert _concurrently(c, infer, [1, 2])[0][0] == [2]
+    assert sorted(infer.batches) == [[1], [2]]
+    assert c.stats()["calls"] == 0
+
+
+def test_concurrent_requests_share_one_inference():
+    c = PredictCoalescer(max_wait_ms=5_000, max_rows=4)  # closes when the 4th row joins
+    infer = Recorder()
+    results = _concurrently(c, infer, [1, 2, 3, 4])
+
+    assert len(infer.batches) == 1 and sorted(infer.batches[0]) == [1, 2, 3, 4]
+    for v, (predictions, classes, proba) in zip([1, 2, 3, 4], results, strict=True):
+        assert predictions == [2 * v]
+        assert classes == ["p"]
+        assert proba.tolist() == [[v]]
+    assert c.stats() | {"max_wait_ms": None} == {
+        "enabled": True,
+        "max_wait_ms": None,
+        "max_rows": 4,
+        "calls": 4,
+        "batches": 1,
+        "rows_per_batch": 4.0,
+    }
+
+
+def test_batches_are_per_key_and_time_bounded():
+    c = PredictCoalescer(max_wait_ms=50, max_rows=64)
+    infer = Recorder()
+    assert c.infer("a", pd.DataFrame({"x": [1]}), infer)[0] == [2]
+    assert c.infer("b", pd.DataFrame({"x": [2]}), infer)[0] == [4]
+    assert infer.batches == [[1], [2]]
+    assert c.stats()["batches"] == 2
+
+
+def test_a_bad_row_only_fails_its_own_request():
+    c = PredictCoalescer(max_wait_ms=5_000, max_rows=3)
+    infer = Recorder(fail_on=2)
+    outcomes = []
+
+    def one(v):
+        try:
+            outcomes.append((v, c.infer("model", pd.DataFrame({"x": [v]}), infer)[0]))
+        except ValueError:
+            outcomes.append((v, "failed"))
+
+    threads = [threading.Thread(target=one, args=(v,)) for v in (1, 2, 3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(outcomes) == [(1, [2]), (2, "failed"), (3, [6])]
+    assert len(infer.batches[0]) == 3  # the merged call, then one call per request
+
+
+def test_concurrent_predicts_are_merged(client, upload_dataset, train, monkeypatch):
+    ds = upload_dataset()
+    model = train(payload(ds, "logistic_regression"))
+    url = f"/api/ml_model/{model['id']}/predict"
+    rows = make_frame(n=8, seed=1)[["a", "b", "c"]].to_dict("records")
+    expected = [client.post(url, json={"inputs": row}).json() for row in rows]
+
+    merged = PredictCoalescer(max_wait_ms=5_000, max_rows=len(rows))
+    monkeypatch.setattr(coalescer, "predict_coalescer", merged)
+    monkeypatch.setattr("src.modules.ml_model.service.predict_coalescer", merged)
+    with ThreadPoolExecutor(len(rows)) as pool:
+        got = list(pool.map(lambda row: client.post(url, json={"inputs": row}).json(), rows))
+
+    assert got == expected
+    stats = client.get("/api/ml_model/cache/stats").json()["coalescer"]
+    assert stats["calls"] == len(rows) and stats["batches"] == 1
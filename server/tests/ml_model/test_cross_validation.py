@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import FEATURES, make_frame, payload
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import KFold, StratifiedKFold, cross_val_score
+
+from src.modules.ml_model.utils import folds
+from src.modules.ml_model.utils.folds import can_stratify, fold_assignments, fold_indices
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    folds._cache.clear()
+    yield
+    folds._cache.clear()
+
+
+def test_can_stratify():
+    assert can_stratify(pd.Series([0, 1] * 5), 5)
+    assert not can_stratify(pd.Series([0] * 9 + [1]), 5)  # one class fills a single fold
+    assert not can_stratify(pd.Series([0] * 10), 2)
+
+
+@pytest.mark.parametrize("stratified", [True, False])
+def test_assignments_match_the_sklearn_splitters(stratified):
+    y = make_frame()["label"]
+    cls = StratifiedKFold if stratified else KFold
+    splitter = cls(n_splits=5, shuffle=True, random_state=folds.RANDOM_STATE)
+
+    got = fold_indices(fold_assignments(None, y, 5, stratified))
+    for (train, test), (want_train, want_test) in zip(
+        got, splitter.split(np.zeros(len(y)), y), strict=True
+    ):
+        np.testing.assert_array_equal(train, want_train)
+        np.testing.assert_array_equal(test, want_test)
+
+
+def test_assignments_are_cached_by_key():
+    y = make_frame()["label"]
+    first = fold_assignments("digest", y, 5, True)
+    assert first.dtype == np.int8
+    assert fold_assignments("digest", y, 5, True) is first
+    assert fold_assignments("digest", y, 4, True) is not first
+    assert fold_assignments(None, y, 5, True) is not first
+    assert len(folds._cache) == 2  # keyless assignments are not kept
+
+
+def test_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(folds, "FOLD_CACHE_SIZE", 2)
+    y = make_frame()["label"]
+    first = fold_assignments(0, y, 3, False)
+    fold_assignments(1, y, 3, False)
+    fold_assignments(2, y, 3, False)
+    assert len(folds._cache) == 2
+    assert fold_assignments(0, y, 3, False) is not first
+
+
+def test_cross_validated_training(client, upload_dataset, train):
+    df = make_frame()
+    ds = upload_dataset(df)
+    result = train(payload(ds, "logistic_regression", cv_folds=5))
+
+    cv = result["cross_validation"]
+    assert cv["folds"] == 5 and cv["stratified"]
+    splitter = StratifiedKFold(n_splits=5, shuffle=True, random_state=folds.RANDOM_STATE)
+    expected = cross_val_score(LogisticRegression(), df[FEATURES], df["label"], cv=splitter)
+    assert cv["scores"] == pytest.approx(expected, abs=1e-6)
+    assert result["accuracy"] == pytest.approx(expected.mean())
+    assert result["accuracy_std"] == pytest.approx(expected.std())
+
+    stored = client.get(f"/api/ml_model/{result['id']}").json()
+    assert stored["cv_folds"] == 5
+    report = client.get(f"/api/ml_model/{result['id']}/report").json()
+    assert report["cross_validation"]["scores"] == cv["scores"]
+
+
+def test_regression_folds_are_not_stratified(upload_dataset, train):
+    ds = upload_dataset()
+    result = train(payload(ds, "ridge", target="y", cv_folds=3))
+    assert result["cross_validation"]["stratified"] is False
+    assert len(result["cross_validation"]["scores"]) == 3
+
+
+def test_cv_folds_is_rejected_where_unsupported(client, upload_dataset):
+    ds = upload_dataset()
+    for url, body in (
+        ("/api/ml_model/train", payload(ds, "sgd_classifier", cv_folds=3, streaming=True)),
+        ("/api/ml_model/search", payload(ds, "logistic_regression", cv_folds=3)),
+    ):
+        assert client.post(url, json=body).status_code == 400
+    assert (
+        client.post("/api/ml_model/train", json=payload(ds, "ridge", cv_folds=1)).status_code == 422
+    )
@@ -0,0 +1,72 @@
+import warnings
+
+import pytest
+from conftest import make_frame, payload
+
+from src.modules.ml_model.utils import registry as registry_module
+from src.modules.ml_model.utils.registry import registry
+
+FRAME = make_frame(n=200)
+
+
+def _schema_defaults(algorithm) -> dict:
+    return {
+        p["name"]: None if p.get("default") == "None" else p["default"]
+        for p in algorithm.hyperparameters
+        if "default" in p
+    }
+
+
+@pytest.mark.parametrize("algorithm", registry.all(), ids=lambda a: a.name)
+def test_schema_defaults_fit(algorithm):
+    target = "label" if algorithm.task == "classifier" else "y"
+    X = (
+        FRAME[["a", "b", "c"]].abs()
+        if algorithm.name == "multinomial_nb"
+        else FRAME[["a", "b", "c"]]
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # convergence warnings on the small sample
+        estimator = algorithm.build(_schema_defaults(algorithm)).fit(X, FRAME[target])
+    assert len(estimator.predict(X)) == len(X)
+
+
+@pytest.mark.parametrize(
+    "algorithm, target",
+    [
+        ("hist_gradient_boosting", "label"),
+        ("extra_trees", "label"),
+        ("linear_svc", "label"),
+        ("hist_gradient_boosting_regressor", "y"),
+        ("extra_trees_regressor", "y"),
+        ("linear_svr", "y"),
+    ],
+)
+def test_new_estimators_train_through_the_api(upload_dataset, train, algorithm, target):
+    model = train(payload(upload_dataset(), algorithm, target=target))
+    assert model["accuracy"] > 0.5
+
+
+def test_histogram_boosting_warm_start_grows_max_iter(upload_dataset, train, run_job):
+    ds = upload_dataset()
+    hyperparameters = {"max_iter": 10, "early_stopping": False}
+    parent = train(payload(ds, "hist_gradient_boosting", hyperparameters=hyperparameters))
+    job = run_job(
+        payload(ds, "hist_gradient_boosting", warm_start=True, add_estimators=5),
+        url=f"/api/ml_model/{parent['id']}/retrain",
+    )
+    assert job["status"] == "completed", job["error"]
+    assert job["result"]["estimators_added"] == 5
+
+
+def test_passive_aggressive_on_older_sklearn(monkeypatch):
+    monkeypatch.setattr(registry_module, "_sgd_has_pa", lambda: False)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        classifier = registry.get("passive_aggressive").build({"learning_rate": "pa2", "eta0": 0.5})
+        regressor = registry.get("passive_aggressive_regressor").build()
+    assert type(classifier).__name__ == "PassiveAggressiveClassifier"
+    assert classifier.get_params()["loss"] == "squared_hinge"
+    assert classifier.get_params()["C"] == 0.5
+    assert type(regressor).__name__ == "PassiveAggressiveRegressor"
+    assert regressor.get_params()["loss"] == "epsilon_insensitive"
@@ -0,0 +1,92 @@
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+from conftest import FEATURES, make_frame, payload, signed_in
+from sklearn.linear_model import LinearRegression, LogisticRegression
+from sklearn.tree import DecisionTreeClassifier
+
+from src.modules.ml_model.service import MLModelService
+from src.modules.ml_model.store import MLModel
+from src.modules.ml_model.utils.evaluation import (
+    MAX_CURVE_POINTS,
+    evaluation_report,
+    report_path,
+)
+from src.modules.ml_model.utils.preprocessing import build_pipeline
+
+
+def test_binary_report():
+    df = make_frame(n=1_000)
+    model = LogisticRegression().fit(df[FEATURES], df["label"])
+    report = evaluation_report(model, df[FEATURES], df["label"])
+
+    assert report["task"] == "classification"
+    assert report["accuracy"] == round(model.score(df[FEATURES], df["label"]), 6)
+    assert np.sum(report["confusion_matrix"]) == 1_000
+    assert sum(c["support"] for c in report["per_class"].values()) == 1_000
+    assert report["roc"]["positive_class"] == "1"
+    assert 0.9 < report["roc"]["auc"] <= 1
+    assert len(report["roc"]["fpr"]) <= MAX_CURVE_POINTS
+    assert len(report["pr"]["precision"]) <= MAX_CURVE_POINTS
+    assert report["feature_importances"][0]["feature"] in ("a", "c")
+
+
+def test_multiclass_report():
+    df = make_frame()
+    model = DecisionTreeClassifier(random_state=0).fit(df[FEATURES], df["color"])
+    report = evaluation_report(model, df[FEATURES], df["color"])
+
+    assert report["labels"] == ["blue", "green", "red"]
+    assert "roc" not in report
+    assert 0 <= report["roc_auc_ovr"] <= 1
+    assert {i["feature"] for i in report["feature_importances"]} == set(FEATURES)
+
+
+def test_regression_report():
+    df = make_frame()
+    model = LinearRegression().fit(df[FEATURES], df["y"])
+    report = evaluation_report(model, df[FEATURES], df["y"])
+
+    residuals = df["y"] - model.predict(df[FEATURES])
+    assert report["task"] == "regression"
+    assert report["mae"] == round(float(np.abs(residuals).mean()), 6)
+    assert report["r2"] > 0.95
+    assert sum(report["residuals"]["histogram"]["counts"]) == len(df)
+    assert report["feature_importances"][0]["feature"] == "a"
+
+
+def test_pipeline_importances_use_the_encoded_names():
+    df = make_frame()
+    X = df[[*FEATURES, "color"]]
+    model = build_pipeline(LogisticRegression(), X).fit(X, df["label"])
+    names = {i["feature"] for i in evaluation_report(model, X, df["label"])["feature_importances"]}
+    assert names == {*FEATURES, "color_blue", "color_green", "color_red"}
+
+
+def test_report_is_none_when_it_cannot_be_computed():
+    df = make_frame()
+    model = LogisticRegression().fit(df[FEATURES], df["label"])
+    assert evaluation_report(model, pd.DataFrame({"x": [1.0]}), df["label"][:1]) is None
+
+
+def test_report_is_served_and_removed_with_the_model(app, client, db, upload_dataset, train):
+    ds = upload_dataset()
+    model = train(payload(ds, "random_forest", n_estimators=10))
+    url = f"/api/ml_model/{model['id']}/report"
+
+    r = client.get(url)
+    assert r.status_code == 200
+    report = r.json()
+    assert report["task"] == "classification"
+    assert report["rows"] == 80  # the 20% test split of 400 rows
+    assert report["accuracy"] == round(float(model["accuracy"]), 6)
+    assert signed_in(app).get(url).status_code == 403
+    assert client.get(f"/api/ml_model/{uuid.uuid4()}/report").status_code == 404
+
+    record = db.query(MLModel).filter(MLModel.id == uuid.UUID(model["id"])).one()
+    _, loc = MLModelService()._model_path(db, record)
+    assert os.path.exists(report_path(loc))
+    assert client.delete(f"/api/ml_model/{model['id']}").status_code == 200
+    assert not os.path.exists(report_path(loc))
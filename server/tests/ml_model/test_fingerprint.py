@@ -0,0 +1,89 @@
+import os
+
+from conftest import make_frame, payload
+
+from src.modules.ml_model.utils.fingerprint import file_digest, training_fingerprint
+
+SEEDED = {"n_estimators": 15, "random_state": 42}
+BASE = {
+    "data_digest": "abc",
+    "recipe": None,
+    "features": ["a", "b"],
+    "target": "y",
+    "algorithm": "ridge",
+    "params": {"alpha": 1.0},
+    "split": {"test_size": 0.2, "random_state": 42},
+}
+
+
+def test_fingerprint_changes_with_every_input():
+    fingerprint = training_fingerprint(**BASE)
+    assert training_fingerprint(**{**BASE, "params": {"alpha": 1.0}}) == fingerprint
+    changes = {
+        "data_digest": "abd",
+        "recipe": [{"op": "clean", "strategy": "drop_nulls", "columns": None}],
+        "features": ["b", "a"],
+        "target": "z",
+        "algorithm": "lasso",
+        "params": {"alpha": 2.0},
+        "split": {"cv_folds": 5, "random_state": 42},
+    }
+    for name, value in changes.items():
+        assert training_fingerprint(**{**BASE, name: value}) != fingerprint, name
+
+
+def test_file_digest_follows_the_file_contents(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a\n1\n")
+    first = file_digest(str(path))
+    assert file_digest(str(path)) == first
+    path.write_text("a\n2\n")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert file_digest(str(path)) != first
+
+
+def test_identical_request_reuses_the_model(client, upload_dataset, train):
+    ds = upload_dataset()
+    first = train(payload(ds, "random_forest", hyperparameters=SEEDED))
+    again = train(payload(ds, "random_forest", hyperparameters=SEEDED))
+    assert again["cached"] is True
+    assert again["id"] == first["id"] and again["accuracy"] == first["accuracy"]
+    assert client.get(f"/api/ml_model/{first['id']}/telemetry").json()["reuse_count"] == 1
+    assert client.get("/api/stats").json()["training"]["reuses"] == 1
+
+    different = [
+        payload(ds, "random_forest", hyperparameters={**SEEDED, "n_estimators": 16}),
+        payload(ds, "random_forest", hyperparameters=SEEDED, features=["a", "c"]),
+        payload(ds, "random_forest", hyperparameters=SEEDED, reuse_cached=False),
+        payload(upload_dataset(make_frame(seed=1)), "random_forest", hyperparameters=SEEDED),
+    ]
+    for body in different:
+        model = train(body)
+        assert not model.get("cached") and model["id"] != first["id"]
+
+
+def test_unseeded_estimator_is_never_reused(upload_dataset, train):
+    ds = upload_dataset()
+    body = payload(ds, "decision_tree")  # random_state defaults to None
+    assert train(body)["id"] != train(body)["id"]
+
+
+def test_retrain_to_an_identical_model_links_a_version_sharing_its_artifact(
+    client, upload_dataset, train
+):
+    ds = upload_dataset()
+    body = payload(ds, "decision_tree", hyperparameters={"random_state": 42})
+    parent = train(body)
+    version = train(body, url=f"/api/ml_model/{parent['id']}/retrain")
+    assert version["cached"] is True and version["cached_from"] == parent["id"]
+    assert version["id"] != parent["id"] and version["parent_id"] == parent["id"]
+    assert version["file_id"] == parent["file_id"]
+    assert version["accuracy"] == parent["accuracy"]
+
+    telemetry = client.get(f"/api/ml_model/{version['id']}/telemetry").json()
+    assert telemetry["reused_from_id"] == parent["id"]
+    r = client.post(
+        f"/api/ml_model/{version['id']}/predict", json={"inputs": {"a": 1, "b": 2, "c": 3}}
+    )
+    assert r.status_code == 200, r.text
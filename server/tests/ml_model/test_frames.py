@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+from conftest import FEATURES, make_frame, payload
+from sklearn.model_selection import train_test_split
+from sklearn.tree import DecisionTreeClassifier
+
+from src.modules.ml_model.utils.frames import memory_bytes, prepare_training_frame, split_frame
+
+
+def test_columns_are_stored_as_lean_dtypes():
+    df = make_frame(n=300)
+    X, y, before = prepare_training_frame(df, [*FEATURES, "color"], "label", float32=True)
+    assert X.dtypes.astype(str).to_dict() == {
+        "a": "float32",
+        "b": "int8",
+        "c": "float32",
+        "color": "category",
+    }
+    assert y.dtype == df["label"].dtype  # only string targets are re-encoded
+    assert before == memory_bytes(df[[*FEATURES, "color", "label"]])
+    assert memory_bytes(X, y) < before
+    assert X["color"].astype(str).tolist() == df["color"].tolist()
+    np.testing.assert_array_equal(X["b"], df["b"])
+
+
+def test_unchanged_columns_are_not_copied():
+    df = make_frame(n=300)
+    X, y, _ = prepare_training_frame(df, ["a", "c"], "label")
+    for name in ("a", "c"):
+        assert np.shares_memory(X[name].to_numpy(), df[name].to_numpy())
+    assert np.shares_memory(y.to_numpy(), df["label"].to_numpy())
+
+
+def test_incomplete_rows_are_dropped():
+    df = make_frame(n=300, nulls=True)
+    df.loc[[1, 2], "label"] = np.nan
+    complete = df[FEATURES + ["label"]].dropna()
+
+    X, y, _ = prepare_training_frame(df, FEATURES, "label")
+    pd.testing.assert_index_equal(X.index, complete.index)
+    np.testing.assert_array_equal(y, complete["label"])
+    np.testing.assert_array_equal(X["c"], complete["c"])
+
+    # A pipeline imputes the features itself: only the target decides
+    X, y, _ = prepare_training_frame(df, FEATURES, "label", drop_incomplete=False)
+    assert len(X) == 298 and X["c"].isna().any()
+
+
+def test_split_matches_train_test_split():
+    df = make_frame(n=300)
+    X, y, _ = prepare_training_frame(df, FEATURES, "label")
+    expected = train_test_split(df[FEATURES], df["label"], test_size=0.2, random_state=42)
+    for got, want in zip(split_frame(X, y), expected, strict=True):
+        pd.testing.assert_index_equal(got.index, want.index)
+
+
+def test_float32_frames_fit_the_same_tree():
+    df = make_frame(n=500)
+    X64, y, _ = prepare_training_frame(df, FEATURES, "label")
+    X32, _, _ = prepare_training_frame(df, FEATURES, "label", float32=True)
+    tree64 = DecisionTreeClassifier(random_state=0).fit(X64, y)
+    tree32 = DecisionTreeClassifier(random_state=0).fit(X32, y)
+    np.testing.assert_array_equal(tree64.tree_.threshold, tree32.tree_.threshold)
+
+
+def test_training_records_frame_memory(client, upload_dataset, train):
+    model = train(payload(upload_dataset(), "random_forest", reuse_cached=False))
+    telemetry = client.get(f"/api/ml_model/{model['id']}/telemetry").json()
+    assert 0 < telemetry["frame_bytes_after"] < telemetry["frame_bytes_before"]
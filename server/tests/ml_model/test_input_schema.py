@@ -0,0 +1,123 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import make_frame, payload
+
+from src.modules.ml_model.utils.input_schema import (
+    InputError,
+    InputValidator,
+    describe_columns,
+    input_validator,
+    normalize_inputs,
+)
+
+SCHEMA = [
+    {"name": "n", "dtype": "integer", "categories": None},
+    {"name": "flag", "dtype": "boolean", "categories": None},
+    {"name": "color", "dtype": "category", "categories": ["blue", "red"]},
+    {"name": "zip", "dtype": "category", "categories": ["10001", "94105"]},
+    {"name": "note", "dtype": "string", "categories": None},
+]
+
+
+def test_describe_columns():
+    X = pd.DataFrame(
+        {
+            "i": pd.Series([1, 2], dtype="int8"),
+            "f": [0.5, None],
+            "b": [True, False],
+            "c": pd.Categorical(["x", "y"]),
+            "s": ["u", "v"],
+        }
+    )
+    assert describe_columns(X) == [
+        {"name": "i", "dtype": "integer", "categories": None},
+        {"name": "f", "dtype": "float", "categories": None},
+        {"name": "b", "dtype": "boolean", "categories": None},
+        {"name": "c", "dtype": "category", "categories": ["x", "y"]},
+        {"name": "s", "dtype": "string", "categories": None},
+    ]
+
+
+@pytest.mark.parametrize(
+    "inputs",
+    [
+        ["a", "b"],
+        '["a", "b"]',
+        "['a', 'b']",  # the repr older models stored
+        [{"name": "a"}, {"name": "b", "dtype": "unknown"}],
+    ],
+)
+def test_normalize_legacy_inputs(inputs):
+    assert normalize_inputs(inputs) == [
+        {"name": "a", "dtype": None, "categories": None},
+        {"name": "b", "dtype": None, "categories": None},
+    ]
+
+
+@pytest.mark.parametrize("inputs", ["not a schema", {"a": 1}, [1]])
+def test_invalid_inputs_are_rejected(inputs):
+    with pytest.raises(ValueError):
+        normalize_inputs(inputs)
+
+
+def test_validator_types_a_payload():
+    validator = InputValidator(SCHEMA)
+    assert validator.missing({"n", "flag"}) == ["color", "zip", "note"]
+
+    X = validator.records(
+        [
+            {"n": "3", "flag": True, "color": "red", "zip": 10001, "note": "hi"},
+            {"n": None, "flag": None, "color": None, "zip": "94105", "note": None},
+        ]
+    )
+    assert list(X.columns) == [c["name"] for c in SCHEMA]
+    assert X["n"].dtype == np.float64 and X["n"].isna().tolist() == [False, True]
+    assert X["flag"].tolist()[0] == 1.0 and np.isnan(X["flag"].tolist()[1])
+    assert X["color"].cat.categories.tolist() == ["blue", "red"]
+    assert X["zip"].tolist() == ["10001", "94105"]  # a JSON number matched as text
+    assert X["note"].iloc[0] == "hi" and pd.isna(X["note"].iloc[1])
+
+
+@pytest.mark.parametrize(
+    "inputs, message",
+    [
+        ({"n": "many"}, "Feature 'n' expects numbers"),
+        ({"flag": "perhaps"}, "Feature 'flag' expects true / false"),
+        ({"color": "green"}, "Feature 'color' got value(s) not seen in training: ['green']"),
+    ],
+)
+def test_validator_rejects_mismatched_values(inputs, message):
+    row = {"n": 1, "flag": False, "color": "red", "zip": "10001", "note": "", **inputs}
+    with pytest.raises(InputError, match=re.escape(message)):
+        InputValidator(SCHEMA).row(row)
+
+
+def test_validators_are_cached_per_key():
+    first = input_validator(("model", 1), SCHEMA)
+    assert input_validator(("model", 1), []) is first
+    assert input_validator(("model", 2), SCHEMA) is not first
+
+
+def test_predict_checks_the_stored_schema(client, upload_dataset, train):
+    ds = upload_dataset(make_frame())
+    model = train(payload(ds, "hist_gradient_boosting", features=["a", "b", "color"]))
+    assert model["inputs"][2] == {
+        "name": "color",
+        "dtype": "category",
+        "categories": ["blue", "green", "red"],
+    }
+    url = f"/api/ml_model/{model['id']}/predict"
+
+    r = client.post(url, json={"inputs": {"a": 0.1, "b": 3, "color": "green"}})
+    assert r.status_code == 200, r.text
+    for inputs, detail in (
+        ({"a": 0.1, "b": 3, "color": "purple"}, "not seen in training"),
+        ({"a": "x", "b": 3, "color": "red"}, "Feature 'a' expects numbers"),
+        ({"a": 0.1, "color": "red"}, "Missing required feature(s): ['b']"),
+    ):
+        r = client.post(url, json={"inputs": inputs})
+        assert r.status_code == 422
+        assert detail in r.json()["detail"]
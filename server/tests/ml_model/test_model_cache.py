@@ -0,0 +1,58 @@
+import os
+import uuid
+
+import joblib
+from conftest import payload
+
+from src.modules.ml_model.utils.model_cache import ModelCache
+
+
+def test_model_is_reloaded_after_its_file_is_rewritten(tmp_path):
+    cache = ModelCache(max_entries=4, max_bytes=1 << 20)
+    path = str(tmp_path / "model.joblib")
+    file_id = uuid.uuid4()
+    loads = []
+
+    def loader(p):
+        loads.append(p)
+        return joblib.load(p)
+
+    joblib.dump({"version": 1}, path)
+    assert cache.get(file_id, path, loader)["version"] == 1
+    assert cache.get(file_id, path, loader)["version"] == 1
+    assert len(loads) == 1
+
+    joblib.dump({"version": 2, "padding": "x" * 100}, path)
+    assert cache.get(file_id, path, loader)["version"] == 2
+    assert len(loads) == 2
+
+    # Same size, newer mtime
+    joblib.dump({"version": 3, "padding": "y" * 100}, path)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.get(file_id, path, loader)["version"] == 3
+    assert len(loads) == 3
+
+
+def test_invalidate_forces_a_reload(tmp_path):
+    cache = ModelCache(max_entries=4, max_bytes=1 << 20)
+    path = str(tmp_path / "model.joblib")
+    file_id = uuid.uuid4()
+    joblib.dump([1], path)
+    first = cache.get(file_id, path)
+    assert cache.get(file_id, path) is first
+    cache.invalidate(file_id)
+    assert cache.get(file_id, path) is not first
+
+
+def test_predict_hits_the_cache(client, upload_dataset, train):
+    model = train(payload(upload_dataset(), "logistic_regression"))
+    before = client.get("/api/ml_model/cache/stats").json()
+    for _ in range(3):
+        r = client.post(
+            f"/api/ml_model/{model['id']}/predict", json={"inputs": {"a": 1, "b": 2, "c": 0.5}}
+        )
+        assert r.status_code == 200, r.text
+    after = client.get("/api/ml_model/cache/stats").json()
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 2
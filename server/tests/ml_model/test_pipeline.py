@@ -0,0 +1,98 @@
+import io
+import json
+
+import joblib
+import numpy as np
+import pandas as pd
+from conftest import FEATURES, make_frame, payload
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder, StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+
+from src.modules.dataset.utils.recipe import apply_recipe, make_step
+from src.modules.ml_model.utils.preprocessing import build_pipeline, final_estimator, preprocessor
+
+COLUMNS = [*FEATURES, "color"]
+
+
+def _steps(pipeline) -> dict[str, list[type]]:
+    """Column -> transformer classes of a fitted pipeline's preprocessing."""
+    steps = {}
+    for _, transformer, cols in pipeline["preprocess"].transformers_:
+        for col in cols:
+            steps[col] = [type(step) for _, step in transformer.steps]
+    return steps
+
+
+def test_pipeline_takes_raw_values_with_gaps_and_unseen_categories():
+    df = make_frame(nulls=True)
+    for trees, estimator, encoder in (
+        (False, LogisticRegression(), OneHotEncoder),
+        (True, DecisionTreeClassifier(random_state=0), OrdinalEncoder),
+    ):
+        model = build_pipeline(estimator, df[COLUMNS], trees=trees).fit(df[COLUMNS], df["label"])
+        assert final_estimator(model) is estimator
+        assert preprocessor(model) is not None
+        assert encoder in _steps(model)["color"]
+        assert (StandardScaler in _steps(model)["a"]) is not trees
+
+        raw = pd.DataFrame(
+            {"a": [0.5, np.nan], "b": [3, 4], "c": [None, 1.0], "color": ["red", "purple"]}
+        )
+        assert len(model.predict(raw)) == 2
+
+
+def test_recipe_steps_are_refitted_in_the_pipeline():
+    df = make_frame()
+    recipe = [make_step("transform", "min_max_scaler", ["a"])]
+    model = build_pipeline(LogisticRegression(), df[COLUMNS], recipe=recipe)
+    model.fit(df[COLUMNS], df["label"])
+
+    transformed = model["preprocess"].transform(df[COLUMNS])
+    a = transformed[:, list(model["preprocess"].get_feature_names_out()).index("a")]
+    expected = apply_recipe(df, recipe)["a"]
+    np.testing.assert_allclose(a, (expected - expected.mean()) / expected.std(ddof=0))
+
+
+def test_pipeline_model_predicts_from_raw_values(client, upload_dataset, train):
+    ds = upload_dataset(make_frame(nulls=True))
+    model = train(payload(ds, "logistic_regression", features=COLUMNS, pipeline=True))
+    inputs = model["inputs"] if isinstance(model["inputs"], list) else json.loads(model["inputs"])
+    assert all(column["categories"] is None for column in inputs)
+
+    r = client.post(
+        f"/api/ml_model/{model['id']}/predict",
+        json={"inputs": {"a": 0.1, "b": 2, "c": None, "color": "purple"}},
+    )
+    assert r.status_code == 200, r.text
+
+
+def test_pipeline_on_a_lazy_version_takes_the_base_values(client, upload_dataset, train):
+    base = upload_dataset(make_frame())
+    lazy = client.post(
+        f"/api/dataset/{base['id']}/transform",
+        json={"strategy": "standard_scaler", "columns": ["a"], "lazy": True},
+    ).json()
+    model = train(payload(lazy, "logistic_regression", pipeline=True))
+
+    artifact = client.get(f"/api/ml_model/{model['id']}/download").content
+    steps = _steps(joblib.load(io.BytesIO(artifact)))
+    # The version's scaling is part of the model, in front of the pipeline's own steps
+    assert steps["a"] == [StandardScaler, SimpleImputer, StandardScaler]
+    assert steps["b"] == [SimpleImputer, StandardScaler]
+
+    r = client.post(
+        f"/api/ml_model/{model['id']}/predict", json={"inputs": {"a": 50.0, "b": 2, "c": 0.0}}
+    )
+    assert r.status_code == 200, r.text
+    assert r.json()["predictions"] == [1]  # a raw 50 is far above the mean
+
+
+def test_pipeline_cannot_stream(client, upload_dataset):
+    ds = upload_dataset()
+    r = client.post(
+        "/api/ml_model/train",
+        json=payload(ds, "sgd_classifier", pipeline=True, streaming=True),
+    )
+    assert r.status_code == 400
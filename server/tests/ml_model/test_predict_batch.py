@@ -0,0 +1,65 @@
+import pytest
+from conftest import make_frame, payload
+
+from src.common.config import settings
+from src.modules.ml_model.service import MLModelService
+
+
+@pytest.fixture
+def model(upload_dataset, train) -> dict:
+    return train(payload(upload_dataset(), "logistic_regression"))
+
+
+def test_records_and_columns_match_single_row_predicts(client, model):
+    rows = make_frame(n=5, seed=1)[["a", "b", "c"]].to_dict("records")
+    url = f"/api/ml_model/{model['id']}/predict"
+    single = [client.post(url, json={"inputs": row}).json()["predictions"][0] for row in rows]
+
+    by_records = client.post(f"{url}/batch", json={"records": rows})
+    assert by_records.status_code == 200, by_records.text
+    body = by_records.json()
+    assert body["count"] == 5
+    assert body["predictions"] == single
+    assert len(body["probabilities"]) == 5 and len(body["classes"]) == 2
+
+    columns = {name: [row[name] for row in rows] for name in ("a", "b", "c")}
+    by_columns = client.post(f"{url}/batch", json={"columns": columns}).json()
+    assert by_columns["predictions"] == single
+
+
+@pytest.mark.parametrize(
+    "body, detail",
+    [
+        ({"records": [{"a": 1, "b": 2}]}, "missing required"),
+        ({"columns": {"a": [1, 2], "b": [1, 2], "c": [1]}}, "same length"),
+    ],
+)
+def test_malformed_batches_are_rejected(client, model, body, detail):
+    r = client.post(f"/api/ml_model/{model['id']}/predict/batch", json=body)
+    assert r.status_code == 422
+    assert detail in r.json()["detail"].lower()
+
+
+def test_both_or_neither_payload_is_rejected(client, model):
+    url = f"/api/ml_model/{model['id']}/predict/batch"
+    assert client.post(url, json={}).status_code == 422
+    assert client.post(url, json={"records": [], "columns": {}}).status_code == 422
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"records": [{"a": "not a number"}] * 6},
+        {"columns": {"a": ["x"] * 6}},
+    ],
+)
+def test_oversized_batch_is_refused_before_validation(client, model, monkeypatch, body):
+    monkeypatch.setattr(settings, "PREDICT_BATCH_MAX_ROWS", 5)
+
+    def validated(*args, **kwargs):
+        raise AssertionError("validated an oversized batch")
+
+    monkeypatch.setattr(MLModelService, "_validated_frame", validated)
+    r = client.post(f"/api/ml_model/{model['id']}/predict/batch", json=body)
+    assert r.status_code == 413
+    assert r.json()["detail"] == "Batch too large: 6 rows (max 5)"
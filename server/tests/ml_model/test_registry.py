@@ -0,0 +1,74 @@
+import io
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+
+import joblib
+import pytest
+from conftest import SERVER_DIR, payload
+
+from src.modules.ml_model.utils import registry as registry_module
+from src.modules.ml_model.utils.registry import Algorithm, AlgorithmRegistry, registry
+
+PLUGIN = Algorithm(
+    name="nearest_centroid",
+    estimator="sklearn.neighbors:NearestCentroid",
+    task="classifier",
+    aliases=("NearestCentroid",),
+)
+
+
+def test_lookup_by_name_or_alias_in_any_case():
+    assert registry.get("random_forest").name == "random_forest_classifier"
+    assert registry.get("RandomForestClassifier").name == "random_forest_classifier"
+    assert registry.get("no_such_algorithm") is None
+    assert set(registry.names("partial_fit")) >= {"sgd_classifier", "naive_bayes"}
+
+
+@pytest.mark.parametrize("algorithm", registry.all(), ids=lambda a: a.name)
+def test_capabilities_match_the_built_estimator(algorithm):
+    estimator = algorithm.build()
+    params = estimator.get_params()
+    assert hasattr(estimator, "partial_fit") == algorithm.partial_fit
+    assert ("warm_start" in params) == algorithm.warm_start
+    assert ("n_jobs" in params) == algorithm.n_jobs
+    if algorithm.ensemble_param:
+        assert algorithm.ensemble_param in params
+    assert algorithm.hyperparameters, "every built-in algorithm has a schema"
+
+
+def test_estimator_modules_are_imported_on_first_build():
+    code = (
+        "import sys\n"
+        "from src.modules.ml_model.utils.registry import registry\n"
+        "assert registry.get('random_forest') is not None\n"
+        "assert 'sklearn.ensemble' not in sys.modules\n"
+        "registry.get('random_forest').build()\n"
+        "assert 'sklearn.ensemble' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=SERVER_DIR, check=True, capture_output=True)
+
+
+def test_plugins_are_loaded_from_entry_points(monkeypatch):
+    found = [
+        EntryPoint("centroid", "tests_plugin:ALGORITHM", registry_module.ENTRY_POINT_GROUP),
+        EntryPoint("broken", "no_such_module:ALGORITHMS", registry_module.ENTRY_POINT_GROUP),
+    ]
+    monkeypatch.setattr("importlib.metadata.entry_points", lambda group: found)
+    monkeypatch.setitem(sys.modules, "tests_plugin", type(sys)("tests_plugin"))
+    sys.modules["tests_plugin"].ALGORITHM = [PLUGIN]
+
+    plugins = AlgorithmRegistry()
+    assert plugins.get("nearestcentroid") is PLUGIN  # the broken plugin is skipped
+    assert plugins.names() == ["nearest_centroid"]
+    assert plugins.get("nearest_centroid").describe()["capabilities"] == []
+
+
+def test_algorithms_endpoint_and_training_by_alias(client, upload_dataset, train):
+    listed = {a["name"]: a for a in client.get("/api/ml_model/algorithms").json()}
+    assert listed.keys() == set(registry.names())
+    assert listed["sgd_classifier"]["capabilities"] == ["partial_fit", "warm_start", "n_jobs"]
+
+    model = train(payload(upload_dataset(), "DecisionTreeClassifier"))
+    artifact = joblib.load(io.BytesIO(client.get(f"/api/ml_model/{model['id']}/download").content))
+    assert type(artifact).__name__ == "DecisionTreeClassifier"
@@ -0,0 +1,119 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import FEATURES, make_frame, payload
+from sklearn.linear_model import LogisticRegression
+
+from src.modules.ml_model.utils.scoring import ResultWriter, score_chunk
+
+
+def _infer(model):
+    def infer(X):
+        return model.predict(X).tolist(), [str(c) for c in model.classes_], model.predict_proba(X)
+
+    return infer
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_chunks_are_appended_to_one_file(tmp_path, fmt):
+    df = make_frame(nulls=True).reset_index(names="id")
+    model = LogisticRegression().fit(df[FEATURES].dropna(), df["label"][df["c"].notna()])
+    path = str(tmp_path / f"scores.{fmt}")
+
+    writer = ResultWriter(path, fmt)
+    scored = 0
+    for start in range(0, len(df), 150):
+        chunk = df[start : start + 150]
+        out, n = score_chunk(chunk, chunk[FEATURES], _infer(model), ["id"], impute=False)
+        writer.write(out)
+        scored += n
+    writer.close()
+
+    result = pd.read_csv(path) if fmt == "csv" else pd.read_parquet(path)
+    assert list(result.columns) == ["id", "prediction", "proba_0", "proba_1"]
+    assert result["id"].tolist() == df["id"].tolist()
+    complete = df["c"].notna().to_numpy()
+    assert scored == complete.sum()
+    assert result["prediction"][~complete].isna().all()
+    np.testing.assert_array_equal(
+        result["prediction"][complete], model.predict(df[FEATURES][complete])
+    )
+
+
+def test_a_chunk_without_scorable_rows_keeps_the_columns(tmp_path):
+    df = make_frame(n=20)
+    model = LogisticRegression().fit(df[FEATURES], df["label"])
+    gaps = df[FEATURES].assign(c=np.nan)
+    path = str(tmp_path / "scores.csv")
+
+    writer = ResultWriter(path, "csv")
+    writer.write(score_chunk(df, df[FEATURES], _infer(model), [], impute=False)[0])
+    out, n = score_chunk(df, gaps, _infer(model), [], impute=False)
+    assert n == 0
+    writer.write(out)
+    writer.close()
+
+    result = pd.read_csv(path)
+    assert list(result.columns) == ["prediction", "proba_0", "proba_1"]
+    assert result["proba_1"][20:].isna().all() and len(result) == 40
+
+
+def test_no_chunks_give_an_empty_file(tmp_path):
+    path = tmp_path / "scores.csv"
+    ResultWriter(str(path), "csv").close()
+    assert path.read_bytes() == b""
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_score_a_dataset(client, upload_dataset, train, run_job, fmt):
+    df = make_frame(nulls=True)
+    model = train(payload(upload_dataset(df), "logistic_regression"))
+    scoring = upload_dataset(df)
+
+    job = run_job(
+        {"dataset_id": scoring["id"], "format": fmt, "include_columns": ["color"]},
+        f"/api/ml_model/{model['id']}/score",
+    )
+    assert job["status"] == "completed", job["error"]
+    result = job["result"]
+    complete = df["c"].notna()
+    assert result["rows"] == len(df) and result["scored_rows"] == complete.sum()
+
+    content = client.get(f"/api/file/{result['file_id']}/download").content
+    scores = (
+        pd.read_csv(io.BytesIO(content)) if fmt == "csv" else pd.read_parquet(io.BytesIO(content))
+    )
+    assert list(scores.columns) == ["color", "prediction", "proba_0", "proba_1"]
+    assert scores["color"].tolist() == df["color"].tolist()
+
+    batch = client.post(
+        f"/api/ml_model/{model['id']}/predict/batch",
+        json={"records": df[FEATURES][complete].to_dict("records")},
+    ).json()
+    assert scores["prediction"][complete].tolist() == batch["predictions"]
+
+
+def test_scoring_requests_are_checked(client, upload_dataset, train, run_job):
+    ds = upload_dataset()
+    model = train(payload(ds, "logistic_regression"))
+    url = f"/api/ml_model/{model['id']}/score"
+    lazy = client.post(
+        f"/api/dataset/{ds['id']}/transform",
+        json={"strategy": "standard_scaler", "columns": ["a"], "lazy": True},
+    ).json()
+    no_features = upload_dataset(make_frame()[["a", "label"]])
+
+    for body, detail in (
+        ({"dataset_id": ds["id"], "include_columns": ["nope"]}, "Columns not found"),
+        ({"dataset_id": lazy["id"]}, "materialized"),
+    ):
+        r = client.post(url, json=body)
+        assert r.status_code == 400
+        assert detail in r.json()["detail"]
+
+    # Checked in the job, which reads the dataset's columns
+    job = run_job({"dataset_id": no_features["id"]}, url)
+    assert job["status"] == "failed"
+    assert "missing model feature(s): ['b', 'c']" in job["error"]
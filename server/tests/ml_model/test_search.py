@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from conftest import make_frame, payload
+
+from src.modules.ml_model.utils.search import build_search_space, leaderboard
+
+
+def test_grid_space_comes_from_the_schema():
+    space = build_search_space("decision_tree", "grid", grid_points=3)
+    assert "random_state" not in space
+    assert space["max_depth"] == [1, 10, 100, None]  # a decade around the range, plus None
+    assert space["criterion"] == ["gini", "entropy", "log_loss"]
+    assert space["max_features"] == ["sqrt", "log2", None]
+
+    pinned = build_search_space(
+        "decision_tree",
+        "grid",
+        params=["max_depth", "criterion"],
+        overrides={"max_depth": [2, "None"]},
+        fixed={"criterion": "gini"},
+    )
+    assert pinned == {"max_depth": [2, None]}
+
+
+def test_random_space_samples_within_the_window():
+    space = build_search_space("logistic_regression", "random", params=["C"])
+    samples = [space["C"].rvs(random_state=np.random.default_rng(i)) for i in range(50)]
+    assert all(0.1 <= c <= 10.0 for c in samples)
+
+
+def test_leaderboard_ranks_best_first_and_marks_failures():
+    trials = leaderboard(
+        {
+            "params": [{"C": 1}, {"C": 2}, {"C": 3}],
+            "mean_test_score": np.array([0.7, np.nan, 0.9]),
+            "mean_fit_time": np.array([0.1, 0.1, 0.1]),
+            "mean_score_time": np.array([0.01, 0.01, 0.01]),
+        }
+    )
+    assert [t["params"]["C"] for t in trials] == [3, 1, 2]
+    assert [t["rank"] for t in trials] == [1, 2, 3]
+    assert trials[2]["status"] == "failed" and trials[2]["score"] is None
+
+
+def test_grid_search_saves_the_best_configuration(client, upload_dataset, train):
+    result = train(
+        payload(
+            upload_dataset(),
+            "decision_tree",
+            strategy="grid",
+            search_space={"max_depth": [1, 3, 8]},
+            search_params=[],
+        ),
+        url="/api/ml_model/search",
+    )
+    trials = result["leaderboard"]
+    assert sorted(t["params"]["max_depth"] for t in trials) == [1, 3, 8]
+    assert all(t["status"] == "ok" for t in trials)
+    assert result["best_params"] == trials[0]["params"]
+    assert trials[0]["score"] == max(t["score"] for t in trials)
+
+    model = client.get(f"/api/ml_model/{result['id']}").json()
+    assert model["name"] == "decision_tree Model (tuned)"
+    assert model["description"] == "Best of 3 grid search trials"
+
+
+@pytest.mark.parametrize("strategy", ["random", "halving"])
+def test_sampled_searches_respect_max_trials(upload_dataset, train, strategy):
+    result = train(
+        payload(
+            upload_dataset(make_frame(n=3_000)),  # enough rows for two halving rounds
+            "decision_tree",
+            strategy=strategy,
+            max_trials=4,
+            search_params=["max_depth", "min_samples_leaf"],
+        ),
+        url="/api/ml_model/search",
+    )
+    trials = result["leaderboard"]
+    if strategy == "random":
+        assert len(trials) == 4
+    else:
+        rounds = [t["round"] for t in trials]
+        assert rounds.count(0) == 4 and rounds.count(1) == 2
+        assert trials[0]["round"] == 1 and trials[0]["n_resources"] == 3_000
+    assert set(result["best_params"]) <= {"max_depth", "min_samples_leaf"}
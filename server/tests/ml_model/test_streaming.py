@@ -0,0 +1,60 @@
+import json
+
+import numpy as np
+import pandas as pd
+from conftest import make_frame, payload
+from sklearn.linear_model import SGDClassifier, SGDRegressor
+
+from src.modules.ml_model.utils.streaming import _split_mask, stream_fit, stream_score
+
+FEATURES = ["a", "b", "c"]
+
+
+def _chunks(df: pd.DataFrame, size: int):
+    return lambda: (df.iloc[i : i + size] for i in range(0, len(df), size))
+
+
+def _validation_rows(df: pd.DataFrame, size: int) -> pd.DataFrame:
+    parts = [
+        chunk[_split_mask(i, len(chunk), 0.25, 42)] for i, chunk in enumerate(_chunks(df, size)())
+    ]
+    return pd.concat(parts).dropna()
+
+
+def test_streamed_scores_match_model_score_on_the_validation_rows():
+    df = make_frame(n=1_000, nulls=True)
+    for model, target in ((SGDClassifier(random_state=0), "label"), (SGDRegressor(), "y")):
+        classes = np.array([0, 1]) if target == "label" else None
+        trained = stream_fit(model, _chunks(df, 128), FEATURES, target, 0.25, 2, classes)
+        valid = _validation_rows(df, 128)
+        assert trained == 2 * (len(df.dropna()) - len(valid))
+
+        score, n = stream_score(model, _chunks(df, 128), FEATURES, target, 0.25)
+        assert n == len(valid)
+        assert score == model.score(valid[FEATURES], valid[target])
+
+
+def _inputs(client, model_id: str) -> list[dict]:
+    inputs = client.get(f"/api/ml_model/{model_id}").json()["inputs"]
+    return json.loads(inputs) if isinstance(inputs, str) else inputs
+
+
+def test_streamed_model_stores_a_typed_input_schema(client, upload_dataset, train):
+    model = train(payload(upload_dataset(), "sgd_classifier", streaming=True, epochs=2))
+    assert 0.5 < model["accuracy"] <= 1.0
+    assert _inputs(client, model["id"]) == [
+        {"name": "a", "dtype": "float", "categories": None},
+        {"name": "b", "dtype": "integer", "categories": None},
+        {"name": "c", "dtype": "float", "categories": None},
+    ]
+
+    url = f"/api/ml_model/{model['id']}/predict"
+    assert client.post(url, json={"inputs": {"a": 0.1, "b": 3, "c": -1}}).status_code == 200
+    r = client.post(url, json={"inputs": {"a": "x", "b": 3, "c": -1}})
+    assert r.status_code == 422
+
+
+def test_streaming_needs_an_incremental_estimator(upload_dataset, run_job):
+    job = run_job(payload(upload_dataset(make_frame()), "random_forest", streaming=True))
+    assert job["status"] == "failed"
+    assert "cannot be trained incrementally" in job["error"]
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+import time
+
+from src.modules.ml_model.utils.telemetry import (
+    current_run,
+    note,
+    phase,
+    recorded,
+    training_run,
+)
+
+
+def test_helpers_are_no_ops_outside_a_run():
+    assert current_run() is None
+    with phase("fit"):
+        note(rows=10)
+    assert current_run() is None
+
+
+def test_nested_runs_join_the_outer_one():
+    @recorded
+    def inner():
+        with phase("fit"):
+            time.sleep(0.01)
+        note(rows=5, columns=2, frame_bytes_before=None)
+        return current_run()
+
+    @recorded(kind="search")
+    def outer():
+        return current_run(), inner()
+
+    run, joined = outer()
+    assert run is joined
+    summary = run.summary(artifact_bytes=7)
+    assert summary["kind"] == "search"
+    assert summary["fit_seconds"] >= 0.01
+    assert (summary["rows"], summary["columns"]) == (5, 2)
+    assert summary["frame_bytes_before"] is None and summary["artifact_bytes"] == 7
+    assert current_run() is None
+
+
+def test_cpu_of_child_processes_is_counted():
+    burn = "import time\nend = time.process_time() + 0.3\nwhile time.process_time() < end: pass"
+    with training_run() as run:
+        subprocess.run([sys.executable, "-c", burn], check=True)
+        summary = run.summary()
+    assert summary["kind"] == "train"
+    assert summary["cpu_seconds"] >= 0.3
+    assert summary["total_seconds"] >= 0.3
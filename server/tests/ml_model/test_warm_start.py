@@ -0,0 +1,82 @@
+import io
+
+import joblib
+import numpy as np
+from conftest import payload
+
+from src.modules.ml_model.utils.preprocessing import final_estimator
+
+
+def _estimator(client, model_id: str):
+    r = client.get(f"/api/ml_model/{model_id}/download")
+    assert r.status_code == 200
+    return final_estimator(joblib.load(io.BytesIO(r.content)))
+
+
+def _retrain(run_job, model_id: str, body: dict) -> dict:
+    return run_job(body, url=f"/api/ml_model/{model_id}/retrain")
+
+
+def test_ensemble_grows_from_the_parent_trees(client, upload_dataset, train, run_job):
+    ds = upload_dataset()
+    parent = train(
+        payload(ds, "random_forest", hyperparameters={"n_estimators": 20}, reuse_cached=False)
+    )
+    job = _retrain(
+        run_job, parent["id"], payload(ds, "random_forest", warm_start=True, add_estimators=5)
+    )
+    assert job["status"] == "completed", job["error"]
+    child = job["result"]
+    assert child["warm_start"] is True and child["estimators_added"] == 5
+    assert child["parent_id"] == parent["id"] and child["version"] == "1.1"
+
+    before, after = _estimator(client, parent["id"]), _estimator(client, child["id"])
+    assert len(before.estimators_) == 20  # the parent's artifact is left as it was
+    assert len(after.estimators_) == 25
+    for old, new in zip(before.estimators_, after.estimators_[:20], strict=True):
+        np.testing.assert_array_equal(old.tree_.threshold, new.tree_.threshold)
+
+
+def test_iterative_model_continues_from_the_parent_coefficients(
+    client, upload_dataset, train, run_job
+):
+    ds = upload_dataset()
+    parent = train(payload(ds, "logistic_regression", reuse_cached=False))
+    job = _retrain(run_job, parent["id"], payload(ds, "logistic_regression", warm_start=True))
+    assert job["status"] == "completed", job["error"]
+    child = _estimator(client, job["result"]["id"])
+    # Starting from a converged solution, lbfgs stops almost at once
+    assert child.n_iter_[0] <= _estimator(client, parent["id"]).n_iter_[0]
+
+
+def test_streaming_warm_start_continues_with_partial_fit(client, upload_dataset, train, run_job):
+    ds = upload_dataset()
+    parent = train(payload(ds, "sgd_classifier", streaming=True, reuse_cached=False))
+    job = _retrain(
+        run_job, parent["id"], payload(ds, "sgd_classifier", streaming=True, warm_start=True)
+    )
+    assert job["status"] == "completed", job["error"]
+    assert job["result"]["warm_start"] is True
+    before, after = _estimator(client, parent["id"]), _estimator(client, job["result"]["id"])
+    assert after.t_ > before.t_
+
+
+def test_warm_start_must_keep_the_parent_setup(upload_dataset, train, run_job):
+    ds = upload_dataset()
+    parent = train(payload(ds, "random_forest", hyperparameters={"n_estimators": 10}))
+
+    cases = [
+        (payload(ds, "random_forest", target="y", warm_start=True), "keep the parent's target"),
+        (
+            payload(ds, "random_forest", warm_start=True, features=["a", "b"]),
+            "keep the parent's features",
+        ),
+        (
+            payload(ds, "random_forest", warm_start=True, hyperparameters={"n_estimators": 10}),
+            "must grow",
+        ),
+    ]
+    for body, error in cases:
+        job = _retrain(run_job, parent["id"], body)
+        assert job["status"] == "failed"
+        assert error in job["error"]
@@ -0,0 +1,53 @@
+from conftest import FEATURES, payload
+
+
+def _by_type(client) -> dict[str, dict]:
+    stats = client.get("/api/stats")
+    assert stats.status_code == 200, stats.text
+    return {t["type"]: t for t in stats.json()["training_by_type"]}
+
+
+def test_search_and_automl_runs_stay_out_of_per_type_averages(client, upload_dataset, train):
+    ds = upload_dataset()
+    for _ in range(2):
+        train(payload(ds, "logistic_regression", reuse_cached=False))
+    before = _by_type(client)
+    assert before.keys() == {"logistic_regression"}
+    assert before["logistic_regression"]["runs"] == 2
+
+    automl = train(
+        {
+            "dataset_id": ds["id"],
+            "target_column": "label",
+            "features": FEATURES,
+            "algorithms": ["logistic_regression", "linear_svc"],
+            "keep_top": 2,
+        },
+        url="/api/ml_model/automl",
+    )
+    search = train(
+        payload(ds, "logistic_regression", strategy="random", max_trials=3, search_params=["C"]),
+        url="/api/ml_model/search",
+    )
+    assert _by_type(client) == before
+
+    # The runs are still recorded, with their kind, and count towards the totals
+    kinds = []
+    for model_id in (automl["kept_model_ids"][0], search["id"]):
+        r = client.get(f"/api/ml_model/{model_id}/telemetry")
+        assert r.status_code == 200, r.text
+        kinds.append(r.json()["kind"])
+    assert kinds == ["automl", "search"]
+    assert client.get("/api/stats").json()["training"]["runs"] == 4
+
+
+def test_training_run_telemetry_is_per_type(client, upload_dataset, train):
+    ds = upload_dataset()
+    model = train(payload(ds, "decision_tree", reuse_cached=False))
+    telemetry = client.get(f"/api/ml_model/{model['id']}/telemetry").json()
+    assert telemetry["kind"] == "train"
+    assert telemetry["rows"] == 400 and telemetry["columns"] == 3
+
+    entry = _by_type(client)["decision_tree"]
+    assert entry["runs"] == 1
+    assert entry["avg_fit_seconds"] == round(telemetry["fit_seconds"], 3)
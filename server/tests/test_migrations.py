@@ -0,0 +1,50 @@
+import os
+import sqlite3
+import subprocess
+import sys
+
+from conftest import SERVER_DIR
+
+
+def _alembic(db_path, *args: str) -> None:
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "-c", str(SERVER_DIR / "alembic.ini"), *args],
+        cwd=SERVER_DIR,
+        env={**os.environ, "DB_PATH": str(db_path)},
+        check=True,
+        capture_output=True,
+    )
+
+
+def _columns(db_path, table: str) -> dict[str, bool]:
+    """Column name -> nullable."""
+    with sqlite3.connect(db_path) as conn:
+        return {row[1]: not row[3] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def test_migrations_upgrade_downgrade_and_upgrade_again(tmp_path):
+    db_path = tmp_path / "migrations.db"
+    _alembic(db_path, "upgrade", "head")
+    head = _columns(db_path, "models")
+    assert {"fingerprint", "cpu_cores", "cv_folds", "artifact_mmap"} <= head.keys()
+    assert _columns(db_path, "datasets")["rows"]  # null until a lazy version is opened
+    assert "jobs" in {
+        row[0] for row in sqlite3.connect(db_path).execute("SELECT name FROM sqlite_master")
+    }
+
+    _alembic(db_path, "downgrade", "base")
+    assert "fingerprint" not in _columns(db_path, "models")
+
+    _alembic(db_path, "upgrade", "head")
+    assert _columns(db_path, "models") == head
+
+
+def test_migrations_have_a_single_head():
+    out = subprocess.run(
+        [sys.executable, "-m", "alembic", "-c", str(SERVER_DIR / "alembic.ini"), "heads"],
+        cwd=SERVER_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert len(out.strip().splitlines()) == 1